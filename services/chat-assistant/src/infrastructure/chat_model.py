@@ -1,8 +1,9 @@
 """Chat model implementation using transformers."""
 
+import asyncio
 import torch
 from transformers import AutoTokenizer, AutoModelForCausalLM, pipeline
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import time
 from pathlib import Path
 import os
@@ -21,6 +22,8 @@ class DistilGPT2ChatModel(ChatModel):
         self._model = None
         self._pipeline = None
         self._is_loaded = False
+        self._load_lock = asyncio.Lock()
+        self.load_seconds: Optional[float] = None
         self._device = "cuda" if torch.cuda.is_available() else "cpu"
         self._event_bus = event_bus
         
@@ -41,10 +44,28 @@ You give responsible betting advice and always remind users to bet responsibly.
         """Return the model version."""
         return "1.0.0"
     
+    @property
+    def is_loaded(self) -> bool:
+        """Return whether the weights are loaded, without loading them."""
+        return self._is_loaded
+    
+    @property
+    def is_loading(self) -> bool:
+        """Return whether a load is in progress."""
+        return self._load_lock.locked()
+    
     async def is_ready(self) -> bool:
-        """Check if the model is ready."""
+        """Check if the model is ready, loading it on first use.
+        
+        Concurrent callers share a single load, which runs in a worker
+        thread so the event loop keeps serving while the weights load.
+        """
         if not self._is_loaded:
-            await self._load_model()
+            async with self._load_lock:
+                if not self._is_loaded:
+                    start_time = time.perf_counter()
+                    await asyncio.to_thread(self._load_model)
+                    self.load_seconds = time.perf_counter() - start_time
         return self._is_loaded
     
     async def generate_response(
@@ -109,7 +130,7 @@ You give responsible betting advice and always remind users to bet responsibly.
             # Fallback response on error
             return f"I apologise, I'm having trouble processing your request right now. Could you please rephrase your question about NRL betting?"
     
-    async def _load_model(self) -> None:
+    def _load_model(self) -> None:
         """Load the model and tokenizer."""
         try:
             # Check if we have a custom fine-tuned model
@@ -1,6 +1,8 @@
 """FastAPI interface for chat assistant service."""
 
+import asyncio
 import os
+import time
 from typing import List
 
 from fastapi import FastAPI, HTTPException, Depends, status
@@ -57,6 +59,21 @@ knowledge_base = None
 event_bus = None
 process_chat_use_case = None
 get_history_use_case = None
+model_warmup_task = None
+
+
+async def warm_up_chat_model():
+    """Load the chat model and record how long it took."""
+    start_time = time.perf_counter()
+    try:
+        ready = await chat_model.is_ready()
+    except Exception as e:
+        logger.warning(f"Chat model failed to load: {e}")
+        ready = False
+    MetricsCollector.record_model_load(
+        chat_model.model_name, time.perf_counter() - start_time, ready
+    )
+    logger.info("Chat model ready" if ready else "Chat model not ready")
 
 
 # Request/Response models
@@ -88,7 +105,7 @@ class ConversationSummary(BaseModel):
 async def startup_event():
     """Initialise dependencies on startup."""
     global chat_model, topic_classifier, conversation_repository, knowledge_base, event_bus
-    global process_chat_use_case, get_history_use_case
+    global process_chat_use_case, get_history_use_case, model_warmup_task
     
     logger.info("Starting Chat Assistant service...")
     
@@ -121,43 +138,60 @@ async def startup_event():
     )
     get_history_use_case = GetConversationHistoryUseCase(conversation_repository)
     
-    # Warm up the model
-    logger.info("Warming up chat model...")
-    if await chat_model.is_ready():
-        logger.info("Chat model ready")
-    else:
-        logger.warning("Chat model not ready")
+    # Load the model in the background; /ready reports 503 until it is loaded
+    logger.info("Warming up chat model in the background...")
+    model_warmup_task = asyncio.create_task(warm_up_chat_model())
     
     logger.info("Chat Assistant service started successfully")
 
 
+def chat_model_state() -> str:
+    """Return ``ready``, ``loading`` or ``not_ready`` without blocking on a load."""
+    if chat_model is None:
+        return "not_ready"
+    if chat_model.is_loaded:
+        return "ready"
+    return "loading" if chat_model.is_loading else "not_ready"
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
         "service": "chat-assistant",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "model_state": chat_model_state()
     }
 
 
 @app.get("/ready")
 async def readiness_check():
     """Readiness check endpoint."""
+    global model_warmup_task
+    
     try:
-        is_ready = await chat_model.is_ready()
+        model_state = chat_model_state()
         
-        if not is_ready:
+        if model_state != "ready":
+            # Retry a failed load in the background rather than in the probe
+            if model_state == "not_ready" and chat_model and (
+                model_warmup_task is None or model_warmup_task.done()
+            ):
+                model_warmup_task = asyncio.create_task(warm_up_chat_model())
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Chat model not ready"
+                detail=f"Chat model {model_state}"
             )
         
         return {
             "status": "ready",
             "model_loaded": True,
-            "model_name": chat_model.model_name
+            "model_name": chat_model.model_name,
+            "load_seconds": chat_model.load_seconds
         }
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
         raise HTTPException(
@@ -326,7 +360,7 @@ async def get_conversation(
 @app.get("/metrics")
 async def get_service_metrics():
     """Get service metrics (for monitoring)."""
-    model_ready = await chat_model.is_ready() if chat_model else False
+    model_ready = chat_model.is_loaded if chat_model else False
     
     return {
         "service": "chat-assistant",
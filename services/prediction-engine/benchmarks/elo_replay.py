@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the incremental Elo rating engine.
+Replays synthetic seasons and times point-in-time snapshot queries.
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.domain.models import Match
+from src.domain.teams import NRL_CLUBS
+from src.infrastructure.elo_ratings import EloRatingEngine
+
+
+SEASONS = 30
+ROUNDS_PER_SEASON = 27
+SNAPSHOT_QUERIES = 10_000
+
+
+def synthetic_seasons(seasons: int, seed: int = 7) -> list:
+    """Generate a full fixture list with random scores for each season."""
+    rng = random.Random(seed)
+    matches = []
+    for season in range(seasons):
+        start = datetime(1995 + season, 3, 1)
+        for round_number in range(ROUNDS_PER_SEASON):
+            clubs = list(NRL_CLUBS)
+            rng.shuffle(clubs)
+            kickoff = start + timedelta(weeks=round_number)
+            for i in range(0, len(clubs) - 1, 2):
+                matches.append(Match(
+                    match_id=f"{season}-{round_number}-{i}",
+                    team_home=clubs[i],
+                    team_away=clubs[i + 1],
+                    match_date=kickoff + timedelta(hours=i),
+                    home_score=rng.randint(0, 40),
+                    away_score=rng.randint(0, 40),
+                    season=1995 + season,
+                    round_number=round_number + 1
+                ))
+    return matches
+
+
+def main():
+    matches = synthetic_seasons(SEASONS)
+    print(f"Replaying {len(matches)} matches over {SEASONS} seasons")
+
+    engine = EloRatingEngine()
+    start = time.perf_counter()
+    engine.replay(matches)
+    replay_seconds = time.perf_counter() - start
+    print(f"Replay: {replay_seconds * 1000:.1f} ms "
+          f"({replay_seconds / len(matches) * 1e6:.2f} us per result)")
+
+    first, last = matches[0].match_date, matches[-1].match_date
+    span = (last - first).total_seconds()
+    rng = random.Random(11)
+    queries = [first + timedelta(seconds=rng.random() * span) for _ in range(SNAPSHOT_QUERIES)]
+
+    start = time.perf_counter()
+    for as_of in queries:
+        engine.ratings_as_of(as_of)
+    snapshot_seconds = time.perf_counter() - start
+    print(f"Snapshots: {snapshot_seconds / SNAPSHOT_QUERIES * 1e6:.1f} us per as-of query")
+
+    # Cross-check one snapshot against a fresh replay up to the same date.
+    as_of = queries[0]
+    expected = EloRatingEngine()
+    expected.replay(m for m in matches if m.match_date < as_of)
+    drift = max(
+        abs(engine.rating(team, as_of) - expected.rating(team))
+        for team in NRL_CLUBS
+    )
+    print(f"Max snapshot drift vs full replay: {drift:.2e}")
+
+
+if __name__ == "__main__":
+    main()
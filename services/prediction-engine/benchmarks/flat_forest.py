@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the flattened tree ensemble evaluator.
+Compares FlatForest against the source model's native predict_proba for
+1, 8 and 1000 rows, and times loading the memory-mapped export.
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+from src.modules.trees.flat_forest import FlatForest
+
+try:
+    from lightgbm import LGBMClassifier
+except ImportError:
+    LGBMClassifier = None
+
+
+FEATURES = 12
+TRAINING_ROWS = 20_000
+TREES = 200
+BATCH_SIZES = (1, 8, 1000)
+REPEATS = 200
+
+
+def synthetic_matches(rows: int, seed: int = 7):
+    """Generate match features with home/draw/away outcomes and some missing values."""
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(rows, FEATURES))
+    signal = x[:, 0] - x[:, 1] + 0.5 * x[:, 2] * x[:, 3] + rng.normal(scale=0.8, size=rows)
+    y = np.digitize(signal, [-0.3, 0.3])
+    x[rng.random(x.shape) < 0.02] = np.nan
+    return x, y
+
+
+def native_model():
+    """Fit LightGBM if it is installed, otherwise sklearn's equivalent histogram booster."""
+    if LGBMClassifier is not None:
+        return LGBMClassifier(n_estimators=TREES, num_leaves=31, verbose=-1)
+    return HistGradientBoostingClassifier(max_iter=TREES, max_leaf_nodes=31, early_stopping=False)
+
+
+def p50_us(fn, repeats: int = REPEATS) -> float:
+    """Return the median wall time of ``fn`` in microseconds."""
+    fn()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6
+
+
+def main():
+    x, y = synthetic_matches(TRAINING_ROWS)
+    model = native_model().fit(x, y)
+    forest = FlatForest.from_estimator(model)
+    print(f"{type(model).__name__}: {forest.n_trees} trees, {len(forest.feature)} nodes, "
+          f"depth {forest.max_depth}")
+
+    held_out, _ = synthetic_matches(max(BATCH_SIZES), seed=11)
+    drift = np.abs(forest.predict_proba(held_out) - model.predict_proba(held_out)).max()
+    print(f"Max probability difference vs native: {drift:.2e}")
+
+    print(f"{'rows':>6} {'native us':>12} {'flat us':>12} {'speedup':>8}")
+    for rows in BATCH_SIZES:
+        batch = held_out[:rows]
+        native = p50_us(lambda: model.predict_proba(batch))
+        flat = p50_us(lambda: forest.predict_proba(batch))
+        print(f"{rows:>6} {native:>12.1f} {flat:>12.1f} {native / flat:>7.1f}x")
+
+    with tempfile.TemporaryDirectory() as directory:
+        forest.save(directory)
+        size = sum(path.stat().st_size for path in Path(directory).iterdir())
+        start = time.perf_counter()
+        mapped = FlatForest.load(directory)
+        load_ms = (time.perf_counter() - start) * 1000
+        assert np.array_equal(mapped.predict_proba(held_out), forest.predict_proba(held_out))
+        print(f"On disk: {size / 1024:.0f} KiB, memory-mapped load {load_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
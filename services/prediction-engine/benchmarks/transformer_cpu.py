@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the CPU transformer runner.
+Trains a small match-sequence transformer on synthetic seasons, then
+compares fp32 and int8 accuracy, log loss and latency on a held-out
+season against the prediction-engine p95 latency target.
+"""
+
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import torch
+from torch import nn
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from shared.monitoring.telemetry import SLA_TARGETS
+
+from src.modules.transformer.cpu_runner import CpuTransformerRunner
+
+
+FEATURES = 16
+SEASONS = 12
+MATCHES_PER_SEASON = 216
+TRAINING_STEPS = 300
+THREADS = 1
+REQUESTS = 300
+
+
+class MatchSequenceTransformer(nn.Module):
+    """Encodes a fixture's recent form sequence and classifies home/draw/away."""
+
+    def __init__(self, n_features: int, d_model: int = 64, heads: int = 4, layers: int = 2):
+        super().__init__()
+        self.embed = nn.Linear(n_features, d_model)
+        layer = nn.TransformerEncoderLayer(
+            d_model, heads, dim_feedforward=4 * d_model, dropout=0.0, batch_first=True
+        )
+        self.encoder = nn.TransformerEncoder(layer, layers)
+        self.head = nn.Linear(d_model, 3)
+
+    def forward(self, x: torch.Tensor, src_key_padding_mask: Optional[torch.Tensor] = None) -> torch.Tensor:
+        encoded = self.encoder(self.embed(x), src_key_padding_mask=src_key_padding_mask)
+        return self.head(encoded[:, -1])
+
+
+def synthetic_season(season: int):
+    """Generate form sequences of varying length with outcomes driven by recent steps."""
+    rng = np.random.default_rng(season)
+    sequences, outcomes = [], []
+    weights = np.random.default_rng(0).normal(size=FEATURES)
+    for _ in range(MATCHES_PER_SEASON):
+        length = rng.integers(4, 48)
+        sequence = rng.normal(size=(length, FEATURES)).astype(np.float32)
+        recent = sequence[-4:].mean(axis=0) @ weights + rng.normal(scale=0.5)
+        sequences.append(sequence)
+        outcomes.append(int(np.digitize(recent, [-0.4, 0.4])))
+    return sequences, np.array(outcomes)
+
+
+def train(model: nn.Module, sequences, outcomes) -> None:
+    """Fit on left-padded, masked mini-batches, as the runner feeds the model.
+
+    Batches are padded to the largest length bucket; with padded steps
+    masked out the amount of padding does not change the output.
+    """
+    runner = CpuTransformerRunner(model, quantize=False, trace=False)
+    optimiser = torch.optim.Adam(model.parameters(), lr=1e-3)
+    loss_fn = nn.CrossEntropyLoss()
+    rng = np.random.default_rng(1)
+    model.train()
+    for _ in range(TRAINING_STEPS):
+        batch = rng.choice(len(sequences), 32, replace=False)
+        inputs, mask = runner.pad([sequences[i] for i in batch], 32, runner.length_buckets[-1])
+        loss = loss_fn(model(inputs, mask), torch.from_numpy(outcomes[batch]))
+        optimiser.zero_grad()
+        loss.backward()
+        optimiser.step()
+    model.eval()
+
+
+def evaluate(runner: CpuTransformerRunner, sequences, outcomes):
+    """Return accuracy, log loss and single-request p50/p95 latency in ms."""
+    probabilities = runner.predict_proba(sequences)
+    accuracy = float((probabilities.argmax(axis=1) == outcomes).mean())
+    log_loss = float(-np.log(np.clip(probabilities[np.arange(len(outcomes)), outcomes], 1e-12, 1)).mean())
+
+    timings = []
+    for i in range(REQUESTS):
+        start = time.perf_counter()
+        runner.predict_proba([sequences[i % len(sequences)]])
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return accuracy, log_loss, statistics.median(timings), timings[int(len(timings) * 0.95)], probabilities
+
+
+def main():
+    torch.manual_seed(0)
+    training = [synthetic_season(season) for season in range(SEASONS - 1)]
+    sequences = [s for season, _ in training for s in season]
+    outcomes = np.concatenate([o for _, o in training])
+    held_out_sequences, held_out_outcomes = synthetic_season(SEASONS)
+
+    model = MatchSequenceTransformer(FEATURES)
+    start = time.perf_counter()
+    train(model, sequences, outcomes)
+    print(f"Trained on {len(sequences)} matches in {time.perf_counter() - start:.1f} s; "
+          f"held-out season has {len(held_out_sequences)} matches")
+
+    target_ms = SLA_TARGETS["prediction-engine"]["latency_p95"] * 1000
+    print(f"{'mode':>6} {'accuracy':>9} {'log loss':>9} {'p50 ms':>8} {'p95 ms':>8} {'SLA':>5}")
+    results = {}
+    for mode, quantize in (("fp32", False), ("int8", True)):
+        runner = CpuTransformerRunner(model, quantize=quantize, threads=THREADS)
+        runner.warm_up(FEATURES)
+        accuracy, log_loss, p50, p95, probabilities = evaluate(runner, held_out_sequences, held_out_outcomes)
+        results[mode] = probabilities
+        print(f"{mode:>6} {accuracy:>9.3f} {log_loss:>9.4f} {p50:>8.2f} {p95:>8.2f} "
+              f"{'ok' if p95 <= target_ms else 'miss':>5}")
+
+    agreement = (results["fp32"].argmax(axis=1) == results["int8"].argmax(axis=1)).mean()
+    drift = np.abs(results["fp32"] - results["int8"]).max()
+    print(f"int8 vs fp32: {agreement:.1%} same pick, max probability difference {drift:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,415 @@
+"""Streaming replay of historical seasons through prediction models."""
+
+import asyncio
+import copy
+import inspect
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from itertools import groupby
+from typing import (
+    AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple,
+    Union
+)
+
+import numpy as np
+
+from shared.data_contracts.prediction import HistoricalPrediction, ModelType, PredictionType
+
+from ..domain.models import Match, PredictionFeatureBatch, PredictionModel
+from ..domain.prediction_models import Winner
+from ..domain.teams import NRL_CLUBS
+from ..infrastructure.elo_ratings import EloRatingEngine
+from ..infrastructure.feature_engineering import StandardFeatureEngineer
+from ..infrastructure.match_history import MatchHistoryStore, to_ticks
+from ..infrastructure.repositories import PointInTimeDataRepository
+from ..infrastructure.team_form import TeamFormStore
+
+logger = logging.getLogger(__name__)
+
+
+# Column order of every probability and odds matrix, as in the performance tracker.
+OUTCOMES = (Winner.HOME, Winner.AWAY, Winner.DRAW)
+
+# Scores a whole round at once, returning an (n_matches, 3) matrix in OUTCOMES order.
+BatchModel = Callable[[PredictionFeatureBatch], Union[np.ndarray, Awaitable[np.ndarray]]]
+BacktestModel = Union[PredictionModel, BatchModel]
+
+# Decimal odds per match id, keyed "home", "away" and "draw".
+Odds = Mapping[str, Mapping[str, float]]
+
+# Ratings and form as of a season's first kickoff.
+WarmState = Tuple[EloRatingEngine, TeamFormStore]
+
+_MIN_PROBABILITY = 1e-15
+
+
+def match_outcome(match: Match) -> int:
+    """Return the match result's index in ``OUTCOMES``, or -1 without a score."""
+    if match.home_score is None or match.away_score is None:
+        return -1
+    if match.home_score > match.away_score:
+        return 0
+    if match.away_score > match.home_score:
+        return 1
+    return 2
+
+
+def match_season(match: Match) -> int:
+    """Return the match's season, falling back to the kickoff year."""
+    return match.season if match.season is not None else match.match_date.year
+
+
+def fixture_rounds(matches: Iterable[Match]) -> Iterator[List[Match]]:
+    """Yield fixtures in kickoff order, grouped into rounds.
+
+    Consecutive matches sharing a season and round number form a round;
+    matches without a round number are grouped by kickoff day.
+    """
+    def round_key(match: Match):
+        if match.round_number is None:
+            return match.match_date.date()
+        return match_season(match), match.round_number
+
+    ordered = sorted(matches, key=lambda m: to_ticks(m.match_date))
+    for _, fixtures in groupby(ordered, key=round_key):
+        yield list(fixtures)
+
+
+@dataclass
+class BacktestMetrics:
+    """Running totals for one model; ``merge`` combines seasons.
+
+    Log loss and the multi-class Brier score are averaged over scored
+    matches. ROI assumes a one-unit stake on the model's pick wherever
+    odds were supplied for it.
+    """
+
+    predictions: int = 0
+    correct: int = 0
+    log_loss_sum: float = 0.0
+    brier_sum: float = 0.0
+    bets: int = 0
+    returned: float = 0.0
+
+    def update(
+        self,
+        probabilities: np.ndarray,
+        outcomes: np.ndarray,
+        odds: Optional[np.ndarray] = None
+    ) -> None:
+        """Add scored predictions: probabilities ``(n, 3)`` and outcome indexes ``(n,)``."""
+        rows = np.arange(len(outcomes))
+        picks = probabilities.argmax(axis=1)
+        won = picks == outcomes
+        target = np.zeros_like(probabilities)
+        target[rows, outcomes] = 1.0
+
+        self.predictions += len(outcomes)
+        self.correct += int(np.count_nonzero(won))
+        self.log_loss_sum -= float(
+            np.log(np.clip(probabilities[rows, outcomes], _MIN_PROBABILITY, 1.0)).sum()
+        )
+        self.brier_sum += float(((probabilities - target) ** 2).sum())
+        if odds is not None:
+            price = odds[rows, picks]
+            priced = np.isfinite(price)
+            self.bets += int(np.count_nonzero(priced))
+            self.returned += float(price[priced & won].sum())
+
+    def merge(self, other: "BacktestMetrics") -> "BacktestMetrics":
+        """Return the totals of both runs."""
+        return BacktestMetrics(**{
+            f.name: getattr(self, f.name) + getattr(other, f.name) for f in fields(self)
+        })
+
+    @property
+    def accuracy(self) -> Optional[float]:
+        return self.correct / self.predictions if self.predictions else None
+
+    @property
+    def log_loss(self) -> Optional[float]:
+        return self.log_loss_sum / self.predictions if self.predictions else None
+
+    @property
+    def brier_score(self) -> Optional[float]:
+        return self.brier_sum / self.predictions if self.predictions else None
+
+    @property
+    def roi(self) -> Optional[float]:
+        return (self.returned - self.bets) / self.bets if self.bets else None
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Return the headline metrics."""
+        return {
+            "predictions": self.predictions,
+            "accuracy": self.accuracy,
+            "log_loss": self.log_loss,
+            "brier_score": self.brier_score,
+            "bets": self.bets,
+            "roi": self.roi
+        }
+
+
+@dataclass
+class BacktestRound:
+    """One round's fixtures, results and every model's predictions."""
+
+    matches: List[Match]
+    outcomes: np.ndarray
+    probabilities: Dict[ModelType, np.ndarray]
+    odds: Optional[np.ndarray] = None
+
+    @property
+    def scored(self) -> np.ndarray:
+        """Return the mask of matches with a result."""
+        return self.outcomes >= 0
+
+    def historical_predictions(self) -> Iterator[HistoricalPrediction]:
+        """Yield each model's prediction for each match as a ``HistoricalPrediction``."""
+        for model_type, probabilities in self.probabilities.items():
+            for match, row, outcome in zip(self.matches, probabilities, self.outcomes):
+                pick = int(row.argmax())
+                yield HistoricalPrediction(
+                    prediction_id=f"backtest-{model_type.value}-{match.match_id}",
+                    match_id=match.match_id,
+                    team_home=match.team_home,
+                    team_away=match.team_away,
+                    match_date=match.match_date,
+                    prediction_type=PredictionType.MATCH_WINNER,
+                    model_used=model_type,
+                    predicted_value=OUTCOMES[pick].value,
+                    confidence=float(row[pick]),
+                    actual_value=OUTCOMES[outcome].value if outcome >= 0 else None,
+                    accuracy=float(pick == outcome) if outcome >= 0 else None,
+                    created_at=match.match_date
+                )
+
+
+class SeasonBacktester:
+    """Replays fixtures in date order through feature engineering and models.
+
+    Fixtures stream through a generator pipeline one round at a time:
+    features for the whole round are extracted in one
+    ``extract_features_batch`` call, every model scores the round as a
+    batch, the round is yielded, and only then are its results fed to the
+    Elo engine and form store. Head-to-head and scoring windows read a
+    history store cut off at the round's first kickoff, so no feature can
+    see the result it is predicting or anything later.
+
+    Models are either ``PredictionModel`` instances, called once per
+    fixture, or callables that take the round's ``PredictionFeatureBatch``
+    and return a probability matrix in ``OUTCOMES`` order, which lets
+    matrix models score a round in one call.
+    """
+
+    def __init__(
+        self,
+        models: Mapping[ModelType, BacktestModel],
+        odds: Optional[Odds] = None,
+        teams: Iterable[str] = NRL_CLUBS,
+        form_window: int = 5
+    ):
+        """Backtest ``models``, pricing picks with ``odds`` where supplied."""
+        self.models = dict(models)
+        self.odds = odds or {}
+        self.teams = list(teams)
+        self.form_window = form_window
+
+    def warm_state(self, history: Iterable[Match] = ()) -> WarmState:
+        """Return a rating engine and form store that have seen ``history``."""
+        rating_engine = EloRatingEngine(self.teams)
+        form_store = TeamFormStore(self.teams, self.form_window)
+        rating_engine.replay(history)
+        form_store.replay(history)
+        return rating_engine, form_store
+
+    async def stream(
+        self,
+        matches: Iterable[Match],
+        history: Iterable[Match] = (),
+        warm_state: Optional[WarmState] = None
+    ) -> AsyncIterator[BacktestRound]:
+        """Yield each round of ``matches`` with its predictions.
+
+        ``history`` holds earlier results the ratings and form warm up on
+        before the first round; it is never predicted. ``warm_state``, if
+        given, must already have seen ``history`` and is updated in place
+        instead of replaying it.
+        """
+        history = list(history)
+        matches = list(matches)
+        rating_engine, form_store = warm_state or self.warm_state(history)
+
+        store = MatchHistoryStore(history + matches)
+        repository = PointInTimeDataRepository(store, rating_engine, form_store)
+        engineer = StandardFeatureEngineer(repository, form_store=form_store)
+
+        for fixtures in fixture_rounds(matches):
+            repository.as_of = fixtures[0].match_date
+            batch = await engineer.extract_features_batch(fixtures, store, as_of=repository.as_of)
+            predictions = await asyncio.gather(
+                *(self._predict(model, batch) for model in self.models.values())
+            )
+            yield BacktestRound(
+                matches=fixtures,
+                outcomes=np.array([match_outcome(m) for m in fixtures], dtype=np.int64),
+                probabilities=dict(zip(self.models, predictions)),
+                odds=self._odds(fixtures)
+            )
+
+            for match in fixtures:
+                rating_engine.record_match(match)
+                form_store.record_match(match)
+
+    async def _predict(self, model: BacktestModel, batch: PredictionFeatureBatch) -> np.ndarray:
+        if isinstance(model, PredictionModel):
+            outputs = await asyncio.gather(
+                *(model.predict(features, PredictionType.MATCH_WINNER) for features in batch.features)
+            )
+            return np.array(
+                [[output.probabilities.get(winner.value, 0.0) for winner in OUTCOMES] for output in outputs],
+                dtype=np.float64
+            ).reshape(len(outputs), len(OUTCOMES))
+
+        probabilities = model(batch)
+        if inspect.isawaitable(probabilities):
+            probabilities = await probabilities
+        return np.asarray(probabilities, dtype=np.float64)
+
+    def _odds(self, fixtures: List[Match]) -> Optional[np.ndarray]:
+        """Return the round's decimal odds in ``OUTCOMES`` order, NaN where missing."""
+        if not self.odds:
+            return None
+        nan = float("nan")
+        return np.array(
+            [
+                [self.odds.get(m.match_id, {}).get(winner.value, nan) for winner in OUTCOMES]
+                for m in fixtures
+            ],
+            dtype=np.float64
+        )
+
+    async def run(
+        self,
+        matches: Iterable[Match],
+        history: Iterable[Match] = (),
+        warm_state: Optional[WarmState] = None
+    ) -> Dict[ModelType, BacktestMetrics]:
+        """Stream ``matches`` and return each model's metrics over every scored match."""
+        metrics = {model_type: BacktestMetrics() for model_type in self.models}
+        async for backtest_round in self.stream(matches, history, warm_state):
+            scored = backtest_round.scored
+            outcomes = backtest_round.outcomes[scored]
+            odds = backtest_round.odds[scored] if backtest_round.odds is not None else None
+            for model_type, probabilities in backtest_round.probabilities.items():
+                metrics[model_type].update(probabilities[scored], outcomes, odds)
+        return metrics
+
+
+# Set in each backtest worker process by _init_worker.
+_worker_matches: List[Match] = []
+_worker_odds: Odds = {}
+
+
+def _init_worker(matches: List[Match], odds: Odds) -> None:
+    global _worker_matches, _worker_odds
+    _worker_matches = matches
+    _worker_odds = odds
+
+
+def season_warm_states(matches: Iterable[Match]) -> Iterator[Tuple[int, WarmState]]:
+    """Yield each season with the ratings and form at its first kickoff.
+
+    One pass over the results in season order: before a season is
+    recorded, the running engine and store are copied, so each snapshot
+    holds only earlier seasons and the whole history is replayed once.
+    """
+    by_season = sorted(matches, key=match_season)
+    rating_engine, form_store = SeasonBacktester({}).warm_state()
+    for season, season_matches in groupby(by_season, key=match_season):
+        yield season, (copy.deepcopy(rating_engine), copy.deepcopy(form_store))
+        season_matches = list(season_matches)
+        rating_engine.replay(season_matches)
+        form_store.replay(season_matches)
+
+
+def _backtest_season(
+    season: int,
+    warm_state: WarmState,
+    model_factory: Callable[[], Mapping[ModelType, BacktestModel]]
+) -> Dict[ModelType, BacktestMetrics]:
+    """Backtest one season from the ratings and form at its start."""
+    start_time = time.perf_counter()
+    matches = [m for m in _worker_matches if match_season(m) == season]
+    history = [m for m in _worker_matches if match_season(m) < season]
+    backtester = SeasonBacktester(model_factory(), _worker_odds)
+    metrics = asyncio.run(backtester.run(matches, history, warm_state))
+    logger.info(
+        f"Backtested season {season}",
+        extra={"matches": len(matches), "seconds": time.perf_counter() - start_time}
+    )
+    return metrics
+
+
+async def backtest_seasons(
+    matches: Iterable[Match],
+    model_factory: Callable[[], Mapping[ModelType, BacktestModel]],
+    odds: Optional[Odds] = None,
+    processes: Optional[int] = None,
+    start_method: str = "spawn"
+) -> Dict[int, Dict[ModelType, BacktestMetrics]]:
+    """Backtest every season in parallel and return each season's metrics.
+
+    Ratings and form are replayed once, in season order, and snapshotted
+    at each season's start (``season_warm_states``). Seasons are then
+    independent tasks on a process pool: each worker receives the full
+    history once for head-to-head and scoring windows, and a season starts
+    from its snapshot rather than replaying earlier seasons, so results
+    match a single sequential replay. ``model_factory`` builds the models
+    inside the worker and must be picklable, e.g. a module-level function.
+    With one process the seasons run in this process instead.
+    """
+    matches = list(matches)
+    odds = dict(odds or {})
+    warm_states = dict(await asyncio.to_thread(lambda: list(season_warm_states(matches))))
+    seasons = list(warm_states)
+    processes = min(processes or os.cpu_count() or 1, len(seasons))
+
+    if processes <= 1:
+        _init_worker(matches, odds)
+        return {
+            season: await asyncio.to_thread(
+                _backtest_season, season, warm_states.pop(season), model_factory
+            )
+            for season in seasons
+        }
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_init_worker,
+        initargs=(matches, odds)
+    ) as pool:
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, _backtest_season, season, warm_states[season], model_factory)
+                for season in seasons
+            )
+        )
+    return dict(zip(seasons, results))
+
+
+def total_metrics(
+    season_metrics: Mapping[int, Mapping[ModelType, BacktestMetrics]]
+) -> Dict[ModelType, BacktestMetrics]:
+    """Combine per-season metrics into one total per model."""
+    totals: Dict[ModelType, BacktestMetrics] = {}
+    for metrics in season_metrics.values():
+        for model_type, model_metrics in metrics.items():
+            totals[model_type] = totals.get(model_type, BacktestMetrics()).merge(model_metrics)
+    return totals
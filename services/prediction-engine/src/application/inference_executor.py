@@ -0,0 +1,342 @@
+"""Runs model inference off the event loop in thread or process pools."""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from shared.monitoring.telemetry import MetricsCollector
+
+from ..domain.prediction_models import (
+    MatchDetails, ModelType, PredictionModel, PredictionResult, PredictionType
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Experts whose inference is heavy enough to run off the event loop.
+CPU_BOUND_MODELS = (
+    ModelType.LIGHTGBM,
+    ModelType.TRANSFORMER,
+    ModelType.STACKER,
+    ModelType.REINFORCEMENT_LEARNING,
+)
+
+
+class ExecutionMode(str, Enum):
+    """Where model inference runs."""
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class InferenceQueueFullError(RuntimeError):
+    """Raised when a model's inference queue is at capacity."""
+
+
+# Models built once per worker process by _init_worker.
+_worker_models: Dict[ModelType, PredictionModel] = {}
+
+
+def _init_worker(factories: Dict[ModelType, Callable[[], PredictionModel]]) -> None:
+    """Build and warm a worker process's models."""
+    for model_type, factory in factories.items():
+        model = factory()
+        asyncio.run(model.is_ready())
+        _worker_models[model_type] = model
+
+
+def _warm_worker(delay: float) -> int:
+    """Occupy a worker briefly so the pool starts every process up front."""
+    time.sleep(delay)
+    return os.getpid()
+
+
+def _infer(
+    model: PredictionModel,
+    matches: List[MatchDetails],
+    prediction_type: PredictionType,
+    batch: bool
+) -> Tuple[Any, float]:
+    """Run a model's coroutine on a private event loop and time it."""
+    start_time = time.perf_counter()
+    if batch:
+        output = asyncio.run(model.predict_batch(matches, prediction_type))
+    else:
+        output = asyncio.run(model.predict(matches[0], prediction_type))
+    return output, time.perf_counter() - start_time
+
+
+def _infer_in_worker(
+    model_type: ModelType,
+    matches: List[MatchDetails],
+    prediction_type: PredictionType,
+    batch: bool
+) -> Tuple[Any, float]:
+    return _infer(_worker_models[model_type], matches, prediction_type, batch)
+
+
+class _Lane:
+    """One model's pool of workers and its counters.
+
+    Utilisation covers the last ``window_seconds``: each finished call's
+    busy time is counted when it finishes and dropped once it is older
+    than the window.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        executor: Executor,
+        workers: int,
+        in_process: bool,
+        window_seconds: float = 60.0
+    ):
+        self.name = name
+        self.executor = executor
+        self.workers = workers
+        self.in_process = in_process
+        self.window_seconds = window_seconds
+        self.started_at = time.perf_counter()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+        self._recent: "deque[Tuple[float, float]]" = deque()
+        self._recent_busy = 0.0
+
+    def record(self, busy_seconds: float) -> None:
+        """Count one finished call's time on a worker."""
+        self.completed += 1
+        self.busy_seconds += busy_seconds
+        self._recent.append((time.perf_counter(), busy_seconds))
+        self._recent_busy += busy_seconds
+
+    @property
+    def utilisation(self) -> float:
+        now = time.perf_counter()
+        while self._recent and self._recent[0][0] < now - self.window_seconds:
+            self._recent_busy -= self._recent.popleft()[1]
+        elapsed = min(now - self.started_at, self.window_seconds)
+        if elapsed <= 0 or not self._recent:
+            return 0.0
+        return min(self._recent_busy / (elapsed * self.workers), 1.0)
+
+
+class InferenceExecutor:
+    """Dispatches ``predict``/``predict_batch`` calls to per-model worker pools.
+
+    Each offloaded model gets its own lane of ``workers``: threads sharing
+    the service's model instance, or pre-forked processes that each build
+    the model once from ``model_factories`` and keep it for their lifetime.
+    Requests are routed to the lane of the model they target, so a slow
+    transformer queue never delays LightGBM. A lane holds at most
+    ``workers + max_queue_depth`` calls, counted until the worker finishes
+    even if the caller stopped waiting; beyond that calls fail fast with
+    ``InferenceQueueFullError``. A process lane whose pool breaks (a
+    worker died) is replaced, so only the calls already on it fail.
+    Models not offloaded, and every model in ``INLINE`` mode, run on the
+    event loop as before.
+    """
+
+    def __init__(
+        self,
+        mode: ExecutionMode = ExecutionMode.THREAD,
+        offload_models: Iterable[ModelType] = CPU_BOUND_MODELS,
+        workers: int = 2,
+        max_queue_depth: int = 32,
+        model_factories: Optional[Dict[ModelType, Callable[[], PredictionModel]]] = None,
+        start_method: str = "spawn"
+    ):
+        """Configure the executor; process lanes start in ``start``."""
+        self.mode = ExecutionMode(mode)
+        self.offload_models = set(offload_models)
+        self.workers = workers
+        self.max_queue_depth = max_queue_depth
+        self.model_factories = dict(model_factories or {})
+        self.start_method = start_method
+        self._lanes: Dict[ModelType, _Lane] = {}
+
+    async def start(self) -> None:
+        """Pre-fork process lanes so model loading happens before traffic."""
+        if self.mode != ExecutionMode.PROCESS:
+            return
+        for model_type in self.offload_models:
+            lane = self._lane(model_type)
+            if lane is not None and lane.in_process:
+                await self._warm_lane(lane)
+
+    @staticmethod
+    async def _warm_lane(lane: _Lane) -> None:
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(*(
+            loop.run_in_executor(lane.executor, _warm_worker, 0.05)
+            for _ in range(lane.workers)
+        ))
+        logger.info(f"Started {len(set(pids))} inference workers for {lane.name}")
+
+    async def reload(self, model_type: ModelType) -> None:
+        """Replace a process lane with workers built from the current artifact.
+
+        The new workers are started before the lane is switched over, and
+        calls already queued on the old lane finish there before its
+        workers exit. Thread lanes run whatever model instance they are
+        given, so they need no reload.
+        """
+        lane = self._lanes.get(model_type)
+        if lane is None or not lane.in_process:
+            return
+        replacement = self._create_lane(model_type)
+        await self._warm_lane(replacement)
+        self._lanes[model_type] = replacement
+        lane.executor.shutdown(wait=False)
+
+    async def stop(self) -> None:
+        """Shut down every lane without waiting for queued calls."""
+        for lane in self._lanes.values():
+            lane.executor.shutdown(wait=False, cancel_futures=True)
+        self._lanes.clear()
+
+    def _lane(self, model_type: ModelType) -> Optional[_Lane]:
+        if self.mode == ExecutionMode.INLINE or model_type not in self.offload_models:
+            return None
+        lane = self._lanes.get(model_type)
+        if lane is None:
+            lane = self._lanes[model_type] = self._create_lane(model_type)
+        return lane
+
+    def _create_lane(self, model_type: ModelType) -> _Lane:
+        factory = self.model_factories.get(model_type)
+        if self.mode == ExecutionMode.PROCESS and factory is not None:
+            executor: Executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_worker,
+                initargs=({model_type: factory},)
+            )
+            return _Lane(model_type.value, executor, self.workers, in_process=True)
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix=f"inference-{model_type.value}"
+        )
+        return _Lane(model_type.value, executor, self.workers, in_process=False)
+
+    def has_idle_worker(self, model_type: ModelType) -> bool:
+        """Return whether a call for ``model_type`` would start immediately.
+
+        Cancelling a caller does not stop its worker, so a lane can stay
+        busy with abandoned calls; deadline-bound callers use this to skip
+        lanes where a new call would only queue.
+        """
+        lane = self._lane(model_type)
+        return lane is None or lane.in_flight < lane.workers
+
+    async def predict(
+        self,
+        model: PredictionModel,
+        match_details: MatchDetails,
+        prediction_type: PredictionType = PredictionType.MATCH_WINNER
+    ) -> PredictionResult:
+        """Run ``model.predict`` on the model's lane."""
+        return await self._run(model, [match_details], prediction_type, batch=False)
+
+    async def predict_batch(
+        self,
+        model: PredictionModel,
+        matches: List[MatchDetails],
+        prediction_type: PredictionType = PredictionType.MATCH_WINNER
+    ) -> List[PredictionResult]:
+        """Run ``model.predict_batch`` on the model's lane."""
+        return await self._run(model, matches, prediction_type, batch=True)
+
+    async def _run(
+        self,
+        model: PredictionModel,
+        matches: List[MatchDetails],
+        prediction_type: PredictionType,
+        batch: bool
+    ) -> Any:
+        lane = self._lane(model.model_type)
+        if lane is None:
+            if batch:
+                return await model.predict_batch(matches, prediction_type)
+            return await model.predict(matches[0], prediction_type)
+
+        if lane.in_flight >= lane.workers + self.max_queue_depth:
+            lane.rejected += 1
+            MetricsCollector.record_inference_rejection(lane.name)
+            raise InferenceQueueFullError(
+                f"Inference queue for {lane.name} is full ({lane.in_flight} calls)"
+            )
+
+        try:
+            if lane.in_process:
+                future = lane.executor.submit(
+                    _infer_in_worker, model.model_type, matches, prediction_type, batch
+                )
+            else:
+                future = lane.executor.submit(_infer, model, matches, prediction_type, batch)
+        except BrokenProcessPool:
+            self._replace_broken(model.model_type, lane)
+            raise
+
+        lane.in_flight += 1
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda finished: self._release(loop, lane, finished))
+        try:
+            output, _ = await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            self._replace_broken(model.model_type, lane)
+            raise
+        return output
+
+    def _replace_broken(self, model_type: ModelType, lane: _Lane) -> None:
+        """Swap a broken process lane for a fresh pool, once per breakage."""
+        if self._lanes.get(model_type) is not lane:
+            return
+        logger.error(f"Inference workers for {lane.name} died; restarting the lane")
+        lane.executor.shutdown(wait=False, cancel_futures=True)
+        self._lanes[model_type] = self._create_lane(model_type)
+
+    def _release(self, loop: asyncio.AbstractEventLoop, lane: _Lane, future: Future) -> None:
+        """Hand a finished call back to the loop, unless the loop has gone.
+
+        Abandoned calls can outlive the loop that submitted them (a
+        deadline-bound caller during shutdown, for instance).
+        """
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._finished, lane, future)
+
+    @staticmethod
+    def _finished(lane: _Lane, future: Future) -> None:
+        """Release a lane slot once the worker is done, on the event loop."""
+        lane.in_flight -= 1
+        if not future.cancelled() and future.exception() is None:
+            lane.record(future.result()[1])
+        MetricsCollector.update_inference_executor(
+            lane.name, lane.in_flight, lane.utilisation
+        )
+
+    def statistics(self) -> Dict[str, Any]:
+        """Return queue and utilisation figures for every lane."""
+        return {
+            "mode": self.mode.value,
+            "lanes": {
+                lane.name: {
+                    "workers": lane.workers,
+                    "in_process": lane.in_process,
+                    "in_flight": lane.in_flight,
+                    "max_in_flight": lane.workers + self.max_queue_depth,
+                    "completed": lane.completed,
+                    "rejected": lane.rejected,
+                    "utilisation": lane.utilisation
+                }
+                for lane in self._lanes.values()
+            }
+        }
@@ -0,0 +1,122 @@
+"""Keeps cached features and predictions in step with recorded match results."""
+
+import logging
+from datetime import datetime
+from typing import Optional
+
+from ..infrastructure.elo_ratings import EloRatingEngine
+from ..infrastructure.prediction_cache import PredictionCache
+from ..infrastructure.repositories import CachedDataRepository
+from ..infrastructure.team_form import TeamFormStore
+from ..infrastructure.team_pairs import TeamPairMatrix
+from shared.events.event_bus import EventBus, EventType, MatchResultRecordedEvent
+
+logger = logging.getLogger(__name__)
+
+
+class MatchResultSubscriber:
+    """Applies recorded match results to ratings and caches.
+
+    A result changes both teams' ratings, form and statistics, their recent
+    matches and the pair's head-to-head history, and makes any cached
+    prediction involving either team stale. Ratings are updated first so
+    the re-warmed statistics already include the result; only the affected
+    cache keys are touched, so the caches can run with long TTLs without
+    serving features from before the result.
+
+    State in a worker's memory (ratings, form, team pairs and the local
+    prediction tier) is updated by every worker; the shared Redis keys are
+    invalidated and re-warmed by one worker per result.
+    """
+
+    def __init__(
+        self,
+        data_repository: Optional[CachedDataRepository] = None,
+        prediction_cache: Optional[PredictionCache] = None,
+        rating_engine: Optional[EloRatingEngine] = None,
+        form_store: Optional[TeamFormStore] = None,
+        team_pairs: Optional[TeamPairMatrix] = None
+    ):
+        """Initialise the subscriber."""
+        self.data_repository = data_repository
+        self.prediction_cache = prediction_cache
+        self.rating_engine = rating_engine
+        self.form_store = form_store
+        self.team_pairs = team_pairs
+        self.results_processed = 0
+        self.results_refreshed = 0
+
+    async def subscribe(self, event_bus: EventBus) -> None:
+        """Register for match result events.
+        
+        ``apply_result`` subscribes on its own in every worker (broadcast),
+        as the state it updates lives in process memory. ``refresh_shared``
+        joins a consumer group, so each result's Redis invalidation and
+        re-warm runs in one worker rather than once per worker.
+        """
+        await event_bus.subscribe(
+            EventType.MATCH_RESULT_RECORDED,
+            self.apply_result,
+            consumer_group="prediction-engine-match-results",
+            broadcast=True
+        )
+        await event_bus.subscribe(
+            EventType.MATCH_RESULT_RECORDED,
+            self.refresh_shared,
+            consumer_group="prediction-engine-match-results-shared"
+        )
+
+    async def apply_result(self, event: MatchResultRecordedEvent) -> None:
+        """Update this worker's ratings, form, team pairs and local caches."""
+        self._apply_locally(event)
+        self.results_processed += 1
+
+    def _apply_locally(self, event: MatchResultRecordedEvent) -> None:
+        match_date = datetime.fromisoformat(event.match_date)
+
+        for store in (self.rating_engine, self.form_store, self.team_pairs):
+            if store is not None:
+                store.record_result(
+                    event.team_home,
+                    event.team_away,
+                    event.home_score,
+                    event.away_score,
+                    match_date,
+                    event.match_id
+                )
+
+        if self.data_repository:
+            self.data_repository.discard_loads_for_result(event.team_home, event.team_away)
+
+        if self.prediction_cache:
+            self.prediction_cache.evict_team(event.team_home)
+            self.prediction_cache.evict_team(event.team_away)
+
+    async def refresh_shared(self, event: MatchResultRecordedEvent) -> None:
+        """Invalidate and re-warm the Redis keys that depend on the two teams.
+
+        The result is applied locally first (the stores ignore a match they
+        have already recorded), so statistics re-warmed from this worker's
+        ratings include it whichever subscription delivered it first.
+        """
+        self._apply_locally(event)
+        refreshed = 0
+
+        if self.data_repository:
+            refreshed = await self.data_repository.refresh_for_result(
+                event.team_home, event.team_away
+            )
+
+        if self.prediction_cache:
+            await self.prediction_cache.invalidate_team(event.team_home)
+            await self.prediction_cache.invalidate_team(event.team_away)
+
+        self.results_refreshed += 1
+        logger.info(
+            f"Refreshed caches for result {event.match_id}",
+            extra={
+                "team_home": event.team_home,
+                "team_away": event.team_away,
+                "data_keys_refreshed": refreshed
+            }
+        )
@@ -0,0 +1,232 @@
+"""Adaptive micro-batching dispatcher for single prediction requests.
+
+Concurrent ``/predict`` calls are queued and flushed together through
+``PredictionService.predict_grouped`` so that each model runs one batched
+inference per flush instead of one 1-row inference per request.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from shared.monitoring.telemetry import MetricsCollector
+
+from ..domain.prediction_models import MatchDetails, PredictionResult, PredictionType
+
+if TYPE_CHECKING:
+    from .prediction_service import PredictionService
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatchQueueFullError(RuntimeError):
+    """Raised when the micro-batch queue is at capacity."""
+
+
+@dataclass
+class _PendingPrediction:
+    """A queued prediction request waiting for its batch."""
+
+    match_details: MatchDetails
+    prediction_type: PredictionType
+    user_id: Optional[str]
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class MicroBatchDispatcher:
+    """Collects concurrent prediction requests into small batches.
+
+    A batch is flushed when it reaches ``max_batch_size`` requests or when
+    the oldest request has waited ``max_wait_ms``. The window is adaptive:
+    while traffic is light (recent batches of about one request and nothing
+    else queued) requests are dispatched immediately, so the batching delay
+    is only paid when there is something to batch with.
+
+    Up to ``max_concurrent_batches`` flushed batches run at once, so a
+    batch does not wait for the previous one's persistence and event
+    publishing; once the cap is reached the collector waits for a slot.
+    """
+
+    def __init__(
+        self,
+        prediction_service: "PredictionService",
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        max_queue_depth: int = 256,
+        max_concurrent_batches: int = 4
+    ):
+        """Initialise the dispatcher."""
+        self.prediction_service = prediction_service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_queue_depth = max_queue_depth
+        self.max_concurrent_batches = max_concurrent_batches
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._collecting: List[_PendingPrediction] = []
+        self._in_flight: Dict[asyncio.Task, List[_PendingPrediction]] = {}
+        self._avg_batch_size = 1.0
+
+    async def start(self) -> None:
+        """Start the background dispatch loop."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_depth)
+        self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            "Micro-batch dispatcher started",
+            extra={
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+                "max_queue_depth": self.max_queue_depth,
+                "max_concurrent_batches": self.max_concurrent_batches
+            }
+        )
+
+    async def stop(self) -> None:
+        """Stop the dispatch loop and fail every request not yet answered.
+
+        Batches still being collected or dispatched are cancelled along
+        with the queue, and their callers get a ``RuntimeError`` instead
+        of waiting forever.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        in_flight = dict(self._in_flight)
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(self._task, *in_flight, return_exceptions=True)
+        self._task = None
+
+        stranded = list(self._collecting)
+        for batch in in_flight.values():
+            stranded.extend(batch)
+        while not self._queue.empty():
+            stranded.append(self._queue.get_nowait())
+        self._collecting = []
+        self._in_flight.clear()
+
+        for pending in stranded:
+            if not pending.future.done():
+                pending.future.set_exception(
+                    RuntimeError("Micro-batch dispatcher stopped")
+                )
+        MetricsCollector.update_micro_batch_queue_depth(0)
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting to be dispatched."""
+        return self._queue.qsize() if self._queue else 0
+
+    async def submit(
+        self,
+        match_details: MatchDetails,
+        prediction_type: PredictionType = PredictionType.MATCH_WINNER,
+        user_id: Optional[str] = None
+    ) -> PredictionResult:
+        """Queue a prediction and wait for its batch to complete."""
+        if self._task is None:
+            raise RuntimeError("Micro-batch dispatcher is not running")
+
+        pending = _PendingPrediction(
+            match_details=match_details,
+            prediction_type=prediction_type,
+            user_id=user_id,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.perf_counter()
+        )
+
+        try:
+            self._queue.put_nowait(pending)
+        except asyncio.QueueFull:
+            raise MicroBatchQueueFullError(
+                f"Prediction queue is full ({self.max_queue_depth} requests waiting)"
+            )
+
+        MetricsCollector.update_micro_batch_queue_depth(self._queue.qsize())
+        return await pending.future
+
+    async def _run(self) -> None:
+        """Collect batches and hand each to its own dispatch task until cancelled."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await self._slots.acquire()
+            batch = self._collecting = [await self._queue.get()]
+            self._drain_into(batch)
+
+            if len(batch) > 1 or self._avg_batch_size > 1.5:
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), timeout)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                    self._drain_into(batch)
+
+            self._avg_batch_size = 0.8 * self._avg_batch_size + 0.2 * len(batch)
+            MetricsCollector.update_micro_batch_queue_depth(self._queue.qsize())
+
+            self._collecting = []
+            task = asyncio.create_task(self._dispatch_guarded(batch))
+            self._in_flight[task] = batch
+
+    async def _dispatch_guarded(self, batch: List[_PendingPrediction]) -> None:
+        """Dispatch one batch, failing its requests on error, then free its slot."""
+        try:
+            await self._dispatch(batch)
+        except Exception as e:
+            logger.error(f"Micro-batch dispatch failed: {e}", exc_info=True)
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+        finally:
+            self._in_flight.pop(asyncio.current_task(), None)
+            self._slots.release()
+
+    def _drain_into(self, batch: List[_PendingPrediction]) -> None:
+        """Move already-queued requests into the batch without waiting."""
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _dispatch(self, batch: List[_PendingPrediction]) -> None:
+        """Run one grouped prediction per prediction type and resolve futures."""
+        now = time.perf_counter()
+        MetricsCollector.record_micro_batch(
+            size=len(batch),
+            queue_wait=max(now - pending.enqueued_at for pending in batch)
+        )
+
+        by_type: Dict[PredictionType, List[_PendingPrediction]] = {}
+        for pending in batch:
+            if pending.future.cancelled():
+                continue
+            by_type.setdefault(pending.prediction_type, []).append(pending)
+
+        for prediction_type, group in by_type.items():
+            results = await self.prediction_service.predict_grouped(
+                [pending.match_details for pending in group],
+                prediction_type,
+                [pending.user_id for pending in group]
+            )
+
+            for pending, result in zip(group, results):
+                if pending.future.done():
+                    continue
+                if isinstance(result, Exception):
+                    pending.future.set_exception(result)
+                else:
+                    pending.future.set_result(result)
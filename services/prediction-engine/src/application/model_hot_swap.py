@@ -0,0 +1,175 @@
+"""Reloads model artifacts when they change on disk, without a restart."""
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Mapping, Optional, Tuple, Union
+
+from shared.monitoring.telemetry import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+
+ArtifactSignature = Tuple[int, int]
+
+
+def _version_tag(signature: ArtifactSignature) -> str:
+    return "{}-{}".format(*signature)
+
+
+def check_probabilities(probabilities: Mapping[str, float], tolerance: float = 1e-3) -> None:
+    """Raise ``ValueError`` unless ``probabilities`` is a valid distribution."""
+    values = [float(value) for value in probabilities.values()]
+    if not values:
+        raise ValueError("no probabilities returned")
+    if not all(math.isfinite(value) and 0.0 <= value <= 1.0 for value in values):
+        raise ValueError(f"probabilities out of range: {dict(probabilities)}")
+    if abs(sum(values) - 1.0) > tolerance:
+        raise ValueError(f"probabilities sum to {sum(values):.4f}")
+
+
+@dataclass
+class WatchedArtifact:
+    """One model artifact and how to reload it."""
+
+    filename: str
+    key: Hashable
+    load: Callable[[Path], Any]
+    validate: Callable[[Any], Awaitable[None]]
+    swap: Callable[[Any, str], Awaitable[None]]
+    signature: Optional[ArtifactSignature] = None
+    pending: Optional[ArtifactSignature] = None
+    rejected: Optional[ArtifactSignature] = None
+    version: int = 0
+    reloaded_at: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class ModelHotSwapper:
+    """Polls a model directory and swaps in new artifacts once validated.
+
+    A changed artifact (size or modification time) is only picked up once
+    it has been unchanged for a whole poll, so a file still being copied
+    is never loaded. The new model is loaded in a worker thread, checked
+    with its canary validation and only then handed to ``swap`` with the
+    new artifact's version tag; ``swap`` replaces the serving reference.
+    Requests already holding the old model finish on it. The artifact
+    counts as deployed only once ``swap`` returns. One that fails to load,
+    validate or swap is logged and remembered as rejected, so it is not
+    retried until the file changes again; the old model keeps serving.
+    """
+
+    def __init__(self, directory: Union[str, Path], poll_interval: float = 10.0):
+        """Watch ``directory`` every ``poll_interval`` seconds once started."""
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self._artifacts: Dict[str, WatchedArtifact] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def _signature(self, filename: str) -> Optional[ArtifactSignature]:
+        try:
+            stat = (self.directory / filename).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def watch(
+        self,
+        filename: str,
+        key: Hashable,
+        load: Callable[[Path], Any],
+        validate: Callable[[Any], Awaitable[None]],
+        swap: Callable[[Any, str], Awaitable[None]]
+    ) -> None:
+        """Reload ``filename`` through ``load``, ``validate`` and ``swap`` when it changes.
+
+        The artifact as it is now counts as already deployed.
+        """
+        self._artifacts[filename] = WatchedArtifact(
+            filename, key, load, validate, swap, signature=self._signature(filename)
+        )
+
+    async def check(self) -> List[Hashable]:
+        """Reload every artifact that changed and has settled; return the keys swapped."""
+        swapped = []
+        for artifact in self._artifacts.values():
+            signature = self._signature(artifact.filename)
+            if signature is None or signature in (artifact.signature, artifact.rejected):
+                artifact.pending = None
+            elif signature != artifact.pending:
+                artifact.pending = signature
+            elif await self._reload(artifact, signature):
+                swapped.append(artifact.key)
+        return swapped
+
+    async def _reload(self, artifact: WatchedArtifact, signature: ArtifactSignature) -> bool:
+        start_time = time.perf_counter()
+        artifact.pending = None
+        name = str(getattr(artifact.key, "value", artifact.key))
+        try:
+            model = await asyncio.to_thread(artifact.load, self.directory / artifact.filename)
+            await artifact.validate(model)
+            await artifact.swap(model, _version_tag(signature))
+        except Exception as e:
+            artifact.rejected = signature
+            artifact.last_error = str(e)
+            MetricsCollector.record_model_reload(name, False)
+            logger.error(f"Rejected new {artifact.filename}, keeping the current model: {e}")
+            return False
+
+        artifact.signature = signature
+        artifact.rejected = None
+        artifact.version += 1
+        artifact.reloaded_at = time.time()
+        artifact.last_error = None
+        MetricsCollector.record_model_reload(name, True)
+        logger.info(
+            f"Swapped in {artifact.filename} version {artifact.version}",
+            extra={"reload_ms": (time.perf_counter() - start_time) * 1000}
+        )
+        return True
+
+    def start(self) -> None:
+        """Start polling in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.check()
+            except Exception as e:
+                logger.warning(f"Model artifact check failed: {e}")
+
+    def artifact_version(self, filename: str) -> Optional[str]:
+        """Return the deployed artifact's size and modification time as a version tag."""
+        artifact = self._artifacts.get(filename)
+        if artifact is None or artifact.signature is None:
+            return None
+        return _version_tag(artifact.signature)
+
+    def statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Return each watched artifact's version and last reload."""
+        return {
+            artifact.filename: {
+                "version": artifact.version,
+                "reloaded_at": artifact.reloaded_at,
+                **({"error": artifact.last_error} if artifact.last_error else {})
+            }
+            for artifact in self._artifacts.values()
+        }
@@ -0,0 +1,157 @@
+"""Background construction and warmup of prediction models."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from shared.monitoring.telemetry import MetricsCollector
+
+from ..domain.prediction_models import ModelType, PredictionModel
+from .model_readiness import ModelReadinessRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_up(model: PredictionModel) -> bool:
+    """Run a model's ``is_ready`` to completion on a private event loop."""
+    return bool(asyncio.run(model.is_ready()))
+
+
+class LazyModelLoader:
+    """Builds and warms models after start-up, busiest models first.
+
+    Each model is constructed and warmed with ``is_ready`` in worker
+    threads, off the event loop, before it is added to ``models`` and the
+    readiness registry, so the service can serve with whichever models
+    are loaded while the rest are still loading. Models load one at a time in
+    descending traffic share, ties keeping factory order, so the model
+    most requests would be routed to is usually first to be served.
+    A model that fails to construct stays ``failed``; one that constructs
+    but does not warm up is registered anyway, and the readiness probe
+    picks it up once it recovers.
+    """
+
+    def __init__(
+        self,
+        factories: Mapping[ModelType, Callable[[], PredictionModel]],
+        models: Dict[ModelType, PredictionModel],
+        readiness: ModelReadinessRegistry,
+        warmup_timeout: float = 120.0
+    ):
+        """Load into ``models`` and ``readiness`` from ``factories``."""
+        self.factories = dict(factories)
+        self.models = models
+        self.readiness = readiness
+        self.warmup_timeout = warmup_timeout
+        self.states: Dict[ModelType, str] = {model_type: "pending" for model_type in self.factories}
+        self.load_seconds: Dict[ModelType, float] = {}
+        self.errors: Dict[ModelType, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def started(self) -> bool:
+        return self._task is not None
+
+    @property
+    def finished(self) -> bool:
+        return all(state in ("loaded", "failed") for state in self.states.values())
+
+    def load_order(self, traffic_share: Optional[Mapping[ModelType, float]] = None) -> List[ModelType]:
+        """Return pending models, highest traffic share first."""
+        share = traffic_share or {}
+        order = list(self.factories)
+        return sorted(
+            (model_type for model_type in order if self.states[model_type] == "pending"),
+            key=lambda model_type: (-share.get(model_type, 0.0), order.index(model_type))
+        )
+
+    def start(self, traffic_share: Optional[Mapping[ModelType, float]] = None) -> asyncio.Task:
+        """Load every pending model in a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.load_all(traffic_share))
+        return self._task
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait up to ``timeout`` for the background load; return whether it finished.
+
+        Starts the load if needed. Timing out leaves it running.
+        """
+        task = self.start()
+        await asyncio.wait({task}, timeout=timeout)
+        return task.done()
+
+    async def stop(self) -> None:
+        """Cancel any loading still in progress."""
+        if self._task is None or self._task.done():
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def load_all(self, traffic_share: Optional[Mapping[ModelType, float]] = None) -> None:
+        """Load every pending model in traffic order."""
+        for model_type in self.load_order(traffic_share):
+            await self.load(model_type)
+        logger.info(
+            f"Loaded {len(self.readiness.ready_models())}/{len(self.factories)} prediction models"
+        )
+
+    async def load(self, model_type: ModelType) -> Optional[PredictionModel]:
+        """Construct and warm one model, recording how long it took."""
+        self.states[model_type] = "loading"
+        start_time = time.perf_counter()
+        try:
+            model = await asyncio.to_thread(self.factories[model_type])
+        except Exception as e:
+            self.states[model_type] = "failed"
+            self.errors[model_type] = str(e)
+            logger.error(f"Failed to initialize {model_type.value} predictor: {e}")
+            return None
+
+        try:
+            ready = await asyncio.wait_for(asyncio.to_thread(_warm_up, model), self.warmup_timeout)
+            error = None
+        except Exception as e:
+            ready = False
+            error = "warmup timed out" if isinstance(e, asyncio.TimeoutError) else str(e)
+
+        seconds = time.perf_counter() - start_time
+        self.load_seconds[model_type] = seconds
+        MetricsCollector.record_model_load(model_type.value, seconds, ready)
+
+        self.models[model_type] = model
+        self.readiness.register(model)
+        self.readiness.mark(model_type, ready, error, source="warmup")
+        self.states[model_type] = "loaded"
+        if error:
+            self.errors[model_type] = error
+
+        logger.info(
+            f"Initialized {model.model_name} in {seconds * 1000:.0f} ms",
+            extra={"ready": ready, "error": error}
+        )
+        return model
+
+    def state(self, model_type: ModelType) -> str:
+        """Return ``pending``, ``loading``, ``ready``, ``not_ready`` or ``failed``."""
+        state = self.states[model_type]
+        if state == "loaded":
+            return "ready" if self.readiness.is_ready(model_type) else "not_ready"
+        return state
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Return each model's load state, load time and error."""
+        return {
+            model_type.value: {
+                "state": self.state(model_type),
+                **(
+                    {"load_seconds": self.load_seconds[model_type]}
+                    if model_type in self.load_seconds else {}
+                ),
+                **({"error": self.errors[model_type]} if model_type in self.errors else {})
+            }
+            for model_type in self.factories
+        }
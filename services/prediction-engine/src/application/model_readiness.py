@@ -0,0 +1,154 @@
+"""Snapshot of which prediction models are ready to serve."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..domain.prediction_models import ModelType, PredictionModel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelReadiness:
+    """Last known readiness of one model."""
+
+    ready: bool
+    updated_at: float
+    source: str
+    error: Optional[str] = None
+
+
+class ModelReadinessRegistry:
+    """Holds model readiness so request paths never await ``is_ready``.
+
+    Readiness changes arrive from two places: whoever loads or swaps a
+    model reports the outcome with ``mark``, and ``probe`` (run once at
+    start-up and then periodically by ``start``) asks every model
+    concurrently with a timeout. Each change rebuilds an immutable
+    tuple of ready models, so ``ready_models`` and ``snapshot`` are plain
+    attribute reads. Models never probed count as not ready.
+    """
+
+    def __init__(
+        self,
+        models: Iterable[PredictionModel] = (),
+        probe_timeout: float = 2.0
+    ):
+        """Register the initial models."""
+        self.probe_timeout = probe_timeout
+        self.version = 0
+        self.probed = False
+        self._models: Dict[ModelType, PredictionModel] = {}
+        self._states: Dict[ModelType, ModelReadiness] = {}
+        self._ready: Tuple[PredictionModel, ...] = ()
+        self._probe_task: Optional[asyncio.Task] = None
+
+        for model in models:
+            self.register(model)
+
+    def register(self, model: PredictionModel) -> None:
+        """Track a model, replacing any previous model of the same type.
+
+        A replacement starts out not ready until it reports ready or is
+        probed.
+        """
+        self._models[model.model_type] = model
+        self._set(model.model_type, False, "registered")
+
+    def mark(
+        self,
+        model_type: ModelType,
+        ready: bool,
+        error: Optional[str] = None,
+        source: str = "event"
+    ) -> None:
+        """Record a readiness change reported by a model's loader."""
+        if model_type in self._models:
+            self._set(model_type, ready, source, error)
+
+    def _set(
+        self,
+        model_type: ModelType,
+        ready: bool,
+        source: str,
+        error: Optional[str] = None
+    ) -> None:
+        previous = self._states.get(model_type)
+        self._states[model_type] = ModelReadiness(ready, time.time(), source, error)
+        if previous is None or previous.ready != ready:
+            self._ready = tuple(
+                model for model_type, model in self._models.items()
+                if self._states[model_type].ready
+            )
+            self.version += 1
+            logger.info(
+                f"Model {model_type.value} is {'ready' if ready else 'not ready'}",
+                extra={"source": source, "error": error}
+            )
+
+    def ready_models(self) -> Tuple[PredictionModel, ...]:
+        """Return the models currently ready, in registration order."""
+        return self._ready
+
+    def is_ready(self, model_type: ModelType) -> bool:
+        """Return the last known readiness of one model."""
+        state = self._states.get(model_type)
+        return state is not None and state.ready
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return every model's readiness for health and status endpoints."""
+        return {
+            model_type.value: {
+                "ready": state.ready,
+                "name": self._models[model_type].model_name,
+                "updated_at": state.updated_at,
+                "source": state.source,
+                **({"error": state.error} if state.error else {})
+            }
+            for model_type, state in self._states.items()
+        }
+
+    async def probe(self) -> List[PredictionModel]:
+        """Ask every model for readiness concurrently and record the answers."""
+        models = list(self._models.values())
+        answers = await asyncio.gather(
+            *(asyncio.wait_for(model.is_ready(), self.probe_timeout) for model in models),
+            return_exceptions=True
+        )
+        for model, answer in zip(models, answers):
+            if self._models.get(model.model_type) is not model:
+                continue
+            if isinstance(answer, BaseException):
+                error = "probe timed out" if isinstance(answer, asyncio.TimeoutError) else str(answer)
+                self._set(model.model_type, False, "probe", error)
+            else:
+                self._set(model.model_type, bool(answer), "probe")
+        self.probed = True
+        return list(self._ready)
+
+    def start(self, interval_seconds: float = 30.0) -> None:
+        """Start probing in the background every ``interval_seconds``."""
+        if self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._probe_loop(interval_seconds))
+
+    async def stop(self) -> None:
+        """Stop the background probe."""
+        if self._probe_task is None:
+            return
+        self._probe_task.cancel()
+        try:
+            await self._probe_task
+        except asyncio.CancelledError:
+            pass
+        self._probe_task = None
+
+    async def _probe_loop(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.probe()
+            except Exception as e:
+                logger.warning(f"Model readiness probe failed: {e}")
@@ -9,14 +9,19 @@ import logging
 import time
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 import numpy as np
 from abc import ABC, abstractmethod
 
+from .inference_executor import CPU_BOUND_MODELS, InferenceExecutor
+from .routing_cache import RoutingDecisionCache
+from .routing_history import RoutingHistory
+from ..infrastructure.team_pairs import TeamPairMatrix
 from ..domain.prediction_models import (
     PredictionModel, ModelType, PredictionType, MatchDetails, 
-    PredictionResult, ModelMetrics
+    PredictionResult, ModelMetrics, Winner
 )
 
 logger = logging.getLogger(__name__)
@@ -31,6 +36,10 @@ class RoutingStrategy(str, Enum):
     CONFIDENCE_BASED = "confidence_based"
 
 
+# Season stages treated as the "playoffs" scenario.
+PLAYOFF_STAGES = ("finals", "grand_final")
+
+
 @dataclass
 class RoutingContext:
     """Context information for routing decisions."""
@@ -53,6 +62,22 @@ class RoutingContext:
                 "venue_data": True,
                 "injury_reports": False
             }
+    
+    def fingerprint(self) -> Hashable:
+        """Return the inputs routers decide on, as a hashable key.
+        
+        Routers only read the derived fields, not the match details, so
+        fixtures with the same context route identically.
+        """
+        return (
+            self.team_rivalry_score,
+            self.historical_h2h_matches,
+            self.recent_form_differential,
+            self.venue_advantage,
+            self.season_stage,
+            self.match_importance,
+            tuple(sorted(self.data_availability.items()))
+        )
 
 
 @dataclass
@@ -67,10 +92,17 @@ class ModelPerformanceHistory:
     weak_scenarios: List[str]
     last_updated: datetime
     prediction_count: int = 0
+    brier_score: Optional[float] = None
 
 
 class RoutingEngine(ABC):
-    """Abstract base class for routing engines."""
+    """Abstract base class for routing engines.
+    
+    ``version`` must change whenever state behind the engine's decisions
+    changes, so memoised decisions can be dropped.
+    """
+    
+    version: int = 0
     
     @abstractmethod
     async def route(
@@ -87,7 +119,7 @@ class PerformanceBasedRouter(RoutingEngine):
     
     def __init__(self):
         """Initialize performance tracker."""
-        self.performance_history: Dict[ModelType, ModelPerformanceHistory] = {
+        self._performance_history: Dict[ModelType, ModelPerformanceHistory] = {
             ModelType.LOGISTIC_REGRESSION: ModelPerformanceHistory(
                 model_type=ModelType.LOGISTIC_REGRESSION,
                 recent_accuracy=0.85,
@@ -135,6 +167,16 @@ class PerformanceBasedRouter(RoutingEngine):
             )
         }
     
+    @property
+    def performance_history(self) -> Mapping[ModelType, ModelPerformanceHistory]:
+        """Return a read-only view; use ``update_performance`` to change it."""
+        return MappingProxyType(self._performance_history)
+    
+    def update_performance(self, history: ModelPerformanceHistory) -> None:
+        """Replace a model's performance history."""
+        self._performance_history[history.model_type] = history
+        self.version += 1
+    
     async def route(
         self, 
         context: RoutingContext,
@@ -145,10 +187,10 @@ class PerformanceBasedRouter(RoutingEngine):
         model_scores = {}
         
         for model_type in available_models:
-            if model_type not in self.performance_history:
+            if model_type not in self._performance_history:
                 continue
                 
-            perf = self.performance_history[model_type]
+            perf = self._performance_history[model_type]
             
             score = perf.recent_accuracy
             
@@ -192,9 +234,9 @@ class PerformanceBasedRouter(RoutingEngine):
         if context.match_importance > 0.8 and "high_stakes_games" in perf.strong_scenarios:
             bonus += 0.05
         
-        if context.season_stage == "playoffs" and "playoffs" in perf.strong_scenarios:
+        if context.season_stage in PLAYOFF_STAGES and "playoffs" in perf.strong_scenarios:
             bonus += 0.05
-        elif context.season_stage == "playoffs" and "playoffs" in perf.weak_scenarios:
+        elif context.season_stage in PLAYOFF_STAGES and "playoffs" in perf.weak_scenarios:
             bonus -= 0.05
         if not context.data_availability.get("historical_matches", True):
             if "data_sparse_matches" in perf.weak_scenarios:
@@ -235,13 +277,12 @@ class RuleBasedRouter(RoutingEngine):
 class EnsembleWeightedRouter(RoutingEngine):
     """Routes to multiple models with weights."""
     
-    async def route(
+    def weights(
         self, 
         context: RoutingContext,
         available_models: List[ModelType]
-    ) -> Tuple[ModelType, float]:
-        """Select primary model for ensemble."""
-        
+    ) -> Dict[ModelType, float]:
+        """Return the ensemble weight of each available model."""
         weights = {}
         
         for model_type in available_models:
@@ -261,6 +302,17 @@ class EnsembleWeightedRouter(RoutingEngine):
                 weights[ModelType.REINFORCEMENT_LEARNING] += 0.1
             if ModelType.STACKER in weights:
                 weights[ModelType.STACKER] += 0.05
+        
+        return weights
+    
+    async def route(
+        self, 
+        context: RoutingContext,
+        available_models: List[ModelType]
+    ) -> Tuple[ModelType, float]:
+        """Select primary model for ensemble."""
+        
+        weights = self.weights(context, available_models)
         if weights:
             primary_model = max(weights, key=weights.get)
             confidence = weights[primary_model]
@@ -269,18 +321,236 @@ class EnsembleWeightedRouter(RoutingEngine):
         return available_models[0], 0.5
 
 
+# Inputs of the gating network, in column order.
+GATING_FEATURES = (
+    "rivalry_score",
+    "h2h_matches_scaled",
+    "recent_form_differential",
+    "venue_advantage",
+    "match_importance",
+    "stage_early_season",
+    "stage_mid_season",
+    "stage_finals",
+    "stage_grand_final",
+    "stage_off_season",
+    "has_historical_matches",
+    "has_player_stats",
+    "has_odds_data",
+    "has_venue_data",
+    "has_injury_reports",
+)
+
+_SEASON_STAGES = ("early_season", "mid_season", "finals", "grand_final", "off_season")
+_DATA_SOURCES = (
+    "historical_matches", "player_stats", "odds_data", "venue_data", "injury_reports"
+)
+
+# Experts the gating network chooses between, in output column order.
+GATING_EXPERTS = (
+    ModelType.LOGISTIC_REGRESSION,
+    ModelType.LIGHTGBM,
+    ModelType.TRANSFORMER,
+    ModelType.STACKER,
+    ModelType.REINFORCEMENT_LEARNING,
+)
+
+
+def gating_features(contexts: List[RoutingContext]) -> np.ndarray:
+    """Build the gating network input matrix for a list of routing contexts."""
+    features = np.zeros((len(contexts), len(GATING_FEATURES)), dtype=np.float64)
+    
+    for row, context in enumerate(contexts):
+        features[row, 0] = context.team_rivalry_score
+        features[row, 1] = context.historical_h2h_matches / 30.0
+        features[row, 2] = context.recent_form_differential
+        features[row, 3] = context.venue_advantage
+        features[row, 4] = context.match_importance
+        if context.season_stage in _SEASON_STAGES:
+            features[row, 5 + _SEASON_STAGES.index(context.season_stage)] = 1.0
+        for column, source in enumerate(_DATA_SOURCES, start=10):
+            features[row, column] = float(context.data_availability.get(source, False))
+    
+    return features
+
+
+class GatingNetworkRouter(RoutingEngine):
+    """Routes with a learned softmax gate over routing-context features.
+    
+    The gate is a single linear layer followed by a softmax over the
+    experts, evaluated in NumPy. ``route_batch`` scores a whole round with
+    one matrix multiply. Until weights are trained with ``fit`` (from
+    logged per-expert outcomes) or loaded from an ``.npz`` file, the gate
+    only has a bias that mirrors the ensemble weighting prior.
+    """
+    
+    def __init__(
+        self,
+        weights: Optional[np.ndarray] = None,
+        bias: Optional[np.ndarray] = None,
+        experts: Tuple[ModelType, ...] = GATING_EXPERTS
+    ):
+        """Initialise the gate, optionally with trained parameters."""
+        self.experts = tuple(experts)
+        self._expert_index = {model_type: i for i, model_type in enumerate(self.experts)}
+        
+        if weights is None:
+            weights = np.zeros((len(GATING_FEATURES), len(self.experts)))
+        if bias is None:
+            prior = {
+                ModelType.LOGISTIC_REGRESSION: 0.05,
+                ModelType.LIGHTGBM: 0.20,
+                ModelType.TRANSFORMER: 0.15,
+                ModelType.STACKER: 0.25,
+                ModelType.REINFORCEMENT_LEARNING: 0.35,
+            }
+            bias = np.log([prior.get(model_type, 0.1) for model_type in self.experts])
+        
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.bias = np.asarray(bias, dtype=np.float64)
+        if self.weights.shape != (len(GATING_FEATURES), len(self.experts)):
+            raise ValueError(
+                f"Gating weights have shape {self.weights.shape}, expected "
+                f"{(len(GATING_FEATURES), len(self.experts))}"
+            )
+    
+    def probabilities(
+        self,
+        features: np.ndarray,
+        available_models: Optional[List[ModelType]] = None
+    ) -> np.ndarray:
+        """Return the gate's softmax over experts for each feature row."""
+        logits = features @ self.weights + self.bias
+        if available_models is not None:
+            mask = np.full(len(self.experts), -np.inf)
+            for model_type in available_models:
+                index = self._expert_index.get(model_type)
+                if index is not None:
+                    mask[index] = 0.0
+            logits = logits + mask
+        
+        logits = logits - logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+    
+    async def route(
+        self, 
+        context: RoutingContext,
+        available_models: List[ModelType]
+    ) -> Tuple[ModelType, float]:
+        """Route one match through the gate."""
+        [decision] = await self.route_batch([context], available_models)
+        return decision
+    
+    async def route_batch(
+        self,
+        contexts: List[RoutingContext],
+        available_models: List[ModelType]
+    ) -> List[Tuple[ModelType, float]]:
+        """Route every context with one matrix multiply."""
+        if not any(model_type in self._expert_index for model_type in available_models):
+            return [(available_models[0], 0.5) for _ in contexts]
+        
+        probabilities = self.probabilities(gating_features(contexts), available_models)
+        choices = probabilities.argmax(axis=1)
+        confidences = probabilities[np.arange(len(contexts)), choices]
+        return [
+            (self.experts[choice], float(confidence))
+            for choice, confidence in zip(choices, confidences)
+        ]
+    
+    def fit(
+        self,
+        features: np.ndarray,
+        rewards: np.ndarray,
+        epochs: int = 500,
+        learning_rate: float = 0.5,
+        l2: float = 1e-3
+    ) -> float:
+        """Train the gate from logged routing outcomes.
+        
+        ``rewards`` has one row per logged context and one column per
+        expert (in ``self.experts`` order) scoring how well that expert did,
+        e.g. 1 for a correct winner and 0 otherwise. Each row is normalised
+        into a target distribution and the gate is fitted to it with
+        full-batch gradient descent on the cross-entropy. Returns the final
+        mean loss.
+        """
+        rewards = np.clip(np.asarray(rewards, dtype=np.float64), 0.0, None)
+        totals = rewards.sum(axis=1, keepdims=True)
+        targets = np.where(totals > 0, rewards / np.where(totals > 0, totals, 1.0),
+                           1.0 / len(self.experts))
+        n_rows = len(features)
+        
+        for _ in range(epochs):
+            probabilities = self.probabilities(features)
+            gradient = (probabilities - targets) / n_rows
+            self.weights -= learning_rate * (features.T @ gradient + l2 * self.weights)
+            self.bias -= learning_rate * gradient.sum(axis=0)
+        self.version += 1
+        
+        probabilities = self.probabilities(features)
+        return float(-(targets * np.log(probabilities + 1e-12)).sum(axis=1).mean())
+    
+    def save(self, path: str) -> None:
+        """Save the trained gate to an ``.npz`` file."""
+        np.savez(
+            path,
+            weights=self.weights,
+            bias=self.bias,
+            experts=np.array([model_type.value for model_type in self.experts]),
+            features=np.array(GATING_FEATURES)
+        )
+    
+    @classmethod
+    def load(cls, path: str) -> "GatingNetworkRouter":
+        """Load a gate saved with ``save``."""
+        with np.load(path) as data:
+            if tuple(data["features"]) != GATING_FEATURES:
+                raise ValueError(f"Gating weights in {path} use a different feature set")
+            return cls(
+                weights=data["weights"],
+                bias=data["bias"],
+                experts=tuple(ModelType(value) for value in data["experts"])
+            )
+
+
 class MixtureOfExpertsRouter:
     """Main MoE router that orchestrates different routing strategies."""
     
-    def __init__(self, strategy: RoutingStrategy = RoutingStrategy.PERFORMANCE_BASED):
+    def __init__(
+        self, 
+        strategy: RoutingStrategy = RoutingStrategy.PERFORMANCE_BASED,
+        ensemble_deadline_ms: float = 250.0,
+        ensemble_fallback_ms: float = 1000.0,
+        cpu_bound_models: Iterable[ModelType] = CPU_BOUND_MODELS,
+        max_expert_threads: int = 4,
+        gating_weights_path: Optional[str] = None,
+        routing_history_capacity: int = 10_000,
+        team_pairs: Optional[TeamPairMatrix] = None,
+        routing_cache_size: int = 4096,
+        inference_executor: Optional[InferenceExecutor] = None
+    ):
         """Initialize MoE router."""
         self.strategy = strategy
         self.routers = {
             RoutingStrategy.PERFORMANCE_BASED: PerformanceBasedRouter(),
             RoutingStrategy.RULE_BASED: RuleBasedRouter(),
-            RoutingStrategy.ENSEMBLE_WEIGHTED: EnsembleWeightedRouter()
+            RoutingStrategy.ENSEMBLE_WEIGHTED: EnsembleWeightedRouter(),
+            RoutingStrategy.GATING_NETWORK: (
+                GatingNetworkRouter.load(gating_weights_path) if gating_weights_path
+                else GatingNetworkRouter()
+            )
         }
-        self.routing_history: List[Dict[str, Any]] = []
+        self.routing_history = RoutingHistory(capacity=routing_history_capacity)
+        self.team_pairs = team_pairs if team_pairs is not None else TeamPairMatrix()
+        self.routing_cache = RoutingDecisionCache(max_entries=routing_cache_size)
+        
+        self.ensemble_deadline_ms = ensemble_deadline_ms
+        self.ensemble_fallback_ms = ensemble_fallback_ms
+        self.inference_executor = inference_executor or InferenceExecutor(
+            offload_models=cpu_bound_models,
+            workers=max_expert_threads
+        )
     
     async def route_prediction(
         self,
@@ -289,75 +559,391 @@ class MixtureOfExpertsRouter:
         prediction_type: PredictionType = PredictionType.MATCH_WINNER
     ) -> Tuple[PredictionModel, float, Dict[str, Any]]:
         """Route to the best model for this prediction."""
+        [decision] = await self.route_batch([match_details], available_models, prediction_type)
+        return decision
+    
+    async def route_batch(
+        self,
+        matches: List[MatchDetails],
+        available_models: List[PredictionModel],
+        prediction_type: PredictionType = PredictionType.MATCH_WINNER
+    ) -> List[Tuple[PredictionModel, float, Dict[str, Any]]]:
+        """Route several matches at once.
+        
+        Routers that implement ``route_batch`` (the gating network) decide
+        the whole list in one call; the others are asked match by match.
+        """
         
         start_time = time.time()
         
-        context = await self._create_routing_context(match_details)
+        contexts = [await self._create_routing_context(m) for m in matches]
         
         available_model_types = [model.model_type for model in available_models]
+        models_by_type = {model.model_type: model for model in available_models}
         
         router = self.routers.get(self.strategy)
         if not router:
             router = self.routers[RoutingStrategy.PERFORMANCE_BASED]
         
-        selected_model_type, confidence = await router.route(context, available_model_types)
-        selected_model = None
-        for model in available_models:
-            if model.model_type == selected_model_type:
-                selected_model = model
-                break
+        choices, cache_hits = await self._route_memoised(
+            router, contexts, available_model_types
+        )
         
-        if not selected_model:
-            selected_model = available_models[0]
-            confidence = 0.5
+        routing_time = (time.time() - start_time) * 1000 / max(len(matches), 1)
+        decisions = []
         
-        routing_time = (time.time() - start_time) * 1000
-        routing_metadata = {
-            "strategy": self.strategy.value,
-            "selected_model": selected_model.model_type.value,
-            "routing_confidence": confidence,
-            "routing_time_ms": routing_time,
-            "context": {
-                "rivalry_score": context.team_rivalry_score,
-                "match_importance": context.match_importance,
-                "season_stage": context.season_stage,
-                "h2h_matches": context.historical_h2h_matches
-            },
-            "available_models": [m.value for m in available_model_types]
+        for match_details, context, (selected_model_type, confidence), cache_hit in zip(
+            matches, contexts, choices, cache_hits
+        ):
+            selected_model = models_by_type.get(selected_model_type)
+            if not selected_model:
+                selected_model = available_models[0]
+                confidence = 0.5
+            
+            routing_metadata = {
+                "strategy": self.strategy.value,
+                "selected_model": selected_model.model_type.value,
+                "routing_confidence": confidence,
+                "routing_time_ms": routing_time,
+                "routing_cache_hit": cache_hit,
+                "routing_cache_hit_ratio": self.routing_cache.hit_ratio,
+                "context": {
+                    "rivalry_score": context.team_rivalry_score,
+                    "match_importance": context.match_importance,
+                    "season_stage": context.season_stage,
+                    "h2h_matches": context.historical_h2h_matches
+                },
+                "available_models": [m.value for m in available_model_types]
+            }
+            self.routing_history.record(
+                match_details.match_id,
+                selected_model.model_type,
+                confidence,
+                self.strategy.value,
+                routing_time
+            )
+            
+            logger.info(
+                f"MoE routing selected {selected_model.model_type.value}",
+                extra=routing_metadata
+            )
+            decisions.append((selected_model, confidence, routing_metadata))
+        
+        return decisions
+    
+    async def _route_memoised(
+        self,
+        router: RoutingEngine,
+        contexts: List[RoutingContext],
+        available_model_types: List[ModelType]
+    ) -> Tuple[List[Tuple[ModelType, float]], List[bool]]:
+        """Route contexts, asking the router only for unseen fingerprints.
+        
+        Returns the decisions and, per context, whether it was a cache hit.
+        The cache is dropped when the strategy, the router instance, its
+        version or the day changes (performance routing penalises stale
+        history by age). The epoch holds the router itself rather than its
+        ``id``, which a replacement router could reuse once the old one is
+        freed.
+        """
+        self.routing_cache.set_epoch(
+            (self.strategy, router, router.version, datetime.utcnow().date())
+        )
+        models_key = tuple(available_model_types)
+        keys = [(context.fingerprint(), models_key) for context in contexts]
+        
+        choices: List[Optional[Tuple[ModelType, float]]] = []
+        pending: Dict[Hashable, RoutingContext] = {}
+        for key, context in zip(keys, contexts):
+            decision = self.routing_cache.get(key)
+            choices.append(decision)
+            if decision is None:
+                pending.setdefault(key, context)
+        cache_hits = [decision is not None for decision in choices]
+        
+        if pending:
+            pending_contexts = list(pending.values())
+            route_batch = getattr(router, "route_batch", None)
+            if route_batch:
+                decided = await route_batch(pending_contexts, available_model_types)
+            else:
+                decided = [
+                    await router.route(context, available_model_types)
+                    for context in pending_contexts
+                ]
+            decided_by_key = dict(zip(pending, decided))
+            for key, decision in decided_by_key.items():
+                self.routing_cache.put(key, decision)
+            choices = [
+                decision if decision is not None else decided_by_key[key]
+                for key, decision in zip(keys, choices)
+            ]
+        
+        return choices, cache_hits
+    
+    async def predict_ensemble(
+        self,
+        matches: List[MatchDetails],
+        available_models: List[PredictionModel],
+        prediction_type: PredictionType = PredictionType.MATCH_WINNER,
+        deadline_ms: Optional[float] = None
+    ) -> List[Tuple[Union[PredictionResult, Exception], float, Dict[str, Any]]]:
+        """Run every weighted expert concurrently and blend their probabilities.
+        
+        Each expert predicts the whole batch once; CPU-bound experts run in
+        a thread pool so they overlap with each other and with the event
+        loop. Experts whose lane has no idle worker are shed up front, since
+        they would only queue behind earlier calls, and experts that have not
+        answered by the deadline (or that fail) are dropped; the remaining
+        weights are renormalised per match. If no expert answers in time the
+        first one to succeed within ``ensemble_fallback_ms`` more is used, so
+        a slow request degrades to a single-model answer; after that every
+        match gets an error.
+        
+        Returns one ``(result_or_exception, routing_confidence, metadata)``
+        tuple per match, where routing confidence is the share of ensemble
+        weight that contributed.
+        """
+        start_time = time.time()
+        deadline_ms = self.ensemble_deadline_ms if deadline_ms is None else deadline_ms
+        
+        experts = [
+            model for model in available_models
+            if prediction_type in model.supported_prediction_types
+        ]
+        if not experts:
+            error = RuntimeError(f"No models support {prediction_type.value}")
+            return [(error, 0.0, {}) for _ in matches]
+        
+        # A cancelled expert keeps its worker until the model returns, so
+        # submitting to a saturated lane would leave yet more abandoned work
+        # there. Only if every lane is busy is the whole set submitted.
+        dropped: Dict[str, str] = {}
+        idle = [
+            model for model in experts
+            if self.inference_executor.has_idle_worker(model.model_type)
+        ]
+        if idle:
+            for model in experts:
+                if model not in idle:
+                    dropped[model.model_type.value] = "busy"
+            experts_run = idle
+        else:
+            experts_run = experts
+        
+        tasks = {
+            asyncio.ensure_future(self._run_expert(model, matches, prediction_type)): model
+            for model in experts_run
         }
-        self.routing_history.append({
-            "timestamp": datetime.utcnow(),
-            "match_id": match_details.match_id,
-            "selected_model": selected_model.model_type.value,
-            "confidence": confidence,
-            "strategy": self.strategy.value
-        })
+        done, pending = await asyncio.wait(tasks, timeout=deadline_ms / 1000)
+        
+        fallback_until = time.monotonic() + self.ensemble_fallback_ms / 1000
+        while pending and not any(self._expert_succeeded(task, matches) for task in done):
+            remaining = fallback_until - time.monotonic()
+            if remaining <= 0:
+                break
+            finished, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            done |= finished
+        
+        for task in pending:
+            task.cancel()
+        
+        expert_results: Dict[ModelType, List[PredictionResult]] = {}
+        expert_latency_ms: Dict[str, float] = {}
+        for task, model in tasks.items():
+            model_name = model.model_type.value
+            if task in pending:
+                dropped[model_name] = "deadline"
+            elif not self._expert_succeeded(task, matches):
+                error = task.exception()
+                dropped[model_name] = f"error: {error}" if error else "error: result count mismatch"
+            else:
+                expert_results[model.model_type], expert_latency_ms[model_name] = task.result()
+        
+        routing_time = (time.time() - start_time) * 1000
+        ensemble_router: EnsembleWeightedRouter = self.routers[RoutingStrategy.ENSEMBLE_WEIGHTED]
+        available_model_types = [model.model_type for model in available_models]
+        outcomes = []
+        
+        for index, match_details in enumerate(matches):
+            if not expert_results:
+                error = RuntimeError(f"No ensemble expert answered: {dropped}")
+                outcomes.append((error, 0.0, {}))
+                continue
+            
+            context = await self._create_routing_context(match_details)
+            weights = ensemble_router.weights(
+                context, [model.model_type for model in experts]
+            )
+            results = {
+                model_type: predictions[index]
+                for model_type, predictions in expert_results.items()
+            }
+            blended, used_weights = self._blend(match_details, prediction_type, results, weights)
+            
+            total_weight = sum(weights.values())
+            confidence = (
+                sum(weights.get(model_type, 0.0) for model_type in results) / total_weight
+                if total_weight else 1.0
+            )
+            blended.model_metadata["ensemble"] = {
+                "weights": {model_type.value: w for model_type, w in used_weights.items()},
+                "expert_latency_ms": expert_latency_ms,
+                "dropped": dropped,
+                "deadline_ms": deadline_ms
+            }
+            
+            routing_metadata = {
+                "strategy": RoutingStrategy.ENSEMBLE_WEIGHTED.value,
+                "selected_model": ModelType.MOE_ENSEMBLE.value,
+                "routing_confidence": confidence,
+                "routing_time_ms": routing_time,
+                "context": {
+                    "rivalry_score": context.team_rivalry_score,
+                    "match_importance": context.match_importance,
+                    "season_stage": context.season_stage,
+                    "h2h_matches": context.historical_h2h_matches
+                },
+                "available_models": [m.value for m in available_model_types],
+                "ensemble_experts": [model_type.value for model_type in results],
+                "ensemble_dropped": list(dropped)
+            }
+            self.routing_history.record(
+                match_details.match_id,
+                ModelType.MOE_ENSEMBLE,
+                confidence,
+                RoutingStrategy.ENSEMBLE_WEIGHTED.value,
+                routing_time
+            )
+            outcomes.append((blended, confidence, routing_metadata))
         
         logger.info(
-            f"MoE routing selected {selected_model.model_type.value}",
-            extra=routing_metadata
+            f"MoE ensemble blended {len(expert_results)}/{len(experts)} experts",
+            extra={
+                "matches": len(matches),
+                "expert_latency_ms": expert_latency_ms,
+                "dropped": dropped
+            }
         )
         
-        return selected_model, confidence, routing_metadata
+        return outcomes
+    
+    async def _run_expert(
+        self,
+        model: PredictionModel,
+        matches: List[MatchDetails],
+        prediction_type: PredictionType
+    ) -> Tuple[List[PredictionResult], float]:
+        """Run one expert over the batch and time it."""
+        start_time = time.perf_counter()
+        
+        if len(matches) == 1:
+            results = [
+                await self.inference_executor.predict(model, matches[0], prediction_type)
+            ]
+        else:
+            results = list(
+                await self.inference_executor.predict_batch(model, matches, prediction_type)
+            )
+        
+        return results, (time.perf_counter() - start_time) * 1000
+    
+    @staticmethod
+    def _expert_succeeded(task: asyncio.Future, matches: List[MatchDetails]) -> bool:
+        """Return whether an expert finished with one result per match."""
+        return (
+            task.done()
+            and not task.cancelled()
+            and task.exception() is None
+            and len(task.result()[0]) == len(matches)
+        )
+    
+    def _blend(
+        self,
+        match_details: MatchDetails,
+        prediction_type: PredictionType,
+        results: Dict[ModelType, PredictionResult],
+        weights: Dict[ModelType, float]
+    ) -> Tuple[PredictionResult, Dict[ModelType, float]]:
+        """Combine expert results with weights renormalised over the survivors."""
+        total = sum(weights.get(model_type, 0.0) for model_type in results)
+        if total > 0:
+            used_weights = {
+                model_type: weights.get(model_type, 0.0) / total for model_type in results
+            }
+        else:
+            used_weights = {model_type: 1.0 / len(results) for model_type in results}
+        
+        probabilities: Dict[str, float] = {}
+        for model_type, result in results.items():
+            for outcome, probability in result.probabilities.items():
+                probabilities[outcome] = (
+                    probabilities.get(outcome, 0.0) + used_weights[model_type] * probability
+                )
+        
+        def weighted(attribute: str) -> Optional[float]:
+            values = {
+                model_type: getattr(result, attribute)
+                for model_type, result in results.items()
+                if getattr(result, attribute) is not None
+            }
+            weight = sum(used_weights[model_type] for model_type in values)
+            if not values or weight <= 0:
+                return None
+            return sum(used_weights[m] * v for m, v in values.items()) / weight
+        
+        winners = {winner.value for winner in Winner}
+        candidates = {k: v for k, v in probabilities.items() if k in winners}
+        if candidates:
+            predicted_winner = Winner(max(candidates, key=candidates.get))
+        else:
+            votes: Dict[Winner, float] = {}
+            for model_type, result in results.items():
+                votes[result.predicted_winner] = (
+                    votes.get(result.predicted_winner, 0.0) + used_weights[model_type]
+                )
+            predicted_winner = max(votes, key=votes.get)
+        
+        features_used = sorted({
+            feature
+            for result in results.values()
+            for feature in (result.features_used or [])
+        })
+        
+        blended = PredictionResult(
+            prediction_id="",
+            model_type=ModelType.MOE_ENSEMBLE,
+            prediction_type=prediction_type,
+            match_details=match_details,
+            predicted_winner=predicted_winner,
+            probabilities=probabilities,
+            confidence=candidates.get(predicted_winner.value, weighted("confidence") or 0.0),
+            predicted_margin=weighted("predicted_margin"),
+            predicted_total_points=weighted("predicted_total_points"),
+            features_used=features_used,
+            model_metadata={},
+            processing_time_ms=max(
+                (result.processing_time_ms or 0.0) for result in results.values()
+            )
+        )
+        return blended, used_weights
     
     async def _create_routing_context(self, match_details: MatchDetails) -> RoutingContext:
         """Create routing context from match details."""
         
-        rivalry_score = self._calculate_rivalry_score(
-            match_details.team_home, 
-            match_details.team_away
-        )
+        team_home = match_details.team_home
+        team_away = match_details.team_away
         
         match_importance = self._calculate_match_importance(match_details)
         season_stage = self._determine_season_stage(match_details.match_date)
         
         return RoutingContext(
             match_details=match_details,
-            team_rivalry_score=rivalry_score,
-            historical_h2h_matches=self._estimate_h2h_matches(
-                match_details.team_home, 
-                match_details.team_away
-            ),
+            team_rivalry_score=self.team_pairs.rivalry_score(team_home, team_away),
+            historical_h2h_matches=self.team_pairs.head_to_head_matches(team_home, team_away),
+            venue_advantage=self.team_pairs.venue_advantage(team_home, team_away),
             match_importance=match_importance,
             season_stage=season_stage,
             data_availability={
@@ -369,21 +955,6 @@ class MixtureOfExpertsRouter:
             }
         )
     
-    def _calculate_rivalry_score(self, team_home: str, team_away: str) -> float:
-        """Calculate rivalry score between teams."""
-        rivalries = {
-            ("Brisbane Broncos", "Melbourne Storm"): 0.8,
-            ("Sydney Roosters", "South Sydney Rabbitohs"): 0.9,
-            ("Manly Sea Eagles", "Sydney Roosters"): 0.7,
-            ("Penrith Panthers", "Parramatta Eels"): 0.7,
-            ("St George Dragons", "Canterbury Bulldogs"): 0.6,
-        }
-        rivalry = rivalries.get((team_home, team_away), 0.0)
-        if rivalry == 0.0:
-            rivalry = rivalries.get((team_away, team_home), 0.0)
-        
-        return rivalry
-    
     def _calculate_match_importance(self, match_details: MatchDetails) -> float:
         """Calculate match importance."""
         importance = 0.5
@@ -413,28 +984,10 @@ class MixtureOfExpertsRouter:
         else:
             return "off_season"
     
-    def _estimate_h2h_matches(self, team_home: str, team_away: str) -> int:
-        """Estimate historical head-to-head matches."""
-        return np.random.randint(10, 30)
-    
     def get_routing_statistics(self) -> Dict[str, Any]:
         """Get routing statistics."""
-        if not self.routing_history:
-            return {}
-        
-        recent_history = self.routing_history[-100:]
-        
-        model_usage = {}
-        for decision in recent_history:
-            model = decision["selected_model"]
-            model_usage[model] = model_usage.get(model, 0) + 1
-        
-        avg_confidence = sum(d["confidence"] for d in recent_history) / len(recent_history)
-        
-        return {
-            "total_routing_decisions": len(self.routing_history),
-            "recent_model_usage": model_usage,
-            "average_routing_confidence": avg_confidence,
-            "current_strategy": self.strategy.value,
-            "last_routing_time": recent_history[-1]["timestamp"].isoformat() if recent_history else None
-        }
\ No newline at end of file
+        statistics = self.routing_history.statistics()
+        if statistics:
+            statistics["current_strategy"] = self.strategy.value
+            statistics["routing_cache"] = self.routing_cache.statistics()
+        return statistics
\ No newline at end of file
@@ -0,0 +1,417 @@
+"""Online model performance tracking from prediction outcomes."""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..domain.prediction_models import ModelType, Winner
+from ..domain.teams import canonical_team
+from .moe_router import (
+    PLAYOFF_STAGES, ModelPerformanceHistory, PerformanceBasedRouter
+)
+from shared.monitoring.telemetry import MetricsCollector
+from shared.events.event_bus import (
+    EventBus, EventType, MatchResultRecordedEvent, PredictionCompletedEvent,
+    PredictionFeedbackEvent
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Scenarios tracked per model; names match ModelPerformanceHistory's
+# strong/weak scenario lists. "all" covers every outcome.
+SCENARIOS = ("all", "rivalry_matches", "high_stakes_games", "playoffs", "regular_season")
+
+_OUTCOMES = (Winner.HOME, Winner.AWAY, Winner.DRAW)
+_OUTCOME_CODES = {winner: code for code, winner in enumerate(_OUTCOMES)}
+_MODELS = list(ModelType)
+_MODEL_CODES = {model_type: code for code, model_type in enumerate(_MODELS)}
+
+# Horizons of the decayed counters: a short and a long memory.
+RECENT, OVERALL = 0, 1
+# Last axis of the counters.
+_WEIGHT, _CORRECT, _BRIER = 0, 1, 2
+
+# Home team, away team and match day.
+Fixture = Tuple[str, str, Optional[date]]
+
+
+def fixture_key(
+    team_home: str,
+    team_away: str,
+    match_date: Union[datetime, str, None]
+) -> Fixture:
+    """Identify a fixture by its canonical teams and match day.
+
+    ``match_date`` may be a datetime or an ISO string as carried by events.
+    The day is enough to tell a pair's fixtures apart, and ignores
+    differences in the recorded kick-off time.
+    """
+    if isinstance(match_date, str):
+        match_date = datetime.fromisoformat(match_date)
+    return (
+        canonical_team(team_home),
+        canonical_team(team_away),
+        match_date.date() if match_date is not None else None
+    )
+
+
+def prediction_scenarios(routing_context: Dict[str, Any]) -> List[str]:
+    """Return the scenarios a prediction's routing context falls into."""
+    scenarios = ["all"]
+    if routing_context.get("rivalry_score", 0.0) > 0.7:
+        scenarios.append("rivalry_matches")
+    if routing_context.get("match_importance", 0.0) > 0.8:
+        scenarios.append("high_stakes_games")
+    if routing_context.get("season_stage") in PLAYOFF_STAGES:
+        scenarios.append("playoffs")
+    else:
+        scenarios.append("regular_season")
+    return scenarios
+
+
+@dataclass
+class _PendingPrediction:
+    """A published prediction waiting for its actual result."""
+
+    model_code: int
+    scenario_codes: Tuple[int, ...]
+    probabilities: np.ndarray
+    predicted_code: int
+    fixture: Fixture
+
+
+class OnlinePerformanceTracker:
+    """Per-model, per-scenario accuracy, Brier score and calibration.
+
+    Completed predictions are held until their result arrives, either from
+    a user's feedback or from the recorded match result. A model is scored
+    once per fixture however many predictions it served for it (repeat
+    requests and cache re-serves publish fresh prediction ids), so popular
+    fixtures do not outweigh the rest. Each outcome
+    updates exponentially decayed counters (weight, correct, Brier sum)
+    for the model in every scenario the prediction belonged to, with a
+    short and a long half-life, plus a decayed reliability histogram for
+    calibration. Memory is fixed by the number of models, scenarios and
+    calibration bins; pending predictions, and the scored (model, fixture)
+    pairs remembered to ignore late duplicates, are capped at
+    ``max_pending``.
+    An update touches a handful of array cells, so it runs inline on
+    every event.
+
+    Once a model has ``min_weight`` of recent evidence, every
+    ``push_interval``-th outcome pushes a fresh ``ModelPerformanceHistory``
+    into the performance-based router, replacing the configured priors
+    without a restart. Pushes are spaced out because each one also drops
+    the router's memoised decisions.
+    """
+
+    def __init__(
+        self,
+        router: Optional[PerformanceBasedRouter] = None,
+        half_life: float = 50.0,
+        long_half_life: float = 1000.0,
+        calibration_bins: int = 10,
+        min_weight: float = 20.0,
+        scenario_margin: float = 0.03,
+        max_pending: int = 50_000,
+        push_interval: int = 10
+    ):
+        """Allocate the counters."""
+        self.router = router
+        self.min_weight = min_weight
+        self.scenario_margin = scenario_margin
+        self.max_pending = max_pending
+        self.push_interval = push_interval
+        self.calibration_bins = calibration_bins
+
+        # (horizon, 1) so a counter row decays with one broadcast multiply.
+        self._decay = np.array([[0.5 ** (1.0 / half_life)], [0.5 ** (1.0 / long_half_life)]])
+        # Weight, correct and Brier sums per model, scenario and horizon.
+        self._counters = np.zeros((len(_MODELS), len(SCENARIOS), 2, 3))
+        # Reliability histogram per model: weight, confidence and correct
+        # sums per confidence bin, on the recent horizon.
+        self._calibration = np.zeros((len(_MODELS), 3, calibration_bins))
+        self._outcomes = np.zeros(len(_MODELS), dtype=np.int64)
+
+        self._pending: "OrderedDict[str, _PendingPrediction]" = OrderedDict()
+        self._pending_by_fixture: Dict[Fixture, List[str]] = {}
+        self._scored: "OrderedDict[Tuple[int, Fixture], None]" = OrderedDict()
+
+    async def subscribe(self, event_bus: EventBus) -> None:
+        """Register for predictions, feedback and match results.
+        
+        The counters live in process memory, so every replica joins its own
+        consumer group and sees every event.
+        """
+        consumer_group = "prediction-engine-performance"
+        await event_bus.subscribe(
+            EventType.PREDICTION_COMPLETED, self.handle_prediction, consumer_group,
+            broadcast=True
+        )
+        await event_bus.subscribe(
+            EventType.PREDICTION_FEEDBACK_RECEIVED, self.handle_feedback, consumer_group,
+            broadcast=True
+        )
+        await event_bus.subscribe(
+            EventType.MATCH_RESULT_RECORDED, self.handle_match_result, consumer_group,
+            broadcast=True
+        )
+
+    async def handle_prediction(self, event: PredictionCompletedEvent) -> None:
+        """Hold a completed prediction until its result arrives."""
+        for prediction in event.predictions:
+            if not prediction.get("probabilities"):
+                continue
+            self.record_prediction(
+                event.prediction_id,
+                ModelType(prediction["model"]),
+                prediction["probabilities"],
+                event.team_home,
+                event.team_away,
+                event.match_date,
+                prediction.get("routing_context") or {}
+            )
+
+    async def handle_feedback(self, event: PredictionFeedbackEvent) -> None:
+        """Score a prediction against a user-submitted result."""
+        self.record_outcome(event.prediction_id, event.actual_winner)
+
+    async def handle_match_result(self, event: MatchResultRecordedEvent) -> None:
+        """Score every pending prediction for the fixture."""
+        self.record_fixture_result(
+            event.team_home, event.team_away, event.match_date,
+            event.home_score, event.away_score
+        )
+
+    def record_prediction(
+        self,
+        prediction_id: str,
+        model_type: ModelType,
+        probabilities: Dict[str, float],
+        team_home: str,
+        team_away: str,
+        match_date: Union[datetime, str, None],
+        routing_context: Dict[str, Any]
+    ) -> None:
+        """Hold a prediction until its result is known.
+        
+        A redelivered prediction replaces the one already pending. A
+        prediction for a fixture the model was already scored on is
+        ignored.
+        """
+        fixture = fixture_key(team_home, team_away, match_date)
+        model_code = _MODEL_CODES[model_type]
+        if (model_code, fixture) in self._scored:
+            return
+        previous = self._pending.pop(prediction_id, None)
+        if previous is not None:
+            self._forget_fixture(prediction_id, previous.fixture)
+        vector = np.array([probabilities.get(winner.value, 0.0) for winner in _OUTCOMES])
+        self._pending[prediction_id] = _PendingPrediction(
+            model_code=model_code,
+            scenario_codes=tuple(
+                SCENARIOS.index(name) for name in prediction_scenarios(routing_context)
+            ),
+            probabilities=vector,
+            predicted_code=int(vector.argmax()),
+            fixture=fixture
+        )
+        self._pending_by_fixture.setdefault(fixture, []).append(prediction_id)
+
+        while len(self._pending) > self.max_pending:
+            evicted_id, evicted = self._pending.popitem(last=False)
+            self._forget_fixture(evicted_id, evicted.fixture)
+
+    def record_outcome(self, prediction_id: str, actual_winner: str) -> bool:
+        """Score one pending prediction; returns False if unknown or unparseable.
+
+        ``actual_winner`` may be ``home``/``away``/``draw`` or a team name.
+        """
+        pending = self._pending.get(prediction_id)
+        if pending is None:
+            return False
+        actual = self._parse_winner(actual_winner, pending.fixture)
+        if actual is None:
+            logger.warning(
+                f"Ignoring feedback with unrecognised winner {actual_winner!r}",
+                extra={"prediction_id": prediction_id}
+            )
+            return False
+
+        self._settle(prediction_id, _OUTCOME_CODES[actual])
+        return True
+
+    def record_fixture_result(
+        self,
+        team_home: str,
+        team_away: str,
+        match_date: Union[datetime, str, None],
+        home_score: int,
+        away_score: int
+    ) -> int:
+        """Score each model's latest pending prediction for a fixture.
+
+        Returns how many predictions were scored, one per model.
+        """
+        if home_score > away_score:
+            actual = Winner.HOME
+        elif home_score < away_score:
+            actual = Winner.AWAY
+        else:
+            actual = Winner.DRAW
+
+        fixture = fixture_key(team_home, team_away, match_date)
+        scored = 0
+        for prediction_id in reversed(self._pending_by_fixture.get(fixture, [])[:]):
+            if prediction_id in self._pending:
+                self._settle(prediction_id, _OUTCOME_CODES[actual])
+                scored += 1
+        return scored
+
+    def _settle(self, prediction_id: str, actual_code: int) -> None:
+        """Score a pending prediction and drop its model's others for the fixture."""
+        pending = self._pending[prediction_id]
+        for other_id in self._pending_by_fixture[pending.fixture][:]:
+            if self._pending[other_id].model_code == pending.model_code:
+                del self._pending[other_id]
+                self._forget_fixture(other_id, pending.fixture)
+
+        self._scored[(pending.model_code, pending.fixture)] = None
+        while len(self._scored) > self.max_pending:
+            self._scored.popitem(last=False)
+        self._score(pending, actual_code)
+
+    def _forget_fixture(self, prediction_id: str, fixture: Fixture) -> None:
+        prediction_ids = self._pending_by_fixture.get(fixture)
+        if prediction_ids is None:
+            return
+        prediction_ids.remove(prediction_id)
+        if not prediction_ids:
+            del self._pending_by_fixture[fixture]
+
+    @staticmethod
+    def _parse_winner(actual_winner: str, fixture: Fixture) -> Optional[Winner]:
+        value = actual_winner.strip().lower()
+        if value in ("home", "away", "draw"):
+            return Winner(value)
+        if value == "tie":
+            return Winner.DRAW
+        team = canonical_team(actual_winner)
+        if team == fixture[0]:
+            return Winner.HOME
+        if team == fixture[1]:
+            return Winner.AWAY
+        return None
+
+    def _score(self, pending: _PendingPrediction, actual_code: int) -> None:
+        """Fold one outcome into the decayed counters."""
+        model = pending.model_code
+        correct = float(pending.predicted_code == actual_code)
+        target = np.zeros(len(_OUTCOMES))
+        target[actual_code] = 1.0
+        brier = float(((pending.probabilities - target) ** 2).sum())
+        update = np.array([1.0, correct, brier])
+
+        for scenario in pending.scenario_codes:
+            counters = self._counters[model, scenario]
+            counters *= self._decay
+            counters += update
+
+        confidence = float(pending.probabilities[pending.predicted_code])
+        bin_index = min(int(confidence * self.calibration_bins), self.calibration_bins - 1)
+        calibration = self._calibration[model]
+        calibration *= self._decay[RECENT, 0]
+        calibration[:, bin_index] += (1.0, confidence, correct)
+        self._outcomes[model] += 1
+
+        if (
+            self._outcomes[model] % self.push_interval == 0
+            and self._counters[model, 0, RECENT, _WEIGHT] >= self.min_weight
+        ):
+            self._push(_MODELS[model])
+
+    def _weight(self, model: int, scenario: int, horizon: int = RECENT) -> float:
+        return float(self._counters[model, scenario, horizon, _WEIGHT])
+
+    def _accuracy(self, model: int, scenario: int, horizon: int) -> float:
+        weight, correct, _ = self._counters[model, scenario, horizon]
+        return float(correct / weight) if weight else 0.0
+
+    def _calibration_error(self, model: int) -> float:
+        weight, confidence, correct = self._calibration[model]
+        total = weight.sum()
+        if not total:
+            return 0.0
+        return float(np.abs(correct - confidence).sum() / total)
+
+    def model_statistics(self, model_type: ModelType) -> Dict[str, Any]:
+        """Return a model's tracked performance."""
+        model = _MODEL_CODES[model_type]
+        weight, _, brier = self._counters[model, 0, RECENT]
+        return {
+            "outcomes": int(self._outcomes[model]),
+            "recent_accuracy": self._accuracy(model, 0, RECENT),
+            "overall_accuracy": self._accuracy(model, 0, OVERALL),
+            "brier_score": float(brier / weight) if weight else None,
+            "calibration_error": self._calibration_error(model),
+            "scenario_accuracy": {
+                name: self._accuracy(model, scenario, RECENT)
+                for scenario, name in enumerate(SCENARIOS)
+                if self._weight(model, scenario)
+            }
+        }
+
+    def statistics(self) -> Dict[str, Any]:
+        """Return tracked performance for every model with outcomes."""
+        return {
+            "pending_predictions": len(self._pending),
+            "models": {
+                model_type.value: self.model_statistics(model_type)
+                for model_type in _MODELS
+                if self._outcomes[_MODEL_CODES[model_type]]
+            }
+        }
+
+    def _push(self, model_type: ModelType) -> None:
+        """Replace the router's history for a model with tracked figures."""
+        model = _MODEL_CODES[model_type]
+        statistics = self.model_statistics(model_type)
+        MetricsCollector.update_model_accuracy(model_type.value, statistics["recent_accuracy"])
+        MetricsCollector.update_model_calibration(
+            model_type.value, statistics["brier_score"], statistics["calibration_error"]
+        )
+        if self.router is None:
+            return
+
+        # Scenarios without enough evidence keep their configured labels.
+        previous = self.router.performance_history.get(model_type)
+        strong = list(previous.strong_scenarios) if previous else []
+        weak = list(previous.weak_scenarios) if previous else []
+        baseline = statistics["recent_accuracy"]
+        for scenario, name in enumerate(SCENARIOS[1:], start=1):
+            if self._weight(model, scenario) < self.min_weight:
+                continue
+            strong = [label for label in strong if label != name]
+            weak = [label for label in weak if label != name]
+            accuracy = self._accuracy(model, scenario, RECENT)
+            if accuracy > baseline + self.scenario_margin:
+                strong.append(name)
+            elif accuracy < baseline - self.scenario_margin:
+                weak.append(name)
+
+        self.router.update_performance(ModelPerformanceHistory(
+            model_type=model_type,
+            recent_accuracy=statistics["recent_accuracy"],
+            overall_accuracy=statistics["overall_accuracy"],
+            confidence_calibration=1.0 - statistics["calibration_error"],
+            strong_scenarios=strong,
+            weak_scenarios=weak,
+            last_updated=datetime.utcnow(),
+            prediction_count=statistics["outcomes"],
+            brier_score=statistics["brier_score"]
+        ))
@@ -4,26 +4,57 @@ import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Mapping, Optional, Any, Union
 import uuid
 
 from ..domain.prediction_models import (
     PredictionModel, ModelType, PredictionType, MatchDetails, 
     PredictionResult, ModelRepository
 )
+from ..domain.teams import NRL_CLUBS
+from ..infrastructure.model_store import process_memory
+from ..infrastructure.prediction_cache import PredictionCache
+from ..infrastructure.team_pairs import TeamPairMatrix
 from ..infrastructure.models.lr_predictor import LogisticRegressionPredictor
 from ..infrastructure.models.lightgbm_predictor import LightGBMPredictor
 from ..infrastructure.models.transformer_predictor import TransformerPredictor
 from ..infrastructure.models.stacker_predictor import StackerPredictor
 from ..infrastructure.models.rl_predictor import ReinforcementLearningPredictor
+from .inference_executor import ExecutionMode, InferenceExecutor, InferenceQueueFullError
+from .model_hot_swap import check_probabilities
+from .model_loader import LazyModelLoader
+from .model_readiness import ModelReadinessRegistry
 from .moe_router import MixtureOfExpertsRouter, RoutingStrategy
-from ....shared.events.event_bus import (
+from .performance_tracker import OnlinePerformanceTracker
+from shared.events.event_bus import (
     EventBus, PredictionRequestedEvent, PredictionCompletedEvent, EventType
 )
 
 logger = logging.getLogger(__name__)
 
 
+# Artifact each model is rebuilt from when it changes on disk.
+MODEL_ARTIFACTS = {
+    ModelType.LOGISTIC_REGRESSION: "logistic_regression_model.joblib",
+    ModelType.LIGHTGBM: "lgbm_match_winner_model.joblib",
+    ModelType.STACKER: "stacker_match_winner_model.joblib",
+}
+
+# Result metadata describing the request that produced it, not the prediction.
+REQUEST_METADATA_KEYS = (
+    "prediction_service_id", "total_available_models", "service_prediction_count", "repository_id"
+)
+
+# Routing metadata still true of a prediction when it is served from the cache.
+CACHED_ROUTING_KEYS = ("strategy", "selected_model", "routing_confidence", "forced", "context")
+
+# Fixtures a reloaded model must predict sensibly before it serves traffic.
+CANARY_MATCHES = [
+    MatchDetails(NRL_CLUBS[i], NRL_CLUBS[-1 - i], datetime(2024, 3, 1 + i))
+    for i in range(4)
+]
+
+
 class PredictionService:
     """Unified prediction service with MoE routing."""
     
@@ -31,66 +62,197 @@ class PredictionService:
         self,
         model_repository: Optional[ModelRepository] = None,
         event_bus: Optional[EventBus] = None,
-        routing_strategy: RoutingStrategy = RoutingStrategy.PERFORMANCE_BASED
+        routing_strategy: RoutingStrategy = RoutingStrategy.PERFORMANCE_BASED,
+        prediction_cache: Optional[PredictionCache] = None,
+        ensemble_deadline_ms: float = 250.0,
+        ensemble_fallback_ms: float = 1000.0,
+        gating_weights_path: Optional[str] = None,
+        team_pairs: Optional[TeamPairMatrix] = None,
+        execution_mode: ExecutionMode = ExecutionMode.INLINE,
+        inference_workers: int = 2,
+        max_inference_queue_depth: int = 32
     ):
         """Initialize prediction service."""
         self.model_repository = model_repository
         self.event_bus = event_bus
-        self.moe_router = MixtureOfExpertsRouter(routing_strategy)
+        self.prediction_cache = prediction_cache
         
+        # Models are constructed and warmed in the background by
+        # start_model_loading; until then only the factories are known.
+        self.model_factories = self._model_factories()
         self.models: Dict[ModelType, PredictionModel] = {}
-        self._initialize_models()
+        self.readiness = ModelReadinessRegistry()
+        self.model_loader = LazyModelLoader(self.model_factories, self.models, self.readiness)
+        
+        # Process workers rebuild each model from its factory, so every
+        # predictor must construct without arguments.
+        self.inference_executor = InferenceExecutor(
+            execution_mode,
+            workers=inference_workers,
+            max_queue_depth=max_inference_queue_depth,
+            model_factories=self.model_factories
+        )
+        self.moe_router = MixtureOfExpertsRouter(
+            routing_strategy, 
+            ensemble_deadline_ms=ensemble_deadline_ms,
+            ensemble_fallback_ms=ensemble_fallback_ms,
+            gating_weights_path=gating_weights_path,
+            team_pairs=team_pairs,
+            inference_executor=self.inference_executor
+        )
+        self.performance_tracker = OnlinePerformanceTracker(
+            self.moe_router.routers[RoutingStrategy.PERFORMANCE_BASED]
+        )
         
         self.prediction_count = 0
         self.total_processing_time = 0.0
         self.model_usage_stats = {model_type: 0 for model_type in ModelType}
+        # Version tag of the artifact each model was built from, part of
+        # the cache fingerprint so results of a replaced artifact are not
+        # served even when its model_version string is unchanged.
+        self.artifact_versions: Dict[ModelType, str] = {}
+        self._swaps = 0
         
-    def _initialize_models(self):
-        """Initialize all prediction models."""
-        try:
-            self.models[ModelType.LOGISTIC_REGRESSION] = LogisticRegressionPredictor()
-            logger.info("Initialized Logistic Regression predictor")
-        except Exception as e:
-            logger.error(f"Failed to initialize LR predictor: {e}")
+    @staticmethod
+    def _model_factories() -> Dict[ModelType, Callable[[], PredictionModel]]:
+        """Return the predictor class for each model type, in default load order."""
+        return {
+            ModelType.LOGISTIC_REGRESSION: LogisticRegressionPredictor,
+            ModelType.LIGHTGBM: LightGBMPredictor,
+            ModelType.TRANSFORMER: TransformerPredictor,
+            ModelType.STACKER: StackerPredictor,
+            ModelType.REINFORCEMENT_LEARNING: ReinforcementLearningPredictor
+        }
+    
+    def traffic_share(self) -> Dict[ModelType, float]:
+        """Return each model's share of the predictions served so far."""
+        total = sum(self.model_usage_stats.values())
+        if not total:
+            return {}
+        return {
+            model_type: count / total
+            for model_type, count in self.model_usage_stats.items() if count
+        }
+    
+    def start_model_loading(
+        self,
+        traffic_share: Optional[Mapping[ModelType, float]] = None
+    ) -> None:
+        """Load models in the background, highest traffic share first.
         
-        try:
-            self.models[ModelType.LIGHTGBM] = LightGBMPredictor()
-            logger.info("Initialized LightGBM predictor")
-        except Exception as e:
-            logger.error(f"Failed to initialize LightGBM predictor: {e}")
+        Falls back to the traffic this service has served when no share is
+        given, and to the default order when it has served none.
+        """
+        self.model_loader.start(traffic_share or self.traffic_share())
+    
+    async def validate_model(self, model: PredictionModel) -> None:
+        """Raise unless ``model`` returns valid predictions for the canary fixtures.
         
-        try:
-            self.models[ModelType.TRANSFORMER] = TransformerPredictor()
-            logger.info("Initialized Transformer predictor")
-        except Exception as e:
-            logger.error(f"Failed to initialize Transformer predictor: {e}")
+        The model should already be warm (loaded in the caller's worker
+        thread); ``is_ready`` is only checked here.
+        """
+        if not await model.is_ready():
+            raise RuntimeError(f"{model.model_name} is not ready")
+        results = await model.predict_batch(CANARY_MATCHES, PredictionType.MATCH_WINNER)
+        if len(results) != len(CANARY_MATCHES):
+            raise RuntimeError(
+                f"{model.model_name} returned {len(results)} canary results "
+                f"for {len(CANARY_MATCHES)} fixtures"
+            )
+        for result in results:
+            check_probabilities(result.probabilities)
+            if not 0.0 <= result.confidence <= 1.0:
+                raise ValueError(f"confidence out of range: {result.confidence}")
+    
+    async def swap_model(
+        self, 
+        model: PredictionModel, 
+        artifact_version: Optional[str] = None
+    ) -> None:
+        """Serve ``model`` in place of the current model of its type.
         
-        try:
-            self.models[ModelType.STACKER] = StackerPredictor()
-            logger.info("Initialized Stacker predictor")
-        except Exception as e:
-            logger.error(f"Failed to initialize Stacker predictor: {e}")
+        Process workers are restarted on the new artifact first, then the
+        references are replaced without yielding, so every request sees
+        either the old model or the new one. Routing decisions and cached
+        predictions made with the old model are dropped afterwards.
+        ``artifact_version`` identifies the new artifact in the cache
+        fingerprint; without one a per-process swap count is used.
+        """
+        model_type = model.model_type
+        await self.inference_executor.reload(model_type)
         
-        try:
-            self.models[ModelType.REINFORCEMENT_LEARNING] = ReinforcementLearningPredictor()
-            logger.info("Initialized RL predictor")
-        except Exception as e:
-            logger.error(f"Failed to initialize RL predictor: {e}")
+        self._swaps += 1
+        self.artifact_versions[model_type] = artifact_version or f"swap-{self._swaps}"
+        self.models[model_type] = model
+        self.readiness.register(model)
+        self.readiness.mark(model_type, True, source="swap")
+        self.model_loader.states[model_type] = "loaded"
         
-        logger.info(f"Initialized {len(self.models)} prediction models")
+        self.moe_router.routing_cache.clear()
+        await self.invalidate_prediction_cache()
     
     async def get_available_models(self) -> List[PredictionModel]:
-        """Get list of available and ready models."""
-        available_models = []
+        """Get list of available and ready models from the readiness snapshot."""
+        if not self.model_loader.started:
+            # Used without start-up loading, e.g. from a script: load now.
+            await self.model_loader.wait()
+        return list(self.readiness.ready_models())
+    
+    def _model_version_fingerprint(self, available_models: List[PredictionModel]) -> str:
+        """Identify the routing strategy and model versions a result depends on."""
+        versions = sorted(
+            f"{model.model_type.value}:{model.model_version}"
+            f":{self.artifact_versions.get(model.model_type, '')}"
+            for model in available_models
+        )
+        return f"{self.moe_router.strategy.value}|{'|'.join(versions)}"
+    
+    async def invalidate_prediction_cache(self, match_id: Optional[str] = None) -> None:
+        """Drop cached predictions for one match, or all of them after a model reload."""
+        if not self.prediction_cache:
+            return
+        if match_id:
+            await self.prediction_cache.invalidate_match(match_id)
+        else:
+            await self.prediction_cache.invalidate_all()
+    
+    async def _serve_cached(
+        self,
+        cached: PredictionResult,
+        match_details: MatchDetails,
+        prediction_type: PredictionType,
+        prediction_id: str,
+        start_time: float,
+        total_available_models: int,
+        user_id: Optional[str]
+    ) -> PredictionResult:
+        """Persist and publish a cached prediction under its own prediction id.
         
-        for model in self.models.values():
-            try:
-                if await model.is_ready():
-                    available_models.append(model)
-            except Exception as e:
-                logger.warning(f"Model {model.model_type.value} not ready: {e}")
+        Metadata of the request that first produced the result (service
+        ids, repository id, routing timings) is dropped; the routing
+        decision and its context are kept so feedback on the new id is
+        attributed like any other prediction.
+        """
+        metadata = cached.model_metadata
+        original_routing = metadata.pop("moe_routing", None) or {}
+        for key in REQUEST_METADATA_KEYS:
+            metadata.pop(key, None)
+        routing_metadata = {
+            key: original_routing[key] for key in CACHED_ROUTING_KEYS if key in original_routing
+        }
         
-        return available_models
+        return await self._finalise_prediction(
+            cached,
+            match_details,
+            prediction_type,
+            cached.model_type,
+            routing_metadata.get("routing_confidence", 1.0),
+            routing_metadata,
+            prediction_id,
+            start_time,
+            total_available_models,
+            user_id
+        )
     
     async def predict(
         self,
@@ -104,23 +266,7 @@ class PredictionService:
         start_time = time.time()
         prediction_id = str(uuid.uuid4())
         
-        if self.event_bus:
-            try:
-                event = PredictionRequestedEvent(
-                    event_id="",
-                    event_type=EventType.PREDICTION_REQUESTED,
-                    timestamp=None,
-                    correlation_id=prediction_id,
-                    source_service="prediction-engine",
-                    user_id=user_id or "anonymous",
-                    team_home=match_details.team_home,
-                    team_away=match_details.team_away,
-                    prediction_types=[prediction_type.value],
-                    match_date=match_details.match_date.strftime('%Y-%m-%d')
-                )
-                await self.event_bus.publish(event)
-            except Exception as e:
-                logger.warning(f"Failed to publish prediction requested event: {e}")
+        await self._publish_requested(prediction_id, match_details, prediction_type, user_id)
         
         try:
             available_models = await self.get_available_models()
@@ -128,6 +274,17 @@ class PredictionService:
             if not available_models:
                 raise RuntimeError("No prediction models are available")
             
+            model_version = self._model_version_fingerprint(available_models)
+            if self.prediction_cache:
+                cached = await self.prediction_cache.get(
+                    match_details, prediction_type, model_version, force_model
+                )
+                if cached:
+                    return await self._serve_cached(
+                        cached, match_details, prediction_type, prediction_id,
+                        start_time, len(available_models), user_id
+                    )
+            
             if force_model:
                 selected_model = None
                 for model in available_models:
@@ -145,78 +302,156 @@ class PredictionService:
                     "routing_confidence": 1.0,
                     "forced": True
                 }
+            elif self.moe_router.strategy == RoutingStrategy.ENSEMBLE_WEIGHTED:
+                [(prediction_result, routing_confidence, routing_metadata)] = (
+                    await self.moe_router.predict_ensemble(
+                        [match_details], available_models, prediction_type
+                    )
+                )
+                if isinstance(prediction_result, Exception):
+                    raise prediction_result
+                selected_model = None
             else:
                 selected_model, routing_confidence, routing_metadata = await self.moe_router.route_prediction(
                     match_details, available_models, prediction_type
                 )
             
-            prediction_result = await selected_model.predict(match_details, prediction_type)
-            
-            if prediction_result.model_metadata is None:
-                prediction_result.model_metadata = {}
-            
-            prediction_result.model_metadata.update({
-                "moe_routing": routing_metadata,
-                "prediction_service_id": prediction_id,
-                "total_available_models": len(available_models),
-                "service_prediction_count": self.prediction_count + 1
-            })
-            
-            self.prediction_count += 1
-            processing_time = (time.time() - start_time) * 1000
-            self.total_processing_time += processing_time
-            self.model_usage_stats[selected_model.model_type] += 1
-            
-            if self.model_repository:
-                try:
-                    saved_id = await self.model_repository.save_prediction(prediction_result)
-                    prediction_result.model_metadata["repository_id"] = saved_id
-                except Exception as e:
-                    logger.warning(f"Failed to save prediction to repository: {e}")
-            
-            if self.event_bus:
-                try:
-                    predictions_data = [{
-                        "type": prediction_type.value,
-                        "predicted_winner": prediction_result.predicted_winner.value,
-                        "confidence": prediction_result.confidence,
-                        "model": selected_model.model_type.value
-                    }]
-                    
-                    event = PredictionCompletedEvent(
-                        event_id="",
-                        event_type=EventType.PREDICTION_COMPLETED,
-                        timestamp=None,
-                        correlation_id=prediction_id,
-                        source_service="prediction-engine",
-                        prediction_id=prediction_result.prediction_id,
-                        user_id=user_id or "anonymous",
-                        team_home=match_details.team_home,
-                        team_away=match_details.team_away,
-                        predictions=predictions_data,
-                        processing_time_ms=processing_time
-                    )
-                    await self.event_bus.publish(event)
-                except Exception as e:
-                    logger.warning(f"Failed to publish prediction completed event: {e}")
+            if selected_model:
+                prediction_result = await self.inference_executor.predict(
+                    selected_model, match_details, prediction_type
+                )
             
-            logger.info(
-                f"Prediction completed successfully",
-                extra={
-                    "prediction_id": prediction_result.prediction_id,
-                    "model_used": selected_model.model_type.value,
-                    "routing_confidence": routing_confidence,
-                    "processing_time_ms": processing_time,
-                    "predicted_winner": prediction_result.predicted_winner.value
-                }
+            prediction_result = await self._finalise_prediction(
+                prediction_result,
+                match_details,
+                prediction_type,
+                selected_model.model_type if selected_model else ModelType.MOE_ENSEMBLE,
+                routing_confidence,
+                routing_metadata,
+                prediction_id,
+                start_time,
+                len(available_models),
+                user_id
             )
             
+            if self.prediction_cache:
+                await self.prediction_cache.set(
+                    match_details, prediction_type, model_version,
+                    prediction_result, force_model
+                )
+            
             return prediction_result
             
         except Exception as e:
             logger.error(f"Prediction failed: {e}", exc_info=True)
             raise
     
+    async def _publish_requested(
+        self,
+        prediction_id: str,
+        match_details: MatchDetails,
+        prediction_type: PredictionType,
+        user_id: Optional[str]
+    ) -> None:
+        """Publish a prediction requested event, if an event bus is configured."""
+        if not self.event_bus:
+            return
+        
+        try:
+            event = PredictionRequestedEvent(
+                event_id="",
+                event_type=EventType.PREDICTION_REQUESTED,
+                timestamp=None,
+                correlation_id=prediction_id,
+                source_service="prediction-engine",
+                user_id=user_id or "anonymous",
+                team_home=match_details.team_home,
+                team_away=match_details.team_away,
+                prediction_types=[prediction_type.value],
+                match_date=match_details.match_date.strftime('%Y-%m-%d')
+            )
+            await self.event_bus.publish(event)
+        except Exception as e:
+            logger.warning(f"Failed to publish prediction requested event: {e}")
+    
+    async def _finalise_prediction(
+        self,
+        prediction_result: PredictionResult,
+        match_details: MatchDetails,
+        prediction_type: PredictionType,
+        model_type: ModelType,
+        routing_confidence: float,
+        routing_metadata: Dict[str, Any],
+        prediction_id: str,
+        start_time: float,
+        total_available_models: int,
+        user_id: Optional[str]
+    ) -> PredictionResult:
+        """Attach routing metadata, update stats, persist and publish a result."""
+        if prediction_result.model_metadata is None:
+            prediction_result.model_metadata = {}
+        
+        prediction_result.model_metadata.update({
+            "moe_routing": routing_metadata,
+            "prediction_service_id": prediction_id,
+            "total_available_models": total_available_models,
+            "service_prediction_count": self.prediction_count + 1
+        })
+        
+        self.prediction_count += 1
+        processing_time = (time.time() - start_time) * 1000
+        self.total_processing_time += processing_time
+        self.model_usage_stats[model_type] += 1
+        
+        if self.model_repository:
+            try:
+                saved_id = await self.model_repository.save_prediction(prediction_result)
+                prediction_result.model_metadata["repository_id"] = saved_id
+            except Exception as e:
+                logger.warning(f"Failed to save prediction to repository: {e}")
+        
+        if self.event_bus:
+            try:
+                predictions_data = [{
+                    "type": prediction_type.value,
+                    "predicted_winner": prediction_result.predicted_winner.value,
+                    "confidence": prediction_result.confidence,
+                    "probabilities": prediction_result.probabilities,
+                    "model": model_type.value,
+                    "routing_context": routing_metadata.get("context", {})
+                }]
+                
+                event = PredictionCompletedEvent(
+                    event_id="",
+                    event_type=EventType.PREDICTION_COMPLETED,
+                    timestamp=None,
+                    correlation_id=prediction_id,
+                    source_service="prediction-engine",
+                    prediction_id=prediction_result.prediction_id,
+                    user_id=user_id or "anonymous",
+                    team_home=match_details.team_home,
+                    team_away=match_details.team_away,
+                    predictions=predictions_data,
+                    processing_time_ms=processing_time,
+                    match_date=match_details.match_date.isoformat()
+                )
+                await self.event_bus.publish(event)
+            except Exception as e:
+                logger.warning(f"Failed to publish prediction completed event: {e}")
+        
+        logger.info(
+            f"Prediction completed successfully",
+            extra={
+                "prediction_id": prediction_result.prediction_id,
+                "model_used": model_type.value,
+                "routing_confidence": routing_confidence,
+                "processing_time_ms": processing_time,
+                "predicted_winner": prediction_result.predicted_winner.value
+            }
+        )
+        
+        return prediction_result
+    
     async def predict_batch(
         self,
         matches: List[MatchDetails],
@@ -224,27 +459,23 @@ class PredictionService:
         user_id: Optional[str] = None,
         max_concurrent: int = 5
     ) -> List[PredictionResult]:
-        """Make predictions for multiple matches concurrently."""
+        """Make predictions for multiple matches with one batched call per model."""
         
         logger.info(f"Starting batch prediction for {len(matches)} matches")
         
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def predict_single(match_details: MatchDetails) -> Optional[PredictionResult]:
-            async with semaphore:
-                try:
-                    return await self.predict(match_details, prediction_type, user_id)
-                except Exception as e:
-                    logger.error(f"Batch prediction failed for match {match_details.match_id}: {e}")
-                    return None
-        
-        tasks = [predict_single(match) for match in matches]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await self.predict_grouped(
+            matches, prediction_type, [user_id] * len(matches), max_concurrent
+        )
         
         successful_results = [
             result for result in results 
             if isinstance(result, PredictionResult)
         ]
+        if not successful_results:
+            # Nothing was served because of load: let the caller back off.
+            for result in results:
+                if isinstance(result, InferenceQueueFullError):
+                    raise result
         
         logger.info(
             f"Batch prediction completed: {len(successful_results)}/{len(matches)} successful",
@@ -257,19 +488,201 @@ class PredictionService:
         
         return successful_results
     
+    async def predict_grouped(
+        self,
+        matches: List[MatchDetails],
+        prediction_type: PredictionType,
+        user_ids: List[Optional[str]],
+        max_concurrent: int = 5
+    ) -> List[Union[PredictionResult, Exception]]:
+        """Route all matches in one call, then run one predict_batch per selected model.
+        
+        Results are aligned with ``matches``; a match that could not be
+        predicted gets the exception instead of a result. If a model's
+        batched call fails, its group falls back to individual predictions;
+        if its inference queue is full, the group gets the
+        ``InferenceQueueFullError`` and the other groups are unaffected.
+        With the ensemble strategy every expert instead predicts all the
+        uncached matches as one batch and the router blends the results.
+        """
+        start_time = time.time()
+        results: List[Union[PredictionResult, Exception]] = [None] * len(matches)
+        prediction_ids = [str(uuid.uuid4()) for _ in matches]
+        
+        for prediction_id, match_details, user_id in zip(prediction_ids, matches, user_ids):
+            await self._publish_requested(prediction_id, match_details, prediction_type, user_id)
+        
+        available_models = await self.get_available_models()
+        if not available_models:
+            error = RuntimeError("No prediction models are available")
+            return [error] * len(matches)
+        
+        model_version = self._model_version_fingerprint(available_models)
+        # Per match: (model type, routing confidence, routing metadata).
+        routes: List[Optional[tuple]] = [None] * len(matches)
+        groups: Dict[ModelType, List[int]] = {}
+        models_by_type: Dict[ModelType, PredictionModel] = {}
+        batch_sizes: Dict[str, int] = {}
+        uncached: List[int] = []
+        cache_hits: List[int] = []
+        
+        for index, match_details in enumerate(matches):
+            if self.prediction_cache:
+                cached = await self.prediction_cache.get(
+                    match_details, prediction_type, model_version
+                )
+                if cached:
+                    results[index] = cached
+                    cache_hits.append(index)
+                    continue
+            uncached.append(index)
+        
+        if self.moe_router.strategy == RoutingStrategy.ENSEMBLE_WEIGHTED and uncached:
+            # Every expert predicts the uncached matches as one batch.
+            outcomes = await self.moe_router.predict_ensemble(
+                [matches[i] for i in uncached], available_models, prediction_type
+            )
+            for index, (outcome, routing_confidence, routing_metadata) in zip(uncached, outcomes):
+                results[index] = outcome
+                if isinstance(outcome, PredictionResult):
+                    routes[index] = (ModelType.MOE_ENSEMBLE, routing_confidence, routing_metadata)
+            batch_sizes = {ModelType.MOE_ENSEMBLE.value: len(uncached)}
+            uncached = []
+        
+        if uncached:
+            try:
+                decisions = await self.moe_router.route_batch(
+                    [matches[i] for i in uncached], available_models, prediction_type
+                )
+            except Exception as e:
+                logger.error(f"Routing failed for {len(uncached)} matches: {e}")
+                for index in uncached:
+                    results[index] = e
+                decisions = []
+            
+            for index, (selected_model, routing_confidence, routing_metadata) in zip(
+                uncached, decisions
+            ):
+                routes[index] = (selected_model.model_type, routing_confidence, routing_metadata)
+                models_by_type[selected_model.model_type] = selected_model
+                groups.setdefault(selected_model.model_type, []).append(index)
+        
+        if groups:
+            batch_sizes = {
+                model_type.value: len(indexes) for model_type, indexes in groups.items()
+            }
+        
+        async def run_group(model_type: ModelType, indexes: List[int]) -> None:
+            model = models_by_type[model_type]
+            group_matches = [matches[i] for i in indexes]
+            
+            try:
+                group_results = await self.inference_executor.predict_batch(
+                    model, group_matches, prediction_type
+                )
+                if len(group_results) != len(group_matches):
+                    raise RuntimeError(
+                        f"{model_type.value} returned {len(group_results)} results "
+                        f"for {len(group_matches)} matches"
+                    )
+            except InferenceQueueFullError as e:
+                # Retrying match by match would only add to the backlog;
+                # the other groups and the cache hits are still served.
+                logger.warning(f"Inference queue full for {model_type.value}: {e}")
+                group_results = [e] * len(group_matches)
+            except Exception as e:
+                logger.warning(
+                    f"Batched inference failed for {model_type.value}, "
+                    f"falling back to individual predictions: {e}"
+                )
+                semaphore = asyncio.Semaphore(max_concurrent)
+                
+                async def predict_single(match_details: MatchDetails) -> PredictionResult:
+                    async with semaphore:
+                        return await self.inference_executor.predict(
+                            model, match_details, prediction_type
+                        )
+                
+                group_results = await asyncio.gather(
+                    *(predict_single(match) for match in group_matches),
+                    return_exceptions=True
+                )
+            
+            for index, result in zip(indexes, group_results):
+                results[index] = result
+        
+        await asyncio.gather(
+            *(run_group(model_type, indexes) for model_type, indexes in groups.items())
+        )
+        
+        for index in cache_hits:
+            try:
+                results[index] = await self._serve_cached(
+                    results[index],
+                    matches[index],
+                    prediction_type,
+                    prediction_ids[index],
+                    start_time,
+                    len(available_models),
+                    user_ids[index]
+                )
+            except Exception as e:
+                logger.error(f"Batch prediction failed for match {matches[index].match_id}: {e}")
+                results[index] = e
+        
+        for index, result in enumerate(results):
+            if not isinstance(result, PredictionResult):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Batch prediction failed for match {matches[index].match_id}: {result}"
+                    )
+                continue
+            if routes[index] is None:
+                continue  # served from the prediction cache
+            
+            model_type, routing_confidence, routing_metadata = routes[index]
+            routing_metadata["batch_sizes"] = batch_sizes
+            routing_metadata["batch_size"] = batch_sizes[model_type.value]
+            
+            try:
+                results[index] = await self._finalise_prediction(
+                    result,
+                    matches[index],
+                    prediction_type,
+                    model_type,
+                    routing_confidence,
+                    routing_metadata,
+                    prediction_ids[index],
+                    start_time,
+                    len(available_models),
+                    user_ids[index]
+                )
+            except Exception as e:
+                logger.error(f"Batch prediction failed for match {matches[index].match_id}: {e}")
+                results[index] = e
+                continue
+            
+            if self.prediction_cache:
+                await self.prediction_cache.set(
+                    matches[index], prediction_type, model_version, results[index]
+                )
+        
+        return results
+    
     async def get_model_status(self) -> Dict[str, Any]:
         """Get status of all prediction models."""
         model_status = {}
         
         for model_type, model in self.models.items():
             try:
-                is_ready = await model.is_ready()
+                is_ready = self.readiness.is_ready(model_type)
                 metrics = await model.get_model_metrics() if is_ready else None
                 
                 model_status[model_type.value] = {
                     "name": model.model_name,
                     "version": model.model_version,
                     "is_ready": is_ready,
+                    "state": self.model_loader.state(model_type),
                     "supported_prediction_types": [pt.value for pt in model.supported_prediction_types],
                     "usage_count": self.model_usage_stats.get(model_type, 0),
                     "metrics": {
@@ -284,6 +697,14 @@ class PredictionService:
                     "error": str(e)
                 }
         
+        for model_type in self.model_factories:
+            if model_type not in self.models:
+                model_status[model_type.value] = {
+                    "name": model_type.value,
+                    "is_ready": False,
+                    "state": self.model_loader.state(model_type)
+                }
+        
         return model_status
     
     async def get_service_metrics(self) -> Dict[str, Any]:
@@ -301,17 +722,21 @@ class PredictionService:
                 "total_predictions": self.prediction_count,
                 "average_processing_time_ms": avg_processing_time,
                 "available_models": len(available_models),
-                "total_models": len(self.models)
+                "total_models": len(self.model_factories)
             },
             "model_usage_stats": {
                 model_type.value: count 
                 for model_type, count in self.model_usage_stats.items()
             },
             "routing_statistics": routing_stats,
+            "inference_executor": self.inference_executor.statistics(),
+            "process_memory": process_memory(),
+            "model_performance": self.performance_tracker.statistics(),
             "model_availability": {
-                model.model_type.value: await model.is_ready()
-                for model in self.models.values()
-            }
+                model_type.value: self.readiness.is_ready(model_type)
+                for model_type in self.model_factories
+            },
+            "model_loading": self.model_loader.status()
         }
     
     async def get_feature_importance_comparison(self) -> Dict[str, Dict[str, float]]:
@@ -330,32 +755,25 @@ class PredictionService:
         return feature_importance_comparison
     
     async def health_check(self) -> Dict[str, Any]:
-        """Comprehensive health check of the prediction service."""
+        """Health of the prediction service, read from the readiness snapshot."""
         available_models = await self.get_available_models()
         
-        health_status = {
-            "status": "healthy" if available_models else "unhealthy",
+        if available_models:
+            health_status = "healthy"
+        elif not self.model_loader.finished:
+            health_status = "loading"
+        else:
+            health_status = "unhealthy"
+        
+        return {
+            "status": health_status,
             "timestamp": datetime.utcnow().isoformat(),
             "available_models": len(available_models),
-            "total_models": len(self.models),
+            "total_models": len(self.model_factories),
             "total_predictions": self.prediction_count,
             "moe_router_ready": self.moe_router is not None,
             "event_bus_connected": self.event_bus is not None,
-            "model_repository_connected": self.model_repository is not None
-        }
-        
-        health_status["model_health"] = {}
-        for model_type, model in self.models.items():
-            try:
-                is_ready = await model.is_ready()
-                health_status["model_health"][model_type.value] = {
-                    "ready": is_ready,
-                    "name": model.model_name
-                }
-            except Exception as e:
-                health_status["model_health"][model_type.value] = {
-                    "ready": False,
-                    "error": str(e)
-                }
-        
-        return health_status
\ No newline at end of file
+            "model_repository_connected": self.model_repository is not None,
+            "model_health": self.readiness.snapshot(),
+            "model_loading": self.model_loader.status()
+        }
\ No newline at end of file
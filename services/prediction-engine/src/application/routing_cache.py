@@ -0,0 +1,81 @@
+"""Bounded memo of routing decisions keyed by routing-context fingerprint."""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from ..domain.prediction_models import ModelType
+
+
+RoutingDecision = Tuple[ModelType, float]
+
+
+class RoutingDecisionCache:
+    """LRU of ``(model, confidence)`` decisions for identical routing inputs.
+
+    Keys combine a routing context fingerprint with the ordered tuple of
+    available models. Every entry belongs to an epoch (strategy, router,
+    router version, day) supplied by the caller; when the epoch changes, for
+    example because the router's performance history was updated, the
+    whole cache is dropped rather than serving decisions made from old
+    state.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """Initialise an empty cache."""
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, RoutingDecision]" = OrderedDict()
+        self._epoch: Optional[Hashable] = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def set_epoch(self, epoch: Hashable) -> None:
+        """Drop every entry if ``epoch`` differs from the current one."""
+        if epoch != self._epoch:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._epoch = epoch
+
+    def get(self, key: Hashable) -> Optional[RoutingDecision]:
+        """Return a cached decision, counting the hit or miss."""
+        decision = self._entries.get(key)
+        if decision is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return decision
+
+    def put(self, key: Hashable, decision: RoutingDecision) -> None:
+        """Store a decision, evicting the least recently used entry."""
+        self._entries[key] = decision
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+
+    def statistics(self) -> Dict[str, Any]:
+        """Return hit, miss and size counters."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "invalidations": self.invalidations
+        }
@@ -0,0 +1,212 @@
+"""Fixed-capacity routing decision log with streaming statistics."""
+
+import math
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..domain.prediction_models import ModelType
+
+
+_MODELS = list(ModelType)
+_MODEL_CODES = {model_type: code for code, model_type in enumerate(_MODELS)}
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (HDR-style) with bounded memory.
+
+    Buckets grow geometrically by ``2 ** (1 / buckets_per_doubling)``, so
+    every recorded value lands in a bucket within a few percent of it.
+    Recording is O(1) and quantiles read a fixed number of buckets.
+    """
+
+    def __init__(
+        self,
+        min_ms: float = 0.001,
+        max_ms: float = 60_000.0,
+        buckets_per_doubling: int = 16
+    ):
+        """Allocate the bucket counters."""
+        self.min_ms = min_ms
+        self._scale = buckets_per_doubling / math.log(2)
+        self._n_buckets = int(math.ceil(math.log(max_ms / min_ms) * self._scale)) + 2
+        self._counts = np.zeros(self._n_buckets, dtype=np.int64)
+        self.count = 0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Add one observation."""
+        if value_ms <= self.min_ms:
+            bucket = 0
+        else:
+            bucket = min(
+                int(math.log(value_ms / self.min_ms) * self._scale) + 1,
+                self._n_buckets - 1
+            )
+        self._counts[bucket] += 1
+        self.count += 1
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def quantiles(self, *qs: float) -> List[Optional[float]]:
+        """Return the upper bound of the bucket holding each quantile.
+
+        Values beyond the range share the last bucket, which has no upper
+        bound; quantiles landing there report the largest value recorded.
+        """
+        if not self.count:
+            return [None] * len(qs)
+        cumulative = np.cumsum(self._counts)
+        ranks = [max(1, int(math.ceil(q * self.count))) for q in qs]
+        return [
+            self.max_ms if bucket == self._n_buckets - 1
+            else min(self.min_ms * math.exp(int(bucket) / self._scale), self.max_ms)
+            for bucket in np.searchsorted(cumulative, ranks)
+        ]
+
+
+class RoutingHistory:
+    """Ring buffer of routing decisions plus O(1) running statistics.
+
+    Decisions are stored column-wise in preallocated NumPy arrays (time,
+    model code, confidence, latency, strategy code, match id) that wrap
+    after ``capacity`` entries, so memory is fixed however long the process
+    runs. Usage counts and the confidence sum over the last
+    ``recent_window`` decisions are updated as entries enter and leave the
+    window; all-time usage, an EWMA of confidence and a latency histogram
+    are kept alongside. Statistics therefore never rescan the log.
+
+    Decisions are recorded from the event loop thread only, so no locking
+    is needed.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10_000,
+        recent_window: int = 100,
+        ewma_alpha: float = 0.05
+    ):
+        """Preallocate the ring buffer columns."""
+        if recent_window > capacity:
+            raise ValueError("recent_window cannot exceed capacity")
+
+        self.capacity = capacity
+        self.recent_window = recent_window
+        self.ewma_alpha = ewma_alpha
+
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._models = np.zeros(capacity, dtype=np.int8)
+        self._confidences = np.zeros(capacity, dtype=np.float32)
+        self._latencies = np.zeros(capacity, dtype=np.float32)
+        self._strategies = np.zeros(capacity, dtype=np.int8)
+        self._match_ids = np.empty(capacity, dtype=object)
+        self._strategy_names: List[str] = []
+        self._strategy_codes: Dict[str, int] = {}
+        self._total = 0
+
+        self._usage = np.zeros(len(_MODELS), dtype=np.int64)
+        self._recent_usage = np.zeros(len(_MODELS), dtype=np.int64)
+        self._recent_confidence_sum = 0.0
+        self._ewma_confidence: Optional[float] = None
+        self.latency = LatencyHistogram()
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    @property
+    def total(self) -> int:
+        """Return the number of decisions recorded since start-up."""
+        return self._total
+
+    def record(
+        self,
+        match_id: str,
+        model_type: ModelType,
+        confidence: float,
+        strategy: str,
+        latency_ms: float = 0.0,
+        timestamp: Optional[float] = None
+    ) -> None:
+        """Append one routing decision."""
+        slot = self._total % self.capacity
+        code = _MODEL_CODES[model_type]
+
+        if self._total >= self.recent_window:
+            leaving = (self._total - self.recent_window) % self.capacity
+            self._recent_usage[self._models[leaving]] -= 1
+            self._recent_confidence_sum -= float(self._confidences[leaving])
+
+        strategy_code = self._strategy_codes.get(strategy)
+        if strategy_code is None:
+            strategy_code = len(self._strategy_names)
+            self._strategy_codes[strategy] = strategy_code
+            self._strategy_names.append(strategy)
+
+        self._timestamps[slot] = time.time() if timestamp is None else timestamp
+        self._models[slot] = code
+        self._confidences[slot] = confidence
+        self._latencies[slot] = latency_ms
+        self._strategies[slot] = strategy_code
+        self._match_ids[slot] = match_id
+        self._total += 1
+
+        self._usage[code] += 1
+        self._recent_usage[code] += 1
+        # Sum the stored float32 value so removal cancels it exactly.
+        self._recent_confidence_sum += float(self._confidences[slot])
+        self._ewma_confidence = (
+            confidence if self._ewma_confidence is None
+            else self._ewma_confidence + self.ewma_alpha * (confidence - self._ewma_confidence)
+        )
+        self.latency.record(latency_ms)
+
+    def recent(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` latest decisions, oldest first."""
+        count = min(limit, len(self))
+        slots = (self._total - count + np.arange(count)) % self.capacity
+        return [
+            {
+                "timestamp": datetime.utcfromtimestamp(self._timestamps[slot]),
+                "match_id": self._match_ids[slot],
+                "selected_model": _MODELS[self._models[slot]].value,
+                "confidence": float(self._confidences[slot]),
+                "routing_time_ms": float(self._latencies[slot]),
+                "strategy": self._strategy_names[self._strategies[slot]]
+            }
+            for slot in slots
+        ]
+
+    def statistics(self) -> Dict[str, Any]:
+        """Return running statistics without scanning the log."""
+        if not self._total:
+            return {}
+
+        recent_count = min(self._total, self.recent_window)
+        last_slot = (self._total - 1) % self.capacity
+        p50, p90, p99 = self.latency.quantiles(0.5, 0.9, 0.99)
+
+        return {
+            "total_routing_decisions": self._total,
+            "recent_model_usage": {
+                model_type.value: int(count)
+                for model_type, count in zip(_MODELS, self._recent_usage) if count
+            },
+            "model_usage": {
+                model_type.value: int(count)
+                for model_type, count in zip(_MODELS, self._usage) if count
+            },
+            "average_routing_confidence": self._recent_confidence_sum / recent_count,
+            "ewma_routing_confidence": self._ewma_confidence,
+            "routing_latency_ms": {
+                "p50": p50,
+                "p90": p90,
+                "p99": p99,
+                "max": self.latency.max_ms
+            },
+            "last_routing_time": datetime.utcfromtimestamp(
+                self._timestamps[last_slot]
+            ).isoformat(),
+            "history_size": len(self),
+            "history_capacity": self.capacity
+        }
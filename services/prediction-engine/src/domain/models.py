@@ -1,5 +1,6 @@
 """Domain models for prediction engine."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
@@ -52,6 +53,16 @@ class PredictionFeatures:
     additional_features: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class PredictionFeatureBatch:
+    """Features for a batch of matches, row-aligned with the input matches."""
+    
+    matches: List[Match]
+    feature_names: List[str]
+    matrix: Any  # numpy array of shape (len(matches), len(feature_names))
+    features: List[PredictionFeatures]
+
+
 @dataclass
 class PredictionOutput:
     """Output from a prediction model."""
@@ -114,6 +125,15 @@ class FeatureEngineer(ABC):
     ) -> PredictionFeatures:
         """Extract features for prediction."""
         pass
+    
+    @abstractmethod
+    async def extract_features_batch(
+        self, 
+        matches: List[Match], 
+        historical_data: List[Match]
+    ) -> PredictionFeatureBatch:
+        """Extract features for many matches as one feature matrix."""
+        pass
 
 
 class ModelRepository(ABC):
@@ -163,6 +183,12 @@ class DataRepository(ABC):
         """Get current team statistics."""
         pass
     
+    async def get_team_stats_many(self, team_names: List[str]) -> List[TeamStats]:
+        """Get statistics for several teams, in the order requested."""
+        return list(await asyncio.gather(
+            *(self.get_team_stats(team_name) for team_name in team_names)
+        ))
+    
     @abstractmethod
     async def get_recent_matches(
         self, 
@@ -0,0 +1,75 @@
+"""NRL club registry."""
+
+from typing import Dict, Tuple
+
+
+# The 17 clubs of the current competition, in a stable order used for
+# dense per-team arrays (ratings, form buffers, pairwise matrices).
+NRL_CLUBS: Tuple[str, ...] = (
+    "Brisbane Broncos",
+    "Canberra Raiders",
+    "Canterbury Bulldogs",
+    "Cronulla Sharks",
+    "Dolphins",
+    "Gold Coast Titans",
+    "Manly Sea Eagles",
+    "Melbourne Storm",
+    "Newcastle Knights",
+    "New Zealand Warriors",
+    "North Queensland Cowboys",
+    "Parramatta Eels",
+    "Penrith Panthers",
+    "South Sydney Rabbitohs",
+    "St George Illawarra Dragons",
+    "Sydney Roosters",
+    "Wests Tigers",
+)
+
+# Alternative spellings seen in fixtures, odds feeds and older data.
+TEAM_ALIASES: Dict[str, str] = {
+    "Broncos": "Brisbane Broncos",
+    "Raiders": "Canberra Raiders",
+    "Bulldogs": "Canterbury Bulldogs",
+    "Canterbury-Bankstown Bulldogs": "Canterbury Bulldogs",
+    "Sharks": "Cronulla Sharks",
+    "Cronulla-Sutherland Sharks": "Cronulla Sharks",
+    "Redcliffe Dolphins": "Dolphins",
+    "Titans": "Gold Coast Titans",
+    "Sea Eagles": "Manly Sea Eagles",
+    "Manly-Warringah Sea Eagles": "Manly Sea Eagles",
+    "Storm": "Melbourne Storm",
+    "Knights": "Newcastle Knights",
+    "Warriors": "New Zealand Warriors",
+    "Cowboys": "North Queensland Cowboys",
+    "Eels": "Parramatta Eels",
+    "Panthers": "Penrith Panthers",
+    "Rabbitohs": "South Sydney Rabbitohs",
+    "St George Dragons": "St George Illawarra Dragons",
+    "Dragons": "St George Illawarra Dragons",
+    "Roosters": "Sydney Roosters",
+    "Tigers": "Wests Tigers",
+}
+
+
+# Traditional rivalries as a routing signal in [0, 1]: how far a fixture
+# departs from form-driven outcomes.
+RIVALRY_SCORES: Dict[Tuple[str, str], float] = {
+    ("Brisbane Broncos", "Melbourne Storm"): 0.8,
+    ("Sydney Roosters", "South Sydney Rabbitohs"): 0.9,
+    ("Manly Sea Eagles", "Sydney Roosters"): 0.7,
+    ("Penrith Panthers", "Parramatta Eels"): 0.7,
+    ("St George Illawarra Dragons", "Canterbury Bulldogs"): 0.6,
+}
+
+# Traditional rivalries as a feature multiplier; other pairs are 1.0.
+RIVALRY_FACTORS: Dict[Tuple[str, str], float] = {
+    ("Brisbane Broncos", "North Queensland Cowboys"): 1.5,
+    ("Sydney Roosters", "South Sydney Rabbitohs"): 1.8,
+    ("Canterbury Bulldogs", "Parramatta Eels"): 1.3,
+}
+
+
+def canonical_team(team_name: str) -> str:
+    """Return the canonical club name for a team name or alias."""
+    name = team_name.strip()
+    return TEAM_ALIASES.get(name, name)
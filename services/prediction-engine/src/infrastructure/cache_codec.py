@@ -0,0 +1,210 @@
+"""Compact struct-packed binary codec for cached domain objects.
+
+Values are written little-endian with a one-byte format version. Strings are
+length-prefixed UTF-8 and optional fields are tracked with a presence bitmask,
+so a cached match or team-stats record is a few dozen bytes and decodes
+without any JSON parsing.
+"""
+
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from ..domain.models import Match, TeamStats
+
+
+CODEC_VERSION = 1
+
+_HEADER = struct.Struct("<BI")          # version, record count
+_STR_LEN = struct.Struct("<H")
+_MATCH = struct.Struct("<qBBhhii")      # ticks, tz flag, presence, scores, season, round
+_STATS = struct.Struct("<dddBddi")      # elo, scored, conceded, presence, rates, injuries
+
+_ENVELOPE = struct.Struct("<Bdf")       # magic, soft expiry (epoch s), recompute s
+_ENVELOPE_MAGIC = 0xE1
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class CodecError(ValueError):
+    """Raised when a cached payload cannot be decoded."""
+
+
+def _pack_str(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return _STR_LEN.pack(len(data)) + data
+
+
+def _unpack_str(buffer: memoryview, offset: int) -> Tuple[str, int]:
+    (length,) = _STR_LEN.unpack_from(buffer, offset)
+    offset += _STR_LEN.size
+    if offset + length > len(buffer):
+        raise CodecError("Truncated string")
+    return bytes(buffer[offset:offset + length]).decode("utf-8"), offset + length
+
+
+def _encode_date(value: datetime) -> Tuple[int, int]:
+    """Return microsecond ticks and a flag recording whether value was UTC-aware."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return (value - _EPOCH) // timedelta(microseconds=1), 1
+    return (value - _EPOCH) // timedelta(microseconds=1), 0
+
+
+def _decode_date(ticks: int, aware: int) -> datetime:
+    try:
+        value = _EPOCH + timedelta(microseconds=ticks)
+    except OverflowError:
+        raise CodecError(f"Date ticks out of range: {ticks}")
+    return value.replace(tzinfo=timezone.utc) if aware else value
+
+
+def _check_header(buffer: memoryview) -> int:
+    if len(buffer) < _HEADER.size:
+        raise CodecError("Payload too short")
+    version, count = _HEADER.unpack_from(buffer, 0)
+    if version != CODEC_VERSION:
+        raise CodecError(f"Unsupported codec version {version}")
+    return count
+
+
+def encode_matches(matches: List[Match]) -> bytes:
+    """Encode a list of matches."""
+    parts = [_HEADER.pack(CODEC_VERSION, len(matches))]
+
+    for match in matches:
+        presence = (
+            (match.venue is not None)
+            | (match.home_score is not None) << 1
+            | (match.away_score is not None) << 2
+            | (match.season is not None) << 3
+            | (match.round_number is not None) << 4
+        )
+        ticks, aware = _encode_date(match.match_date)
+        parts.append(_MATCH.pack(
+            ticks,
+            aware,
+            presence,
+            match.home_score or 0,
+            match.away_score or 0,
+            match.season or 0,
+            match.round_number or 0
+        ))
+        parts.append(_pack_str(match.match_id))
+        parts.append(_pack_str(match.team_home))
+        parts.append(_pack_str(match.team_away))
+        if match.venue is not None:
+            parts.append(_pack_str(match.venue))
+
+    return b"".join(parts)
+
+
+def decode_matches(payload: bytes) -> List[Match]:
+    """Decode a list of matches written by ``encode_matches``."""
+    buffer = memoryview(payload)
+    count = _check_header(buffer)
+    offset = _HEADER.size
+    matches = []
+
+    try:
+        for _ in range(count):
+            ticks, aware, presence, home, away, season, round_number = (
+                _MATCH.unpack_from(buffer, offset)
+            )
+            offset += _MATCH.size
+            match_id, offset = _unpack_str(buffer, offset)
+            team_home, offset = _unpack_str(buffer, offset)
+            team_away, offset = _unpack_str(buffer, offset)
+            venue: Optional[str] = None
+            if presence & 1:
+                venue, offset = _unpack_str(buffer, offset)
+
+            matches.append(Match(
+                match_id=match_id,
+                team_home=team_home,
+                team_away=team_away,
+                match_date=_decode_date(ticks, aware),
+                venue=venue,
+                home_score=home if presence & 2 else None,
+                away_score=away if presence & 4 else None,
+                season=season if presence & 8 else None,
+                round_number=round_number if presence & 16 else None
+            ))
+    except struct.error as e:
+        raise CodecError(f"Truncated match payload: {e}")
+    except UnicodeDecodeError as e:
+        raise CodecError(f"Corrupt string in match payload: {e}")
+
+    return matches
+
+
+def encode_team_stats(stats: TeamStats) -> bytes:
+    """Encode a team statistics record."""
+    presence = (
+        (stats.home_win_rate is not None)
+        | (stats.away_win_rate is not None) << 1
+        | (stats.injury_count is not None) << 2
+    )
+    if any(len(result) != 1 for result in stats.recent_form):
+        raise CodecError("Recent form entries must be single W/L/D characters")
+    form = "".join(stats.recent_form)
+
+    return b"".join((
+        _HEADER.pack(CODEC_VERSION, 1),
+        _STATS.pack(
+            stats.elo_rating,
+            stats.avg_points_scored,
+            stats.avg_points_conceded,
+            presence,
+            stats.home_win_rate or 0.0,
+            stats.away_win_rate or 0.0,
+            stats.injury_count or 0
+        ),
+        _pack_str(stats.team_name),
+        _pack_str(form)
+    ))
+
+
+def decode_team_stats(payload: bytes) -> TeamStats:
+    """Decode a team statistics record written by ``encode_team_stats``."""
+    buffer = memoryview(payload)
+    _check_header(buffer)
+    offset = _HEADER.size
+
+    try:
+        elo, scored, conceded, presence, home_rate, away_rate, injuries = (
+            _STATS.unpack_from(buffer, offset)
+        )
+        offset += _STATS.size
+        team_name, offset = _unpack_str(buffer, offset)
+        form, offset = _unpack_str(buffer, offset)
+    except struct.error as e:
+        raise CodecError(f"Truncated team stats payload: {e}")
+    except UnicodeDecodeError as e:
+        raise CodecError(f"Corrupt string in team stats payload: {e}")
+
+    return TeamStats(
+        team_name=team_name,
+        elo_rating=elo,
+        recent_form=list(form),
+        avg_points_scored=scored,
+        avg_points_conceded=conceded,
+        home_win_rate=home_rate if presence & 1 else None,
+        away_win_rate=away_rate if presence & 2 else None,
+        injury_count=injuries if presence & 4 else None
+    )
+
+
+def wrap_envelope(payload: bytes, expires_at: float, recompute_seconds: float) -> bytes:
+    """Prefix a payload with its soft expiry and how long it took to compute."""
+    return _ENVELOPE.pack(_ENVELOPE_MAGIC, expires_at, recompute_seconds) + payload
+
+
+def unwrap_envelope(data: bytes) -> Tuple[float, float, bytes]:
+    """Split an enveloped value into soft expiry, recompute time and payload."""
+    if len(data) < _ENVELOPE.size:
+        raise CodecError("Envelope too short")
+    magic, expires_at, recompute_seconds = _ENVELOPE.unpack_from(data, 0)
+    if magic != _ENVELOPE_MAGIC:
+        raise CodecError("Missing cache envelope")
+    return expires_at, recompute_seconds, data[_ENVELOPE.size:]
@@ -0,0 +1,236 @@
+"""Incremental Elo ratings with point-in-time snapshots."""
+
+import math
+from bisect import bisect_right
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from ..domain.models import Match
+from ..domain.teams import NRL_CLUBS, canonical_team
+from .match_history import to_ticks
+
+
+class EloRatingEngine:
+    """Maintains a rating vector for every club, updated one result at a time.
+
+    Each completed match is an O(1) update to two entries of the rating
+    vector. Results are also appended to a columnar log (date, teams,
+    scores and the rating change they caused) and the full vector is
+    checkpointed every ``checkpoint_interval`` results. Ratings as of any
+    date are then a binary search for the log position, the nearest earlier
+    checkpoint, and a vectorised sum of at most ``checkpoint_interval``
+    rating changes, rather than a replay of the whole history.
+
+    Results normally arrive in date order. A late result is inserted at its
+    place in the log and everything after it is replayed from the nearest
+    checkpoint.
+    """
+
+    def __init__(
+        self,
+        teams: Iterable[str] = NRL_CLUBS,
+        initial_rating: float = 1500.0,
+        k_factor: float = 20.0,
+        home_advantage: float = 50.0,
+        checkpoint_interval: int = 128
+    ):
+        """Initialise every known club at the initial rating."""
+        self.initial_rating = initial_rating
+        self.k_factor = k_factor
+        self.home_advantage = home_advantage
+        self.checkpoint_interval = checkpoint_interval
+
+        self._team_ids: Dict[str, int] = {}
+        for team in teams:
+            self._team_id(team)
+        self.ratings = np.full(len(self._team_ids), initial_rating, dtype=np.float64)
+
+        self._size = 0
+        self._ticks = np.empty(0, dtype=np.int64)
+        self._home = np.empty(0, dtype=np.int16)
+        self._away = np.empty(0, dtype=np.int16)
+        self._home_scores = np.empty(0, dtype=np.int16)
+        self._away_scores = np.empty(0, dtype=np.int16)
+        self._deltas = np.empty(0, dtype=np.float64)
+
+        # Checkpoint i holds the ratings after the first
+        # _checkpoint_positions[i] logged results.
+        self._checkpoint_positions: List[int] = [0]
+        self._checkpoint_ratings: List[np.ndarray] = [self.ratings.copy()]
+        self._recorded: Set[str] = set()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def teams(self) -> List[str]:
+        """Return the clubs tracked by the engine, in rating-vector order."""
+        return list(self._team_ids)
+
+    def _team_id(self, team_name: str) -> int:
+        team_name = canonical_team(team_name)
+        team_id = self._team_ids.get(team_name)
+        if team_id is None:
+            team_id = len(self._team_ids)
+            self._team_ids[team_name] = team_id
+            if hasattr(self, "ratings"):
+                self.ratings = np.append(self.ratings, self.initial_rating)
+        return team_id
+
+    def _rating_change(
+        self,
+        ratings: np.ndarray,
+        home: int,
+        away: int,
+        home_score: int,
+        away_score: int
+    ) -> float:
+        """Return the points the home side gains (and the away side loses)."""
+        diff = float(ratings[home]) + self.home_advantage - float(ratings[away])
+        expected = 1.0 / (1.0 + 10.0 ** (-diff / 400.0))
+        margin = home_score - away_score
+        actual = 1.0 if margin > 0 else 0.5 if margin == 0 else 0.0
+        multiplier = math.log(abs(margin) + 1) if margin else 1.0
+        return self.k_factor * multiplier * (actual - expected)
+
+    def _reserve(self, size: int) -> None:
+        """Grow the log columns geometrically so appends stay amortised O(1)."""
+        capacity = len(self._ticks)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 256)
+        for name in ("_ticks", "_home", "_away", "_home_scores", "_away_scores", "_deltas"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+    def record_result(
+        self,
+        team_home: str,
+        team_away: str,
+        home_score: int,
+        away_score: int,
+        match_date: datetime,
+        match_id: Optional[str] = None
+    ) -> float:
+        """Apply a completed match and return the home side's rating change.
+
+        Results carrying a ``match_id`` that was already recorded are
+        ignored, so redelivered events do not count twice.
+        """
+        if match_id is not None:
+            if match_id in self._recorded:
+                return 0.0
+            self._recorded.add(match_id)
+
+        home = self._team_id(team_home)
+        away = self._team_id(team_away)
+        ticks = to_ticks(match_date)
+
+        self._reserve(self._size + 1)
+        position = self._size
+        if position and ticks < self._ticks[position - 1]:
+            position = int(np.searchsorted(self._ticks[:self._size], ticks, side="right"))
+            end = self._size + 1
+            for name in ("_ticks", "_home", "_away", "_home_scores", "_away_scores", "_deltas"):
+                column = getattr(self, name)
+                column[position + 1:end] = column[position:end - 1]
+
+        self._ticks[position] = ticks
+        self._home[position] = home
+        self._away[position] = away
+        self._home_scores[position] = home_score
+        self._away_scores[position] = away_score
+        self._size += 1
+
+        if position < self._size - 1:
+            self._replay_from(position)
+            return float(self._deltas[position])
+
+        delta = self._rating_change(self.ratings, home, away, home_score, away_score)
+        self._deltas[position] = delta
+        self.ratings[home] += delta
+        self.ratings[away] -= delta
+        if self._size % self.checkpoint_interval == 0:
+            self._checkpoint_positions.append(self._size)
+            self._checkpoint_ratings.append(self.ratings.copy())
+        return delta
+
+    def record_match(self, match: Match) -> float:
+        """Apply a completed ``Match``; matches without a score are ignored."""
+        if match.home_score is None or match.away_score is None:
+            return 0.0
+        return self.record_result(
+            match.team_home,
+            match.team_away,
+            match.home_score,
+            match.away_score,
+            match.match_date,
+            match.match_id
+        )
+
+    def replay(self, matches: Iterable[Match]) -> int:
+        """Apply a batch of historical matches in date order."""
+        recorded = 0
+        for match in sorted(matches, key=lambda m: to_ticks(m.match_date)):
+            if match.home_score is not None and match.away_score is not None:
+                self.record_match(match)
+                recorded += 1
+        return recorded
+
+    def _replay_from(self, position: int) -> None:
+        """Recompute rating changes and checkpoints from a log position on."""
+        keep = bisect_right(self._checkpoint_positions, position)
+        del self._checkpoint_positions[keep:]
+        del self._checkpoint_ratings[keep:]
+
+        ratings = self._ratings_at(position)
+        for i in range(position, self._size):
+            home, away = int(self._home[i]), int(self._away[i])
+            delta = self._rating_change(
+                ratings, home, away, int(self._home_scores[i]), int(self._away_scores[i])
+            )
+            self._deltas[i] = delta
+            ratings[home] += delta
+            ratings[away] -= delta
+            if (i + 1) % self.checkpoint_interval == 0:
+                self._checkpoint_positions.append(i + 1)
+                self._checkpoint_ratings.append(ratings.copy())
+        self.ratings = ratings
+
+    def _ratings_at(self, position: int) -> np.ndarray:
+        """Return the rating vector after the first ``position`` logged results."""
+        checkpoint = bisect_right(self._checkpoint_positions, position) - 1
+        start = self._checkpoint_positions[checkpoint]
+        ratings = np.full(len(self._team_ids), self.initial_rating, dtype=np.float64)
+        stored = self._checkpoint_ratings[checkpoint]
+        ratings[:len(stored)] = stored
+
+        deltas = self._deltas[start:position]
+        np.add.at(ratings, self._home[start:position], deltas)
+        np.subtract.at(ratings, self._away[start:position], deltas)
+        return ratings
+
+    def ratings_as_of(self, as_of: Optional[datetime] = None) -> np.ndarray:
+        """Return the rating vector from before any match on or after a date."""
+        if as_of is None:
+            return self.ratings.copy()
+        position = int(np.searchsorted(self._ticks[:self._size], to_ticks(as_of), side="left"))
+        return self._ratings_at(position)
+
+    def rating(self, team_name: str, as_of: Optional[datetime] = None) -> float:
+        """Return a club's rating, optionally as of a date."""
+        team_id = self._team_ids.get(canonical_team(team_name))
+        if team_id is None:
+            return self.initial_rating
+        if as_of is None:
+            return float(self.ratings[team_id])
+        return float(self.ratings_as_of(as_of)[team_id])
+
+    def snapshot(self, as_of: Optional[datetime] = None) -> Dict[str, float]:
+        """Return every club's rating, optionally as of a date."""
+        ratings = self.ratings_as_of(as_of)
+        return {team: float(ratings[i]) for team, i in self._team_ids.items()}
@@ -1,30 +1,118 @@
 """Feature engineering for prediction models."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
 import numpy as np
 from datetime import datetime, timedelta
 
 from ..domain.models import (
-    Match, PredictionFeatures, TeamStats, FeatureEngineer, DataRepository
+    Match, PredictionFeatures, PredictionFeatureBatch, TeamStats,
+    FeatureEngineer, DataRepository
 )
+from .match_history import MatchHistoryStore, NO_MATCH_TICKS, to_ticks
+from .team_form import ALL, AWAY, HOME, TeamFormStore
+from .team_pairs import TeamPairMatrix
+
+
+# Column order of the matrix returned by extract_features_batch.
+FEATURE_MATRIX_COLUMNS = [
+    "elo_difference",
+    "home_advantage",
+    "h2h_home_wins",
+    "h2h_away_wins",
+    "h2h_draws",
+    "home_recent_scoring_avg",
+    "away_recent_scoring_avg",
+    "home_defensive_record",
+    "away_defensive_record",
+    "form_momentum",
+    "home_rest_days",
+    "away_rest_days",
+    "rivalry_factor",
+]
+
+_TICKS_PER_DAY = 86_400 * 1_000_000
+
+# Matches at each end of a history list fingerprinted to detect edits.
+_FINGERPRINT_HEAD = 16
+_FINGERPRINT_TAIL = 64
+
+
+def _history_fingerprint(matches: List[Match]) -> tuple:
+    """Return a cheap fingerprint of a history list's length and its ends.
+
+    Results are normally filled in on the newest matches, so the ids,
+    dates and scores of the first and last few matches catch in-place
+    score updates and replaced elements without hashing the whole list.
+    """
+    ends = matches[-_FINGERPRINT_TAIL:]
+    if len(matches) > _FINGERPRINT_TAIL:
+        ends = matches[:_FINGERPRINT_HEAD] + ends
+    return (len(matches),) + tuple(
+        (m.match_id, m.match_date, m.home_score, m.away_score) for m in ends
+    )
 
 
 class StandardFeatureEngineer(FeatureEngineer):
-    """Standard feature engineering implementation."""
+    """Standard feature engineering implementation.
+    
+    When a ``TeamFormStore`` kept up to date with results is supplied,
+    rolling scoring/defence averages, form momentum and rest days are read
+    from its ring buffers; teams it has no results for fall back to the
+    match history. Rivalry factors are read from a ``TeamPairMatrix``.
+    """
     
-    def __init__(self, data_repository: DataRepository):
+    def __init__(
+        self, 
+        data_repository: DataRepository,
+        form_store: Optional[TeamFormStore] = None,
+        team_pairs: Optional[TeamPairMatrix] = None
+    ):
         self.data_repository = data_repository
+        self.form_store = form_store
+        self.team_pairs = team_pairs if team_pairs is not None else TeamPairMatrix()
+        self._history_source: Optional[List[Match]] = None
+        self._history_fingerprint: tuple = ()
+        self._history: Optional[MatchHistoryStore] = None
+    
+    def _resolve_history(
+        self, 
+        historical_data: Union[List[Match], MatchHistoryStore]
+    ) -> MatchHistoryStore:
+        """Return a columnar store for the history, building it at most once.
+
+        A list is rebuilt whenever its length or fingerprint changes;
+        callers that edit matches in the middle of a long list should pass
+        a ``MatchHistoryStore`` instead.
+        """
+        if isinstance(historical_data, MatchHistoryStore):
+            return historical_data
+        
+        # Re-use the store while callers keep passing the same, unchanged list.
+        fingerprint = _history_fingerprint(historical_data)
+        if (
+            self._history is None
+            or historical_data is not self._history_source
+            or fingerprint != self._history_fingerprint
+        ):
+            self._history = MatchHistoryStore(historical_data)
+            self._history_source = historical_data
+            self._history_fingerprint = fingerprint
+        
+        return self._history
     
     async def extract_features(
         self, 
         match: Match, 
-        historical_data: List[Match]
+        historical_data: Union[List[Match], MatchHistoryStore]
     ) -> PredictionFeatures:
         """Extract features for prediction."""
         
+        history = self._resolve_history(historical_data)
+        
         # Get team statistics
-        home_stats = await self.data_repository.get_team_stats(match.team_home)
-        away_stats = await self.data_repository.get_team_stats(match.team_away)
+        home_stats, away_stats = await self.data_repository.get_team_stats_many(
+            [match.team_home, match.team_away]
+        )
         
         # Calculate ELO difference
         elo_difference = home_stats.elo_rating - away_stats.elo_rating
@@ -36,32 +124,34 @@ class StandardFeatureEngineer(FeatureEngineer):
         h2h_record = self._calculate_head_to_head(
             match.team_home, 
             match.team_away, 
-            historical_data
+            history
         )
         
         # Get recent encounters
         recent_encounters = self._get_recent_encounters(
             match.team_home, 
             match.team_away, 
-            historical_data
+            history
         )
         
         # Calculate additional features
         additional_features = {
             "home_recent_scoring_avg": self._calculate_recent_scoring_average(
-                match.team_home, historical_data, is_home=True
+                match.team_home, history, is_home=True, match_date=match.match_date
             ),
             "away_recent_scoring_avg": self._calculate_recent_scoring_average(
-                match.team_away, historical_data, is_home=False
+                match.team_away, history, is_home=False, match_date=match.match_date
             ),
             "home_defensive_record": self._calculate_defensive_record(
-                match.team_home, historical_data, is_home=True
+                match.team_home, history, is_home=True, match_date=match.match_date
             ),
             "away_defensive_record": self._calculate_defensive_record(
-                match.team_away, historical_data, is_home=False
+                match.team_away, history, is_home=False, match_date=match.match_date
+            ),
+            "form_momentum": self._calculate_form_momentum(
+                home_stats, away_stats, match.match_date
             ),
-            "form_momentum": self._calculate_form_momentum(home_stats, away_stats),
-            "rest_days": self._calculate_rest_days(match, historical_data),
+            "rest_days": self._calculate_rest_days(match, history),
             "season_stage": self._determine_season_stage(match.match_date),
             "rivalry_factor": self._calculate_rivalry_factor(
                 match.team_home, match.team_away
@@ -78,7 +168,180 @@ class StandardFeatureEngineer(FeatureEngineer):
             additional_features=additional_features
         )
     
-    def _calculate_home_advantage(self, venue: str, home_stats: TeamStats) -> float:
+    async def extract_features_batch(
+        self, 
+        matches: List[Match], 
+        historical_data: Union[List[Match], MatchHistoryStore],
+        as_of: Optional[datetime] = None
+    ) -> PredictionFeatureBatch:
+        """Extract features for a whole round or backfill as one matrix.
+        
+        Team statistics, per-team scoring/defence windows and head-to-head
+        records are computed once per distinct team or pair and scattered
+        into the matrix, so the cost grows with the number of clubs involved
+        rather than the number of fixtures.
+        
+        With ``as_of`` only results strictly before it count towards the
+        history-based features, so a store holding later seasons can be
+        used to replay earlier ones without look-ahead.
+        """
+        history = self._resolve_history(historical_data)
+        n_matches = len(matches)
+        
+        teams = sorted({m.team_home for m in matches} | {m.team_away for m in matches})
+        team_pos = {team: i for i, team in enumerate(teams)}
+        team_stats = await self.data_repository.get_team_stats_many(teams)
+        stats_by_team = dict(zip(teams, team_stats))
+        
+        home_idx = np.array([team_pos[m.team_home] for m in matches], dtype=np.int64)
+        away_idx = np.array([team_pos[m.team_away] for m in matches], dtype=np.int64)
+        
+        # The form store only answers for a team if all its buffered results
+        # predate the team's earliest fixture here (and ``as_of``).
+        form_cutoff: Dict[str, datetime] = {}
+        for m in matches:
+            for team in (m.team_home, m.team_away):
+                if team not in form_cutoff or m.match_date < form_cutoff[team]:
+                    form_cutoff[team] = m.match_date
+        if as_of is not None:
+            form_cutoff = {team: min(date, as_of) for team, date in form_cutoff.items()}
+        
+        elo = np.array([stats.elo_rating for stats in team_stats], dtype=np.float64)
+        momentum = np.array(
+            [self._team_momentum(stats, form_cutoff[team]) for team, stats in zip(teams, team_stats)],
+            dtype=np.float64
+        )
+        home_advantage = np.array(
+            [self._calculate_home_advantage(None, stats) for stats in team_stats],
+            dtype=np.float64
+        )
+        
+        def window_means(is_home: bool, conceded: bool) -> np.ndarray:
+            means = np.zeros(len(teams), dtype=np.float64)
+            for i, team in enumerate(teams):
+                if self._has_form(team, is_home=is_home, match_date=form_cutoff[team]):
+                    means[i] = (
+                        self.form_store.defensive_record(team, is_home) if conceded
+                        else self.form_store.scoring_average(team, is_home)
+                    )
+                    continue
+                points = history.recent_points(team, is_home, conceded=conceded, before=as_of)
+                if len(points):
+                    means[i] = points.mean()
+            return means
+        
+        home_scoring = window_means(is_home=True, conceded=False)
+        away_scoring = window_means(is_home=False, conceded=False)
+        home_defence = window_means(is_home=True, conceded=True)
+        away_defence = window_means(is_home=False, conceded=True)
+        
+        # Rest days: one vectorised lookup per team over all its fixtures.
+        match_ticks = np.array([to_ticks(m.match_date) for m in matches], dtype=np.int64)
+        last_home = np.full(n_matches, NO_MATCH_TICKS, dtype=np.int64)
+        last_away = np.full(n_matches, NO_MATCH_TICKS, dtype=np.int64)
+        for i, team in enumerate(teams):
+            as_home = home_idx == i
+            as_away = away_idx == i
+            involved = as_home | as_away
+            last = history.last_match_ticks(team, match_ticks[involved])
+            last_home[as_home] = last[as_home[involved]]
+            last_away[as_away] = last[as_away[involved]]
+        
+        def rest_days(last: np.ndarray) -> np.ndarray:
+            known = last != NO_MATCH_TICKS
+            days = np.full(n_matches, 7, dtype=np.int64)
+            days[known] = (match_ticks[known] - last[known]) // _TICKS_PER_DAY
+            return days
+        
+        home_rest = rest_days(last_home)
+        away_rest = rest_days(last_away)
+        
+        if self.form_store is not None:
+            for row, m in enumerate(matches):
+                for team, rest in ((m.team_home, home_rest), (m.team_away, away_rest)):
+                    days = self.form_store.rest_days(team, m.match_date)
+                    if days is not None:
+                        rest[row] = days
+        
+        # Head-to-head and encounters: once per oriented pair in the batch.
+        h2h_by_pair: Dict[tuple, Dict[str, int]] = {}
+        encounters_by_pair: Dict[tuple, List[Match]] = {}
+        for m in matches:
+            pair = (m.team_home, m.team_away)
+            if pair not in h2h_by_pair:
+                h2h_by_pair[pair] = self._calculate_head_to_head(
+                    m.team_home, m.team_away, history, before=as_of
+                )
+                encounters_by_pair[pair] = self._get_recent_encounters(
+                    m.team_home, m.team_away, history, before=as_of
+                )
+        h2h = np.array(
+            [
+                [
+                    h2h_by_pair[(m.team_home, m.team_away)]["home_wins"],
+                    h2h_by_pair[(m.team_home, m.team_away)]["away_wins"],
+                    h2h_by_pair[(m.team_home, m.team_away)]["draws"],
+                ]
+                for m in matches
+            ],
+            dtype=np.float64
+        ).reshape(n_matches, 3)
+        rivalry = np.array(
+            [self._calculate_rivalry_factor(m.team_home, m.team_away) for m in matches],
+            dtype=np.float64
+        )
+        
+        matrix = np.column_stack([
+            elo[home_idx] - elo[away_idx],
+            home_advantage[home_idx],
+            h2h,
+            home_scoring[home_idx],
+            away_scoring[away_idx],
+            home_defence[home_idx],
+            away_defence[away_idx],
+            momentum[home_idx] - momentum[away_idx],
+            home_rest,
+            away_rest,
+            rivalry,
+        ]) if n_matches else np.empty((0, len(FEATURE_MATRIX_COLUMNS)))
+        
+        features = []
+        for row, m in enumerate(matches):
+            home, away = home_idx[row], away_idx[row]
+            features.append(PredictionFeatures(
+                home_team_stats=stats_by_team[m.team_home],
+                away_team_stats=stats_by_team[m.team_away],
+                elo_difference=float(matrix[row, 0]),
+                home_advantage=float(matrix[row, 1]),
+                head_to_head_record=h2h_by_pair[(m.team_home, m.team_away)],
+                recent_encounters=encounters_by_pair[(m.team_home, m.team_away)],
+                additional_features={
+                    "home_recent_scoring_avg": float(home_scoring[home]),
+                    "away_recent_scoring_avg": float(away_scoring[away]),
+                    "home_defensive_record": float(home_defence[home]),
+                    "away_defensive_record": float(away_defence[away]),
+                    "form_momentum": float(momentum[home] - momentum[away]),
+                    "rest_days": {
+                        "home_rest_days": int(home_rest[row]),
+                        "away_rest_days": int(away_rest[row])
+                    },
+                    "season_stage": self._determine_season_stage(m.match_date),
+                    "rivalry_factor": float(rivalry[row])
+                }
+            ))
+        
+        return PredictionFeatureBatch(
+            matches=list(matches),
+            feature_names=list(FEATURE_MATRIX_COLUMNS),
+            matrix=matrix,
+            features=features
+        )
+    
+    def _calculate_home_advantage(
+        self, 
+        venue: Optional[str], 
+        home_stats: TeamStats
+    ) -> float:
         """Calculate home advantage factor."""
         base_home_advantage = 0.1  # 10% base advantage
         
@@ -93,105 +356,95 @@ class StandardFeatureEngineer(FeatureEngineer):
         self, 
         team_home: str, 
         team_away: str, 
-        historical_data: List[Match]
+        history: MatchHistoryStore,
+        before: Optional[datetime] = None
     ) -> Dict[str, int]:
         """Calculate head-to-head record between teams."""
-        h2h_record = {"home_wins": 0, "away_wins": 0, "draws": 0}
-        
-        for match in historical_data:
-            if (match.team_home == team_home and match.team_away == team_away) or \
-               (match.team_home == team_away and match.team_away == team_home):
-                
-                if match.home_score is None or match.away_score is None:
-                    continue
-                
-                if match.home_score > match.away_score:
-                    if match.team_home == team_home:
-                        h2h_record["home_wins"] += 1
-                    else:
-                        h2h_record["away_wins"] += 1
-                elif match.away_score > match.home_score:
-                    if match.team_away == team_home:
-                        h2h_record["home_wins"] += 1
-                    else:
-                        h2h_record["away_wins"] += 1
-                else:
-                    h2h_record["draws"] += 1
-        
-        return h2h_record
+        return history.head_to_head(team_home, team_away, before)
     
     def _get_recent_encounters(
         self, 
         team_home: str, 
         team_away: str, 
-        historical_data: List[Match],
-        limit: int = 5
+        history: MatchHistoryStore,
+        limit: int = 5,
+        before: Optional[datetime] = None
     ) -> List[Match]:
         """Get recent encounters between the teams."""
-        encounters = []
-        
-        for match in sorted(historical_data, key=lambda x: x.match_date, reverse=True):
-            if (match.team_home == team_home and match.team_away == team_away) or \
-               (match.team_home == team_away and match.team_away == team_home):
-                encounters.append(match)
-                
-                if len(encounters) >= limit:
-                    break
+        return history.recent_encounters(team_home, team_away, limit, before)
+    
+    def _has_form(
+        self, 
+        team_name: str, 
+        games: int = 5,
+        is_home: Optional[bool] = None,
+        match_date: Optional[datetime] = None
+    ) -> bool:
+        """Return whether the form store can answer a rolling-window query.
         
-        return encounters
+        ``is_home`` selects the home or away window (None for all games).
+        The store is only used when its window predates ``match_date``;
+        earlier fixtures fall back to the supplied history.
+        """
+        split = ALL if is_home is None else (HOME if is_home else AWAY)
+        return (
+            self.form_store is not None
+            and self.form_store.window == games
+            and self.form_store.has_results(team_name, split, before=match_date)
+        )
     
     def _calculate_recent_scoring_average(
         self, 
         team_name: str, 
-        historical_data: List[Match], 
+        history: MatchHistoryStore, 
         is_home: bool,
-        games: int = 5
+        games: int = 5,
+        match_date: Optional[datetime] = None
     ) -> float:
         """Calculate recent scoring average for a team."""
-        recent_scores = []
-        
-        for match in sorted(historical_data, key=lambda x: x.match_date, reverse=True):
-            if is_home and match.team_home == team_name and match.home_score is not None:
-                recent_scores.append(match.home_score)
-            elif not is_home and match.team_away == team_name and match.away_score is not None:
-                recent_scores.append(match.away_score)
-            
-            if len(recent_scores) >= games:
-                break
-        
-        return np.mean(recent_scores) if recent_scores else 0.0
+        if self._has_form(team_name, games, is_home, match_date):
+            return self.form_store.scoring_average(team_name, is_home)
+        
+        recent_scores = history.recent_points(team_name, is_home, games=games)
+        
+        return float(recent_scores.mean()) if len(recent_scores) else 0.0
     
     def _calculate_defensive_record(
         self, 
         team_name: str, 
-        historical_data: List[Match], 
+        history: MatchHistoryStore, 
         is_home: bool,
-        games: int = 5
+        games: int = 5,
+        match_date: Optional[datetime] = None
     ) -> float:
         """Calculate recent defensive record (points conceded)."""
-        recent_conceded = []
-        
-        for match in sorted(historical_data, key=lambda x: x.match_date, reverse=True):
-            if is_home and match.team_home == team_name and match.away_score is not None:
-                recent_conceded.append(match.away_score)
-            elif not is_home and match.team_away == team_name and match.home_score is not None:
-                recent_conceded.append(match.home_score)
-            
-            if len(recent_conceded) >= games:
-                break
-        
-        return np.mean(recent_conceded) if recent_conceded else 0.0
+        if self._has_form(team_name, games, is_home, match_date):
+            return self.form_store.defensive_record(team_name, is_home)
+        
+        recent_conceded = history.recent_points(
+            team_name, is_home, conceded=True, games=games
+        )
+        
+        return float(recent_conceded.mean()) if len(recent_conceded) else 0.0
     
     def _calculate_form_momentum(
         self, 
         home_stats: TeamStats, 
-        away_stats: TeamStats
+        away_stats: TeamStats,
+        match_date: Optional[datetime] = None
     ) -> float:
         """Calculate form momentum difference."""
-        home_momentum = self._team_form_to_score(home_stats.recent_form)
-        away_momentum = self._team_form_to_score(away_stats.recent_form)
+        return (
+            self._team_momentum(home_stats, match_date)
+            - self._team_momentum(away_stats, match_date)
+        )
+    
+    def _team_momentum(self, stats: TeamStats, match_date: Optional[datetime] = None) -> float:
+        """Return a team's momentum, preferring results in the form store."""
+        if self._has_form(stats.team_name, match_date=match_date):
+            return self.form_store.momentum(stats.team_name)
         
-        return home_momentum - away_momentum
+        return self._team_form_to_score(stats.recent_form)
     
     def _team_form_to_score(self, recent_form: List[str]) -> float:
         """Convert recent form to a momentum score."""
@@ -212,11 +465,11 @@ class StandardFeatureEngineer(FeatureEngineer):
     def _calculate_rest_days(
         self, 
         match: Match, 
-        historical_data: List[Match]
+        history: MatchHistoryStore
     ) -> Dict[str, int]:
         """Calculate rest days for both teams."""
-        home_rest = self._team_rest_days(match.team_home, match.match_date, historical_data)
-        away_rest = self._team_rest_days(match.team_away, match.match_date, historical_data)
+        home_rest = self._team_rest_days(match.team_home, match.match_date, history)
+        away_rest = self._team_rest_days(match.team_away, match.match_date, history)
         
         return {"home_rest_days": home_rest, "away_rest_days": away_rest}
     
@@ -224,18 +477,15 @@ class StandardFeatureEngineer(FeatureEngineer):
         self, 
         team_name: str, 
         match_date: datetime, 
-        historical_data: List[Match]
+        history: MatchHistoryStore
     ) -> int:
         """Calculate rest days for a team."""
-        last_match_date = None
+        if self.form_store is not None:
+            rest_days = self.form_store.rest_days(team_name, match_date)
+            if rest_days is not None:
+                return rest_days
         
-        for match in sorted(historical_data, key=lambda x: x.match_date, reverse=True):
-            if match.match_date >= match_date:
-                continue
-                
-            if match.team_home == team_name or match.team_away == team_name:
-                last_match_date = match.match_date
-                break
+        last_match_date = history.last_match_date(team_name, before=match_date)
         
         if last_match_date:
             return (match_date - last_match_date).days
@@ -258,16 +508,4 @@ class StandardFeatureEngineer(FeatureEngineer):
     
     def _calculate_rivalry_factor(self, team_home: str, team_away: str) -> float:
         """Calculate rivalry factor between teams."""
-        # Simple implementation - in reality would be based on historical data
-        traditional_rivalries = {
-            ("Brisbane Broncos", "North Queensland Cowboys"): 1.5,
-            ("Sydney Roosters", "South Sydney Rabbitohs"): 1.8,
-            ("Canterbury Bulldogs", "Parramatta Eels"): 1.3,
-            # Add more rivalries as needed
-        }
-        
-        rivalry_key = (team_home, team_away)
-        reverse_key = (team_away, team_home)
-        
-        return traditional_rivalries.get(rivalry_key, 
-               traditional_rivalries.get(reverse_key, 1.0))
\ No newline at end of file
+        return self.team_pairs.rivalry_factor(team_home, team_away)
\ No newline at end of file
@@ -0,0 +1,264 @@
+"""Columnar match-history store backing feature engineering."""
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..domain.models import Match
+
+
+# Sentinel stored in the int16 score columns for matches without a result.
+MISSING_SCORE = -1
+
+# Returned by vectorised date lookups when a team has no earlier match.
+NO_MATCH_TICKS = np.iinfo(np.int64).min
+
+
+def to_ticks(value: datetime) -> int:
+    """Convert a datetime into the int64 microsecond ticks used by the store."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return int(np.datetime64(value, "us").astype(np.int64))
+
+
+class MatchHistoryStore:
+    """Immutable, date-sorted columnar view over a list of matches.
+
+    Matches are sorted once on construction. Every team keeps index arrays
+    into the sorted columns (all matches, home-only, away-only and the
+    subsets with a known score) and every unordered pair of teams keeps its
+    own index array, so feature lookups become a bisect plus a slice instead
+    of a sort and a scan over the whole history.
+    """
+
+    def __init__(self, matches: Iterable[Match]):
+        """Build the columnar arrays and per-team / per-pair indexes."""
+        matches = list(matches)
+        self._team_ids: Dict[str, int] = {}
+
+        ticks = np.array(
+            [to_ticks(m.match_date) for m in matches], dtype=np.int64
+        )
+        # Stable descending-by-date order matching sorted(..., reverse=True):
+        # ties keep their original order when the arrays are read backwards.
+        order = np.lexsort((-np.arange(len(matches)), ticks))
+
+        self._matches: List[Match] = [matches[i] for i in order]
+        self.dates = ticks[order]
+        self.home_ids = np.array(
+            [self._team_id(m.team_home) for m in self._matches], dtype=np.int16
+        )
+        self.away_ids = np.array(
+            [self._team_id(m.team_away) for m in self._matches], dtype=np.int16
+        )
+        self.home_scores = np.array(
+            [MISSING_SCORE if m.home_score is None else m.home_score
+             for m in self._matches],
+            dtype=np.int16
+        )
+        self.away_scores = np.array(
+            [MISSING_SCORE if m.away_score is None else m.away_score
+             for m in self._matches],
+            dtype=np.int16
+        )
+
+        self._build_indexes()
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    @property
+    def teams(self) -> List[str]:
+        """Return the team names known to the store."""
+        return list(self._team_ids)
+
+    def team_id(self, team_name: str) -> Optional[int]:
+        """Return the small-int id of a team, or None if it never played."""
+        return self._team_ids.get(team_name)
+
+    def match_at(self, position: int) -> Match:
+        """Return the original match object at a sorted position."""
+        return self._matches[position]
+
+    def _team_id(self, team_name: str) -> int:
+        team_id = self._team_ids.get(team_name)
+        if team_id is None:
+            team_id = len(self._team_ids)
+            self._team_ids[team_name] = team_id
+        return team_id
+
+    def _build_indexes(self) -> None:
+        """Group sorted positions by team and by unordered pair."""
+        n_teams = len(self._team_ids)
+        positions = np.arange(len(self._matches), dtype=np.int64)
+        home_scored = self.home_scores != MISSING_SCORE
+        away_scored = self.away_scores != MISSING_SCORE
+
+        def group(ids: np.ndarray, pos: np.ndarray) -> List[np.ndarray]:
+            # Stable sort keeps each group's positions in date order.
+            order = np.argsort(ids, kind="stable")
+            bounds = np.searchsorted(ids[order], np.arange(n_teams + 1))
+            sorted_pos = pos[order]
+            return [
+                sorted_pos[bounds[t]:bounds[t + 1]] for t in range(n_teams)
+            ]
+
+        self._home_idx = group(self.home_ids, positions)
+        self._away_idx = group(self.away_ids, positions)
+        self._home_scored_idx = group(
+            self.home_ids[home_scored], positions[home_scored]
+        )
+        self._home_conceded_idx = group(
+            self.home_ids[away_scored], positions[away_scored]
+        )
+        self._away_scored_idx = group(
+            self.away_ids[away_scored], positions[away_scored]
+        )
+        self._away_conceded_idx = group(
+            self.away_ids[home_scored], positions[home_scored]
+        )
+        self._team_idx = [
+            np.sort(np.concatenate((h, a)), kind="stable")
+            for h, a in zip(self._home_idx, self._away_idx)
+        ]
+        self._team_dates = [self.dates[idx] for idx in self._team_idx]
+
+        low = np.minimum(self.home_ids, self.away_ids).astype(np.int64)
+        high = np.maximum(self.home_ids, self.away_ids).astype(np.int64)
+        pair_keys = low * max(n_teams, 1) + high
+        order = np.argsort(pair_keys, kind="stable")
+        keys, starts = np.unique(pair_keys[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+        self._pair_idx: Dict[Tuple[int, int], np.ndarray] = {
+            divmod(int(key), max(n_teams, 1)): order[start:end]
+            for key, start, end in zip(keys, starts, ends)
+        }
+
+    def _cutoff(self, index: np.ndarray, before: Optional[datetime]) -> np.ndarray:
+        """Trim a date-ordered index array to matches strictly before a date."""
+        if before is None or len(index) == 0:
+            return index
+        end = np.searchsorted(self.dates[index], to_ticks(before), side="left")
+        return index[:end]
+
+    def pair_index(
+        self,
+        team_a: str,
+        team_b: str,
+        before: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Return sorted positions of all meetings between two teams."""
+        id_a, id_b = self.team_id(team_a), self.team_id(team_b)
+        if id_a is None or id_b is None:
+            return np.empty(0, dtype=np.int64)
+        index = self._pair_idx.get((min(id_a, id_b), max(id_a, id_b)))
+        if index is None:
+            return np.empty(0, dtype=np.int64)
+        return self._cutoff(index, before)
+
+    def head_to_head(
+        self,
+        team_home: str,
+        team_away: str,
+        before: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """Count wins and draws between two teams from the home side's view."""
+        index = self.pair_index(team_home, team_away, before)
+        home_scores = self.home_scores[index]
+        away_scores = self.away_scores[index]
+        played = (home_scores != MISSING_SCORE) & (away_scores != MISSING_SCORE)
+
+        hosted = self.home_ids[index] == self.team_id(team_home)
+        home_won = home_scores > away_scores
+        away_won = away_scores > home_scores
+
+        return {
+            "home_wins": int(np.count_nonzero(
+                played & ((home_won & hosted) | (away_won & ~hosted))
+            )),
+            "away_wins": int(np.count_nonzero(
+                played & ((home_won & ~hosted) | (away_won & hosted))
+            )),
+            "draws": int(np.count_nonzero(played & (home_scores == away_scores)))
+        }
+
+    def recent_encounters(
+        self,
+        team_home: str,
+        team_away: str,
+        limit: int = 5,
+        before: Optional[datetime] = None
+    ) -> List[Match]:
+        """Return the most recent meetings between two teams, newest first."""
+        index = self.pair_index(team_home, team_away, before)
+        return [self._matches[i] for i in index[::-1][:limit]]
+
+    def recent_points(
+        self,
+        team_name: str,
+        is_home: bool,
+        conceded: bool = False,
+        games: int = 5,
+        before: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Return points scored (or conceded) in a team's last home/away games."""
+        team_id = self.team_id(team_name)
+        if team_id is None:
+            return np.empty(0, dtype=np.int16)
+
+        if is_home:
+            indexes = self._home_conceded_idx if conceded else self._home_scored_idx
+            column = self.away_scores if conceded else self.home_scores
+        else:
+            indexes = self._away_conceded_idx if conceded else self._away_scored_idx
+            column = self.home_scores if conceded else self.away_scores
+
+        index = self._cutoff(indexes[team_id], before)
+        return column[index[::-1][:games]]
+
+    def recent_matches(
+        self,
+        team_name: str,
+        limit: int = 10,
+        before: Optional[datetime] = None
+    ) -> List[Match]:
+        """Return a team's most recent matches, newest first."""
+        team_id = self.team_id(team_name)
+        if team_id is None:
+            return []
+        index = self._cutoff(self._team_idx[team_id], before)
+        return [self._matches[i] for i in index[::-1][:limit]]
+
+    def last_match_date(
+        self,
+        team_name: str,
+        before: datetime
+    ) -> Optional[datetime]:
+        """Return the date of a team's last match strictly before a date."""
+        team_id = self.team_id(team_name)
+        if team_id is None:
+            return None
+
+        team_dates = self._team_dates[team_id]
+        end = int(np.searchsorted(team_dates, to_ticks(before), side="left"))
+        if end == 0:
+            return None
+        return self._matches[int(self._team_idx[team_id][end - 1])].match_date
+
+    def last_match_ticks(self, team_name: str, before: np.ndarray) -> np.ndarray:
+        """Vectorised last_match_date over an array of ticks."""
+        team_id = self.team_id(team_name)
+        if team_id is None:
+            return np.full(len(before), NO_MATCH_TICKS, dtype=np.int64)
+
+        team_dates = self._team_dates[team_id]
+        end = np.searchsorted(team_dates, before, side="left")
+        padded = np.concatenate(
+            (np.array([NO_MATCH_TICKS], dtype=np.int64), team_dates)
+        )
+        return padded[end]
+
+    def positions_before(self, before: datetime) -> int:
+        """Return how many stored matches were played strictly before a date."""
+        return int(np.searchsorted(self.dates, to_ticks(before), side="left"))
@@ -0,0 +1,220 @@
+"""Memory-mapped model artifacts shared between worker processes."""
+
+import hashlib
+import logging
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import joblib
+
+from ..modules.trees.flat_forest import FlatForest
+
+logger = logging.getLogger(__name__)
+
+
+def process_memory() -> Dict[str, int]:
+    """Return this process's resident memory in bytes.
+
+    On Linux ``rss`` counts every resident page, ``pss`` divides shared
+    pages between the processes mapping them and ``private`` counts pages
+    no other process shares, which is what another worker actually costs.
+    Elsewhere only the peak RSS is available.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            fields = {}
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is kilobytes on Linux and bytes on macOS.
+        return {"rss": peak if sys.platform == "darwin" else peak * 1024}
+
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    }
+
+
+class MappedModelStore:
+    """Loads joblib artifacts so their arrays live in the shared page cache.
+
+    The first load of an artifact re-dumps it uncompressed into
+    ``cache_dir``, keyed by the source path, size and modification time,
+    and every load then opens that copy with ``mmap_mode="r"``. NumPy
+    arrays inside the model (coefficients, scaler statistics, tree
+    thresholds) become read-only views of the file: each worker process
+    maps the same pages instead of unpickling a private copy, so an extra
+    worker adds little resident memory and loads without deserialising
+    the arrays. Objects without arrays load normally. Within a process
+    repeated loads of the same artifact return the same object.
+
+    Tree ensembles go through ``load_forest`` instead: the estimator is
+    exported once to a ``FlatForest`` directory in ``cache_dir`` and its
+    node arrays are mapped from there. Whenever a new version of an
+    artifact is cached, copies of its earlier versions are deleted (a
+    worker still mapping one keeps its pages until it reloads).
+    TorchScript transformer modules are loaded by ``torch.jit.load``
+    and gain nothing from this store.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        """Use ``cache_dir`` for flattened copies, a temp directory by default."""
+        self.cache_dir = Path(
+            cache_dir or Path(tempfile.gettempdir()) / "prediction-engine-models"
+        )
+        self.baseline_memory = process_memory()
+        self._loaded: Dict[Tuple[str, int, int], Any] = {}
+        self._forests: Dict[Tuple[str, int, int], Optional[FlatForest]] = {}
+        self._artifacts: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _cache_prefix(path: Path) -> str:
+        """Return the name prefix shared by every cached version of ``path``."""
+        return f"{path.stem}-{hashlib.sha1(str(path).encode()).hexdigest()[:8]}-"
+
+    @staticmethod
+    def _version(stat: os.stat_result) -> str:
+        return hashlib.sha1(f"{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+
+    def _flattened_path(self, path: Path, stat: os.stat_result) -> Path:
+        return self.cache_dir / f"{self._cache_prefix(path)}{self._version(stat)}.joblib"
+
+    def _forest_path(self, path: Path, stat: os.stat_result) -> Path:
+        return self.cache_dir / f"{self._cache_prefix(path)}{self._version(stat)}.forest"
+
+    def _remove_stale(self, path: Path, stat: os.stat_result) -> None:
+        """Delete cached copies of earlier versions of ``path``."""
+        current = f"{self._cache_prefix(path)}{self._version(stat)}."
+        for cached in self.cache_dir.glob(f"{self._cache_prefix(path)}*"):
+            if cached.name.startswith(current):
+                continue
+            try:
+                if cached.is_dir():
+                    shutil.rmtree(cached)
+                else:
+                    cached.unlink()
+            except FileNotFoundError:
+                # Another worker removed it first.
+                pass
+            logger.info(f"Removed stale model copy {cached.name}")
+
+    def _flatten(self, source: Path, target: Path) -> None:
+        """Write an uncompressed copy of ``source``, atomically."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(handle)
+        try:
+            joblib.dump(joblib.load(source), temp_path, compress=0)
+            # Workers flattening concurrently each replace the file with
+            # identical contents.
+            os.replace(temp_path, target)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def load(self, path: Union[str, Path]) -> Any:
+        """Load an artifact, memory-mapping its arrays."""
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        if key in self._loaded:
+            return self._loaded[key]
+
+        start_time = time.perf_counter()
+        flattened = self._flattened_path(path, stat)
+        if not flattened.exists():
+            self._flatten(path, flattened)
+            self._remove_stale(path, stat)
+
+        memory_before = process_memory()["rss"]
+        artifact = joblib.load(flattened, mmap_mode="r")
+        self.evict(path)
+        self._loaded[key] = artifact
+        self._artifacts[str(path)] = {
+            "mapped_file": str(flattened),
+            "mapped_bytes": flattened.stat().st_size,
+            "rss_delta_bytes": process_memory()["rss"] - memory_before,
+            "load_ms": (time.perf_counter() - start_time) * 1000
+        }
+        logger.info(f"Memory-mapped model artifact {path.name}", extra=self._artifacts[str(path)])
+        return artifact
+
+    def load_forest(self, path: Union[str, Path]) -> Optional[FlatForest]:
+        """Load a tree-ensemble artifact as a memory-mapped ``FlatForest``.
+
+        The artifact may be the estimator itself or a dict holding it
+        under ``model`` or ``pipeline``. Returns ``None`` when
+        ``FlatForest.from_estimator`` cannot export it; callers then load
+        it with ``load`` and predict natively.
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        if key in self._forests:
+            return self._forests[key]
+
+        start_time = time.perf_counter()
+        directory = self._forest_path(path, stat)
+        if not directory.exists():
+            artifact = joblib.load(path)
+            if isinstance(artifact, dict):
+                artifact = artifact.get("model", artifact.get("pipeline"))
+            forest = FlatForest.from_estimator(artifact)
+            if forest is None:
+                self.evict(path)
+                self._forests[key] = None
+                return None
+            self._save_forest(forest, directory)
+            self._remove_stale(path, stat)
+
+        forest = FlatForest.load(directory)
+        self.evict(path)
+        self._forests[key] = forest
+        self._artifacts[str(path)] = {
+            "mapped_file": str(directory),
+            "mapped_bytes": sum(f.stat().st_size for f in directory.iterdir()),
+            "load_ms": (time.perf_counter() - start_time) * 1000
+        }
+        logger.info(f"Memory-mapped tree ensemble {path.name}", extra=self._artifacts[str(path)])
+        return forest
+
+    def _save_forest(self, forest: FlatForest, directory: Path) -> None:
+        """Write a forest's arrays to ``directory``, atomically."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_dir = tempfile.mkdtemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            forest.save(temp_dir)
+            os.replace(temp_dir, directory)
+        except OSError:
+            # A concurrent worker already moved an identical copy in place.
+            if not directory.exists():
+                raise
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def evict(self, path: Union[str, Path]) -> None:
+        """Forget loaded copies of an artifact so the next load re-reads it."""
+        path = str(Path(path).resolve())
+        for cache in (self._loaded, self._forests):
+            for key in [key for key in cache if key[0] == path]:
+                del cache[key]
+        self._artifacts.pop(path, None)
+
+    def statistics(self) -> Dict[str, Any]:
+        """Return per-artifact load figures and process memory before and now."""
+        return {
+            "artifacts": dict(self._artifacts),
+            "memory_before_load": self.baseline_memory,
+            "memory": process_memory()
+        }
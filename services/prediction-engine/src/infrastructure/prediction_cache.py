@@ -0,0 +1,265 @@
+"""Two-tier prediction result cache (in-process LRU in front of Redis)."""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, Optional, Set, Tuple
+
+import redis.asyncio as redis
+
+from shared.monitoring.telemetry import MetricsCollector
+
+from ..domain.prediction_models import (
+    MatchDetails, ModelType, PredictionResult, PredictionType, Winner
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _odds_of(match_details: MatchDetails) -> Tuple[Optional[float], ...]:
+    return (match_details.odds_home, match_details.odds_away, match_details.odds_draw)
+
+
+def serialise_prediction(result: PredictionResult) -> bytes:
+    """Serialise a prediction result for the Redis tier."""
+    match = result.match_details
+    return json.dumps({
+        "prediction_id": result.prediction_id,
+        "model_type": result.model_type.value,
+        "prediction_type": result.prediction_type.value,
+        "match_details": {
+            "team_home": match.team_home,
+            "team_away": match.team_away,
+            "match_date": match.match_date.isoformat(),
+            "venue": match.venue,
+            "round_num": match.round_num,
+            "season_year": match.season_year,
+            "odds_home": match.odds_home,
+            "odds_away": match.odds_away,
+            "odds_draw": match.odds_draw
+        },
+        "predicted_winner": result.predicted_winner.value,
+        "probabilities": result.probabilities,
+        "confidence": result.confidence,
+        "predicted_margin": result.predicted_margin,
+        "predicted_total_points": result.predicted_total_points,
+        "features_used": result.features_used,
+        "model_metadata": result.model_metadata,
+        "processing_time_ms": result.processing_time_ms,
+        "created_at": result.created_at.isoformat() if result.created_at else None
+    }, default=str).encode("utf-8")
+
+
+def deserialise_prediction(payload: bytes) -> PredictionResult:
+    """Rebuild a prediction result serialised by ``serialise_prediction``."""
+    data = json.loads(payload)
+    match = data["match_details"]
+    match["match_date"] = datetime.fromisoformat(match["match_date"])
+
+    return PredictionResult(
+        prediction_id=data["prediction_id"],
+        model_type=ModelType(data["model_type"]),
+        prediction_type=PredictionType(data["prediction_type"]),
+        match_details=MatchDetails(**match),
+        predicted_winner=Winner(data["predicted_winner"]),
+        probabilities=data["probabilities"],
+        confidence=data["confidence"],
+        predicted_margin=data["predicted_margin"],
+        predicted_total_points=data["predicted_total_points"],
+        features_used=data["features_used"],
+        model_metadata=data["model_metadata"],
+        processing_time_ms=data["processing_time_ms"],
+        created_at=(
+            datetime.fromisoformat(data["created_at"]) if data["created_at"] else None
+        )
+    )
+
+
+class PredictionCache:
+    """Caches prediction results for identical requests.
+
+    Keys combine ``MatchDetails.match_id``, the odds tuple, the prediction
+    type, an optional forced model and the model version fingerprint, so a
+    model reload naturally misses, as does a request whose odds have moved.
+    Entries priced at earlier odds are not looked up again and age out
+    through the TTL and the LRU bound, so reads never delete.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 300,
+        key_prefix: str = "prediction"
+    ):
+        """Initialise the cache."""
+        self.redis_client = redis_client
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+        self._entries: "OrderedDict[str, Tuple[float, str, PredictionResult]]" = OrderedDict()
+        self._keys_by_match: Dict[str, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(
+        self,
+        match_details: MatchDetails,
+        prediction_type: PredictionType,
+        model_version: str,
+        force_model: Optional[ModelType] = None
+    ) -> str:
+        """Build the cache key for a request."""
+        digest = hashlib.sha1(repr((
+            _odds_of(match_details),
+            prediction_type.value,
+            model_version,
+            force_model.value if force_model else None
+        )).encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}:{match_details.match_id}:{digest}"
+
+    async def get(
+        self,
+        match_details: MatchDetails,
+        prediction_type: PredictionType,
+        model_version: str,
+        force_model: Optional[ModelType] = None
+    ) -> Optional[PredictionResult]:
+        """Return a fresh copy of a cached prediction, or None on a miss."""
+        key = self.make_key(match_details, prediction_type, model_version, force_model)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self._record(hit=True, tier="memory")
+            return self._copy(entry[2], tier="memory")
+        if entry is not None:
+            self._evict(key)
+        self._record(hit=False, tier="memory")
+
+        if self.redis_client is None:
+            return None
+
+        try:
+            payload = await self.redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"Prediction cache read failed: {e}")
+            self.misses += 1
+            return None
+
+        self._record(hit=payload is not None, tier="redis")
+        if payload is None:
+            return None
+
+        result = deserialise_prediction(payload)
+        self._store_local(key, match_details.match_id, result)
+        return self._copy(result, tier="redis")
+
+    async def set(
+        self,
+        match_details: MatchDetails,
+        prediction_type: PredictionType,
+        model_version: str,
+        result: PredictionResult,
+        force_model: Optional[ModelType] = None
+    ) -> None:
+        """Cache a prediction result in both tiers."""
+        key = self.make_key(match_details, prediction_type, model_version, force_model)
+        self._store_local(key, match_details.match_id, result)
+
+        if self.redis_client is None:
+            return
+
+        try:
+            await self.redis_client.setex(
+                key, int(self.ttl_seconds), serialise_prediction(result)
+            )
+        except Exception as e:
+            logger.warning(f"Prediction cache write failed: {e}")
+
+    async def invalidate_match(self, match_id: str) -> None:
+        """Drop every cached prediction for a match."""
+        for key in list(self._keys_by_match.get(match_id, ())):
+            self._evict(key)
+        await self._delete_remote(f"{self.key_prefix}:{match_id}:*")
+
+    def evict_team(self, team_name: str) -> None:
+        """Drop this process's cached predictions for matches involving a team."""
+        for key, (_, _, result) in list(self._entries.items()):
+            match = result.match_details
+            if team_name in (match.team_home, match.team_away):
+                self._evict(key)
+
+    async def invalidate_team(self, team_name: str) -> None:
+        """Drop every cached prediction for matches involving a team, in both tiers.
+
+        The Redis tier is shared by every worker, so this only needs to run
+        once per result; each worker calls ``evict_team`` for its own tier.
+        """
+        self.evict_team(team_name)
+        await self._delete_remote(f"{self.key_prefix}:predict_{team_name}_*")
+        await self._delete_remote(f"{self.key_prefix}:predict_*_{team_name}_*")
+    
+    async def invalidate_all(self) -> None:
+        """Drop every cached prediction, e.g. after a model reload."""
+        self._entries.clear()
+        self._keys_by_match.clear()
+        await self._delete_remote(f"{self.key_prefix}:*")
+
+    def _store_local(self, key: str, match_id: str, result: PredictionResult) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, match_id, result)
+        self._entries.move_to_end(key)
+        self._keys_by_match.setdefault(match_id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._keys_by_match.get(entry[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_match[entry[1]]
+
+    async def _delete_remote(self, pattern: str) -> None:
+        if self.redis_client is None:
+            return
+        try:
+            keys = [key async for key in self.redis_client.scan_iter(match=pattern)]
+            if keys:
+                await self.redis_client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Prediction cache invalidation failed: {e}")
+
+    def _copy(self, result: PredictionResult, tier: str) -> PredictionResult:
+        """Return a copy with a fresh prediction id and creation time."""
+        metadata: Dict[str, Any] = dict(result.model_metadata or {})
+        metadata["prediction_cache"] = {"hit": True, "tier": tier}
+        return replace(
+            result,
+            prediction_id="",
+            created_at=None,
+            model_metadata=metadata
+        )
+
+    def _record(self, hit: bool, tier: str) -> None:
+        """Export a lookup to Prometheus and update the overall counters."""
+        MetricsCollector.record_cache_operation(f"prediction_{tier}", "get", hit)
+        if hit:
+            self.hits += 1
+        elif tier == "redis" or self.redis_client is None:
+            # With Redis configured a memory miss is only final once Redis misses.
+            self.misses += 1
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the overall hit ratio across both tiers."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
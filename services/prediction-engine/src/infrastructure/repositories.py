@@ -1,8 +1,15 @@
 """Infrastructure repositories for data access."""
 
+import asyncio
+import fnmatch
+import logging
+import math
+import random
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import Any, Awaitable, Callable, List, Optional, Dict, Tuple
 from pathlib import Path
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,19 +17,36 @@ from sqlalchemy import select, func
 import redis.asyncio as redis
 
 from shared.data_contracts.prediction import PredictionType, ModelType
+from shared.monitoring.telemetry import MetricsCollector
 from ..domain.models import (
     Match, TeamStats, PredictionModel, PredictionOutput,
     ModelRepository, DataRepository
 )
 from ..modules.logistic_regression.model import LogisticRegressionModel
+from .cache_codec import (
+    CodecError, decode_matches, decode_team_stats, encode_matches, encode_team_stats,
+    unwrap_envelope, wrap_envelope
+)
+from .elo_ratings import EloRatingEngine
+from .match_history import MatchHistoryStore
+from .model_store import MappedModelStore
+from .team_form import ALL, TeamFormStore
+
+logger = logging.getLogger(__name__)
 
 
 class DatabaseModelRepository(ModelRepository):
     """Model repository using database storage."""
     
-    def __init__(self, db_session: AsyncSession, models_path: Path):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        models_path: Path,
+        model_store: Optional[MappedModelStore] = None
+    ):
         self.db_session = db_session
         self.models_path = models_path
+        self.model_store = model_store
         self._model_cache: Dict[ModelType, PredictionModel] = {}
     
     async def load_model(self, model_type: ModelType) -> PredictionModel:
@@ -32,16 +56,24 @@ class DatabaseModelRepository(ModelRepository):
         
         if model_type == ModelType.LOGISTIC_REGRESSION:
             model_path = self.models_path / "logistic_regression_model.joblib"
-            model = LogisticRegressionModel(model_path)
+            model = LogisticRegressionModel(model_path, self.model_store)
             self._model_cache[model_type] = model
             return model
         
-        # TODO: Add other model types
+        # TODO: Add other model types. Tree ensembles should load through
+        # self.model_store.load_forest so workers share the flat arrays.
         # elif model_type == ModelType.LIGHTGBM:
         #     return LightGBMModel(self.models_path / "lightgbm_model.joblib")
         
         raise ValueError(f"Unsupported model type: {model_type}")
     
+    def replace_model(self, model_type: ModelType, model: PredictionModel) -> None:
+        """Serve a reloaded model in place of the cached one.
+        
+        Callers already holding the previous model finish with it.
+        """
+        self._model_cache[model_type] = model
+    
     async def save_prediction(
         self, 
         match: Match, 
@@ -98,8 +130,13 @@ class DatabaseModelRepository(ModelRepository):
 class DatabaseDataRepository(DataRepository):
     """Data repository using database storage."""
     
-    def __init__(self, db_session: AsyncSession):
+    def __init__(
+        self, 
+        db_session: AsyncSession,
+        rating_engine: Optional[EloRatingEngine] = None
+    ):
         self.db_session = db_session
+        self.rating_engine = rating_engine
     
     async def get_historical_matches(
         self, 
@@ -141,7 +178,9 @@ class DatabaseDataRepository(DataRepository):
         # Placeholder data
         return TeamStats(
             team_name=team_name,
-            elo_rating=1500.0,
+            elo_rating=(
+                self.rating_engine.rating(team_name) if self.rating_engine else 1500.0
+            ),
             recent_form=["W", "L", "W", "W", "D"],
             avg_points_scored=22.5,
             avg_points_conceded=18.2,
@@ -172,15 +211,131 @@ class DatabaseDataRepository(DataRepository):
             ))
         
         return matches
+    
+    async def get_completed_matches(self, since: Optional[datetime] = None) -> List[Match]:
+        """Get every match with a recorded score, oldest first."""
+        # TODO: Implement actual database query
+        # This would select scored matches from the matches table, from
+        # ``since`` on when given, ordered by match date
+        
+        return []
+
+
+class PointInTimeDataRepository(DataRepository):
+    """Team data as it stood at ``as_of``, for replaying history.
+
+    Ratings and form come from an ``EloRatingEngine`` and a
+    ``TeamFormStore`` that the caller feeds each result only once the
+    replay has passed it, and match lookups come from a
+    ``MatchHistoryStore`` cut off at ``as_of``. The store may hold the
+    whole history, later seasons included.
+    """
+    
+    def __init__(
+        self,
+        history: MatchHistoryStore,
+        rating_engine: EloRatingEngine,
+        form_store: TeamFormStore,
+        as_of: Optional[datetime] = None
+    ):
+        self.history = history
+        self.rating_engine = rating_engine
+        self.form_store = form_store
+        self.as_of = as_of
+    
+    async def get_historical_matches(
+        self, 
+        team_home: str, 
+        team_away: str,
+        limit: Optional[int] = None
+    ) -> List[Match]:
+        """Get meetings between the teams before ``as_of``, newest first."""
+        return self.history.recent_encounters(
+            team_home, team_away, limit or len(self.history), before=self.as_of
+        )
+    
+    async def get_team_stats(self, team_name: str) -> TeamStats:
+        """Get team statistics from the results recorded so far."""
+        return TeamStats(
+            team_name=team_name,
+            elo_rating=self.rating_engine.rating(team_name),
+            recent_form=self.form_store.recent_form(team_name),
+            avg_points_scored=self.form_store.rolling_mean(team_name, ALL),
+            avg_points_conceded=self.form_store.rolling_mean(team_name, ALL, conceded=True)
+        )
+    
+    async def get_recent_matches(
+        self, 
+        team_name: str, 
+        count: int = 10
+    ) -> List[Match]:
+        """Get a team's matches before ``as_of``, newest first."""
+        return self.history.recent_matches(team_name, count, before=self.as_of)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Freshness policy for one family of cache keys."""
+    
+    ttl: int  # seconds a value is fresh
+    stale_ttl: int = 0  # further seconds a stale value may be served while it refreshes
+    early_refresh_beta: float = 1.0  # XFetch aggressiveness; 0 disables early refresh
+
+
+# Results invalidate affected keys through ``refresh_for_result``, so TTLs
+# only bound staleness from changes that arrive without a result event.
+DEFAULT_CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "historical_matches": CachePolicy(ttl=24 * 3600, stale_ttl=6 * 3600),
+    "team_stats": CachePolicy(ttl=6 * 3600, stale_ttl=3600),
+    "recent_matches": CachePolicy(ttl=12 * 3600, stale_ttl=3600),
+}
+
+
+def _result_keys(team_home: str, team_away: str) -> Tuple[List[str], List[str]]:
+    """Return the cache keys and key patterns a result between two teams affects."""
+    keys = [f"team_stats:{team_home}", f"team_stats:{team_away}"]
+    patterns = [
+        f"recent_matches:{team_home}:*",
+        f"recent_matches:{team_away}:*",
+        f"historical_matches:{team_home}:{team_away}:*",
+        f"historical_matches:{team_away}:{team_home}:*"
+    ]
+    return keys, patterns
 
 
 class CachedDataRepository(DataRepository):
-    """Data repository with Redis caching."""
+    """Data repository with Redis read-through caching.
     
-    def __init__(self, db_repository: DataRepository, redis_client: redis.Redis):
+    Values are stored with the struct-packed codec from ``cache_codec``,
+    wrapped in an envelope carrying their soft expiry and recompute time.
+    Each key family has a ``CachePolicy``:
+    
+    * stale-while-revalidate: once a value passes its soft expiry it is
+      still served for ``stale_ttl`` seconds while one background task
+      reloads it, so an expiring hot key never stampedes the database;
+    * probabilistic early refresh (XFetch): a read may trigger that
+      background reload before expiry, with a probability that rises as
+      expiry approaches and with the value's recompute time, spreading
+      refreshes out instead of aligning them on the TTL.
+    
+    Concurrent misses for the same key share a single backend load, and
+    ``get_team_stats_many`` fetches all requested teams with one ``MGET``.
+    When a result is recorded, ``refresh_for_result`` drops and re-warms
+    exactly the keys that depend on the two teams.
+    """
+    
+    def __init__(
+        self, 
+        db_repository: DataRepository, 
+        redis_client: redis.Redis,
+        policies: Optional[Dict[str, CachePolicy]] = None
+    ):
         self.db_repository = db_repository
         self.redis_client = redis_client
-        self.cache_ttl = 3600  # 1 hour
+        self.policies = {**DEFAULT_CACHE_POLICIES, **(policies or {})}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Bumped on invalidation so loads started earlier do not write back.
+        self._generations: Dict[str, int] = {}
     
     async def get_historical_matches(
         self, 
@@ -191,48 +346,118 @@ class CachedDataRepository(DataRepository):
         """Get historical matches with caching."""
         cache_key = f"historical_matches:{team_home}:{team_away}:{limit}"
         
-        # Try to get from cache first
-        cached_result = await self.redis_client.get(cache_key)
-        if cached_result:
-            # In production, you'd deserialise the cached data
-            pass
-        
-        # Get from database
-        matches = await self.db_repository.get_historical_matches(
-            team_home, team_away, limit
-        )
-        
-        # Cache the result
-        # In production, you'd serialise the matches before caching
-        await self.redis_client.setex(
-            cache_key, 
-            self.cache_ttl, 
-            "serialised_matches_data"
+        return await self._read_through(
+            "historical_matches",
+            cache_key,
+            lambda: self.db_repository.get_historical_matches(team_home, team_away, limit),
+            encode_matches,
+            decode_matches
         )
-        
-        return matches
     
     async def get_team_stats(self, team_name: str) -> TeamStats:
         """Get team statistics with caching."""
         cache_key = f"team_stats:{team_name}"
         
-        # Try cache first
-        cached_result = await self.redis_client.get(cache_key)
-        if cached_result:
-            # Deserialise cached data
-            pass
+        return await self._read_through(
+            "team_stats",
+            cache_key,
+            lambda: self.db_repository.get_team_stats(team_name),
+            encode_team_stats,
+            decode_team_stats
+        )
+    
+    async def get_team_stats_many(self, team_names: List[str]) -> List[TeamStats]:
+        """Get statistics for several teams with one MGET and one pipelined write."""
+        if not team_names:
+            return []
+        
+        policy = self.policies["team_stats"]
+        cache_keys = [f"team_stats:{team_name}" for team_name in team_names]
         
-        # Get from database
-        stats = await self.db_repository.get_team_stats(team_name)
+        start_time = time.perf_counter()
+        try:
+            payloads = await self.redis_client.mget(cache_keys)
+        except Exception as e:
+            logger.warning(f"Redis MGET failed for team stats: {e}")
+            payloads = [None] * len(cache_keys)
+        MetricsCollector.record_cache_latency(
+            "team_stats", "mget", time.perf_counter() - start_time
+        )
         
-        # Cache with shorter TTL for team stats (they change more frequently)
-        await self.redis_client.setex(
-            cache_key,
-            900,  # 15 minutes
-            "serialised_stats_data"
+        results: List[Optional[TeamStats]] = [None] * len(team_names)
+        missing: List[int] = []
+        for index, payload in enumerate(payloads):
+            team_name = team_names[index]
+            stats = self._serve_cached(
+                "team_stats",
+                cache_keys[index],
+                payload,
+                decode_team_stats,
+                lambda team_name=team_name, cache_key=cache_keys[index]: self._load_and_store(
+                    "team_stats",
+                    cache_key,
+                    lambda: self.db_repository.get_team_stats(team_name),
+                    encode_team_stats
+                )
+            )
+            if stats is None:
+                missing.append(index)
+            else:
+                results[index] = stats
+        
+        if not missing:
+            return results
+        
+        generations = [self._generations.get(cache_keys[index], 0) for index in missing]
+        # Loads may be shared with single-key reads, so the in-flight task
+        # yields bare TeamStats; loads started here note their recompute time.
+        recompute_seconds: Dict[str, float] = {}
+        
+        async def timed_load(team_name: str, cache_key: str) -> TeamStats:
+            load_start = time.perf_counter()
+            stats = await self.db_repository.get_team_stats(team_name)
+            recompute_seconds[cache_key] = time.perf_counter() - load_start
+            return stats
+        
+        loaded = await asyncio.gather(*(
+            self._coalesce(
+                cache_keys[index],
+                lambda team_name=team_names[index], cache_key=cache_keys[index]: timed_load(
+                    team_name, cache_key
+                )
+            )
+            for index in missing
+        ))
+        
+        start_time = time.perf_counter()
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for index, generation, stats in zip(missing, generations, loaded):
+                cache_key = cache_keys[index]
+                if cache_key not in recompute_seconds:
+                    continue  # joined a load that writes its own result
+                if self._generations.get(cache_key, 0) != generation:
+                    continue
+                pipeline.setex(
+                    cache_key,
+                    policy.ttl + policy.stale_ttl,
+                    wrap_envelope(
+                        encode_team_stats(stats),
+                        time.time() + policy.ttl,
+                        recompute_seconds[cache_key]
+                    )
+                )
+            await pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Redis pipelined write failed for team stats: {e}")
+        MetricsCollector.record_cache_latency(
+            "team_stats", "set", time.perf_counter() - start_time
         )
         
-        return stats
+        for index, stats in zip(missing, loaded):
+            results[index] = stats
+        
+        return results
     
     async def get_recent_matches(
         self, 
@@ -242,20 +467,216 @@ class CachedDataRepository(DataRepository):
         """Get recent matches with caching."""
         cache_key = f"recent_matches:{team_name}:{count}"
         
-        # Try cache first
-        cached_result = await self.redis_client.get(cache_key)
-        if cached_result:
-            # Deserialise cached data
-            pass
+        return await self._read_through(
+            "recent_matches",
+            cache_key,
+            lambda: self.db_repository.get_recent_matches(team_name, count),
+            encode_matches,
+            decode_matches
+        )
+    
+    def discard_loads_for_result(self, team_home: str, team_away: str) -> None:
+        """Stop this process's in-flight loads for the two teams writing back.
+        
+        Loads started before a result would otherwise repopulate Redis with
+        pre-result values after ``refresh_for_result`` has deleted them.
+        Only local state is touched, so every worker can run this.
+        """
+        keys, patterns = _result_keys(team_home, team_away)
+        patterns = keys + patterns
+        for key in list(self._inflight):
+            if any(fnmatch.fnmatchcase(key, pattern) for pattern in patterns):
+                self._generations[key] = self._generations.get(key, 0) + 1
+                del self._inflight[key]
+    
+    async def refresh_for_result(self, team_home: str, team_away: str) -> int:
+        """Invalidate and re-warm the keys affected by a result between two teams.
         
-        # Get from database
-        matches = await self.db_repository.get_recent_matches(team_name, count)
+        Covers both teams' statistics, every cached ``recent_matches`` count
+        for either team and every cached ``historical_matches`` limit for the
+        pair in either home/away order. Returns the number of keys refreshed.
+        """
+        keys, patterns = _result_keys(team_home, team_away)
         
-        # Cache the result
-        await self.redis_client.setex(
-            cache_key,
-            1800,  # 30 minutes
-            "serialised_matches_data"
+        try:
+            for pattern in patterns:
+                async for key in self.redis_client.scan_iter(match=pattern):
+                    keys.append(key.decode("utf-8") if isinstance(key, bytes) else key)
+        except Exception as e:
+            logger.warning(f"Redis SCAN failed while invalidating results: {e}")
+        
+        self.discard_loads_for_result(team_home, team_away)
+        for key in keys:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._inflight.pop(key, None)
+        
+        try:
+            await self.redis_client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Redis DELETE failed while invalidating results: {e}")
+        
+        warmers: List[Awaitable[Any]] = [
+            self.get_team_stats_many([team_home, team_away])
+        ]
+        for key in keys[2:]:
+            family, *teams, argument = key.split(":")
+            if family == "recent_matches" and len(teams) == 1:
+                warmers.append(self.get_recent_matches(teams[0], int(argument)))
+            elif family == "historical_matches" and len(teams) == 2:
+                limit = None if argument == "None" else int(argument)
+                warmers.append(self.get_historical_matches(teams[0], teams[1], limit))
+        
+        for outcome in await asyncio.gather(*warmers, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Cache warm-up after result failed: {outcome}")
+        
+        return len(keys)
+    
+    async def _read_through(
+        self,
+        cache_type: str,
+        cache_key: str,
+        load: Callable[[], Awaitable[Any]],
+        encode: Callable[[Any], bytes],
+        decode: Callable[[bytes], Any]
+    ) -> Any:
+        """Serve a key from Redis, loading and caching it on a miss."""
+        start_time = time.perf_counter()
+        try:
+            payload = await self.redis_client.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Redis GET failed for {cache_key}: {e}")
+            payload = None
+        MetricsCollector.record_cache_latency(
+            cache_type, "get", time.perf_counter() - start_time
         )
         
-        return matches
\ No newline at end of file
+        def refresh() -> Awaitable[Any]:
+            return self._load_and_store(cache_type, cache_key, load, encode)
+        
+        value = self._serve_cached(cache_type, cache_key, payload, decode, refresh)
+        if value is not None:
+            return value
+        
+        return await self._coalesce(cache_key, refresh)
+    
+    def _serve_cached(
+        self,
+        cache_type: str,
+        cache_key: str,
+        payload: Optional[bytes],
+        decode: Callable[[bytes], Any],
+        refresh: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Decode a cached value, scheduling a background refresh when it is due.
+        
+        Returns None when the caller has to load the value synchronously:
+        nothing is cached, the entry is corrupt, or it is stale and the key
+        family does not allow serving stale values.
+        """
+        if payload is None:
+            MetricsCollector.record_cache_operation(cache_type, "get", False)
+            return None
+        
+        try:
+            expires_at, recompute_seconds, body = unwrap_envelope(payload)
+            value = decode(body)
+        except CodecError as e:
+            logger.warning(f"Discarding undecodable cache entry {cache_key}: {e}")
+            MetricsCollector.record_cache_operation(cache_type, "get", False)
+            return None
+        
+        policy = self.policies[cache_type]
+        now = time.time()
+        
+        if now >= expires_at:
+            if policy.stale_ttl <= 0 or now >= expires_at + policy.stale_ttl:
+                MetricsCollector.record_cache_operation(cache_type, "get", False)
+                return None
+            MetricsCollector.record_cache_operation(cache_type, "stale_get", True)
+            self._refresh_in_background(cache_key, refresh)
+            return value
+        
+        MetricsCollector.record_cache_operation(cache_type, "get", True)
+        
+        # XFetch: refresh early with probability growing as expiry nears.
+        if policy.early_refresh_beta > 0:
+            jitter = -recompute_seconds * policy.early_refresh_beta * math.log(
+                1.0 - random.random()
+            )
+            if now + jitter >= expires_at:
+                MetricsCollector.record_cache_operation(cache_type, "early_refresh", True)
+                self._refresh_in_background(cache_key, refresh)
+        
+        return value
+    
+    async def _load_and_store(
+        self,
+        cache_type: str,
+        cache_key: str,
+        load: Callable[[], Awaitable[Any]],
+        encode: Callable[[Any], bytes]
+    ) -> Any:
+        """Load a value from the backing repository and write it to Redis."""
+        policy = self.policies[cache_type]
+        generation = self._generations.get(cache_key, 0)
+        
+        load_start = time.perf_counter()
+        value = await load()
+        recompute_seconds = time.perf_counter() - load_start
+        
+        if self._generations.get(cache_key, 0) != generation:
+            # Invalidated while loading; the value may predate the change.
+            return value
+        
+        write_start = time.perf_counter()
+        try:
+            await self.redis_client.setex(
+                cache_key,
+                policy.ttl + policy.stale_ttl,
+                wrap_envelope(encode(value), time.time() + policy.ttl, recompute_seconds)
+            )
+        except Exception as e:
+            logger.warning(f"Redis SETEX failed for {cache_key}: {e}")
+        MetricsCollector.record_cache_latency(
+            cache_type, "set", time.perf_counter() - write_start
+        )
+        
+        return value
+    
+    async def _coalesce(self, cache_key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Share one in-flight backend load between concurrent misses on a key."""
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(load())
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(cache_key, done))
+        
+        # Shield so one cancelled caller does not cancel the shared load.
+        return await asyncio.shield(task)
+    
+    def _refresh_in_background(
+        self, 
+        cache_key: str, 
+        refresh: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Start a refresh for a key unless one is already in flight."""
+        if cache_key in self._inflight:
+            return
+        
+        task = asyncio.ensure_future(refresh())
+        self._inflight[cache_key] = task
+        
+        def done(finished: asyncio.Task) -> None:
+            self._forget_inflight(cache_key, finished)
+            if not finished.cancelled() and finished.exception() is not None:
+                logger.warning(
+                    f"Background refresh failed for {cache_key}: {finished.exception()}"
+                )
+        
+        task.add_done_callback(done)
+    
+    def _forget_inflight(self, cache_key: str, task: asyncio.Task) -> None:
+        """Drop a finished load unless an invalidation already replaced it."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
@@ -0,0 +1,269 @@
+"""Rolling-window team form aggregates maintained per result."""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from ..domain.models import Match
+from ..domain.teams import NRL_CLUBS, canonical_team
+from .match_history import NO_MATCH_TICKS, to_ticks
+
+
+# Second axis of the buffers: a team's home games, away games and all games.
+HOME, AWAY, ALL = 0, 1, 2
+
+_LOSS, _DRAW, _WIN = 0, 1, 2
+_RESULT_LETTERS = "LDW"
+_TICKS_PER_DAY = 86_400 * 1_000_000
+
+
+class TeamFormStore:
+    """Fixed-size ring buffers of each team's latest results.
+
+    For every team the store keeps its last ``window`` home games, away
+    games and games overall: points for and against, the result and the
+    date, in ``(teams, 3, window)`` NumPy arrays, plus running sums of
+    points for and against. Recording a result overwrites the oldest slot
+    and adjusts the sums, so rolling means are O(1) and momentum and rest
+    days read at most ``window`` slots. Memory is a few hundred bytes per
+    team however long the history is.
+    """
+
+    def __init__(self, teams: Iterable[str] = NRL_CLUBS, window: int = 5):
+        """Allocate empty buffers for every known club."""
+        self.window = window
+        self._team_ids: Dict[str, int] = {}
+        for team in teams:
+            self._team_ids.setdefault(canonical_team(team), len(self._team_ids))
+
+        self._allocate(len(self._team_ids))
+        self._recorded: Set[str] = set()
+
+    def _allocate(self, n_teams: int) -> None:
+        shape = (n_teams, 3, self.window)
+        self._points_for = np.zeros(shape, dtype=np.int16)
+        self._points_against = np.zeros(shape, dtype=np.int16)
+        self._results = np.zeros(shape, dtype=np.int8)
+        self._dates = np.full(shape, NO_MATCH_TICKS, dtype=np.int64)
+        self._heads = np.zeros((n_teams, 3), dtype=np.int64)
+        self._counts = np.zeros((n_teams, 3), dtype=np.int64)
+        self._sum_for = np.zeros((n_teams, 3), dtype=np.float64)
+        self._sum_against = np.zeros((n_teams, 3), dtype=np.float64)
+
+    def _team_id(self, team_name: str) -> int:
+        team_name = canonical_team(team_name)
+        team_id = self._team_ids.get(team_name)
+        if team_id is None:
+            team_id = len(self._team_ids)
+            self._team_ids[team_name] = team_id
+            previous = {
+                name: getattr(self, name)
+                for name in (
+                    "_points_for", "_points_against", "_results", "_dates",
+                    "_heads", "_counts", "_sum_for", "_sum_against"
+                )
+            }
+            self._allocate(team_id + 1)
+            for name, values in previous.items():
+                getattr(self, name)[:team_id] = values
+        return team_id
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the buffers."""
+        return sum(
+            array.nbytes for array in (
+                self._points_for, self._points_against, self._results, self._dates,
+                self._heads, self._counts, self._sum_for, self._sum_against
+            )
+        )
+
+    def record_result(
+        self,
+        team_home: str,
+        team_away: str,
+        home_score: int,
+        away_score: int,
+        match_date: datetime,
+        match_id: Optional[str] = None
+    ) -> None:
+        """Push a completed match into both teams' buffers.
+
+        Results carrying a ``match_id`` that was already recorded are
+        ignored, so redelivered events do not count twice.
+        """
+        if match_id is not None:
+            if match_id in self._recorded:
+                return
+            self._recorded.add(match_id)
+
+        home = self._team_id(team_home)
+        away = self._team_id(team_away)
+        ticks = to_ticks(match_date)
+        if home_score > away_score:
+            home_result, away_result = _WIN, _LOSS
+        elif home_score < away_score:
+            home_result, away_result = _LOSS, _WIN
+        else:
+            home_result = away_result = _DRAW
+
+        self._push(home, HOME, ticks, home_score, away_score, home_result)
+        self._push(home, ALL, ticks, home_score, away_score, home_result)
+        self._push(away, AWAY, ticks, away_score, home_score, away_result)
+        self._push(away, ALL, ticks, away_score, home_score, away_result)
+
+    def record_match(self, match: Match) -> None:
+        """Push a completed ``Match``; matches without a score are ignored."""
+        if match.home_score is None or match.away_score is None:
+            return
+        self.record_result(
+            match.team_home,
+            match.team_away,
+            match.home_score,
+            match.away_score,
+            match.match_date,
+            match.match_id
+        )
+
+    def replay(self, matches: Iterable[Match]) -> None:
+        """Push a batch of historical matches in date order."""
+        for match in sorted(matches, key=lambda m: to_ticks(m.match_date)):
+            self.record_match(match)
+
+    def _slots(self, team_id: int, split: int) -> np.ndarray:
+        """Return buffer slots from oldest to newest."""
+        count = int(self._counts[team_id, split])
+        head = int(self._heads[team_id, split])
+        if count < self.window:
+            return np.arange(count)
+        return (head + np.arange(self.window)) % self.window
+
+    def _push(
+        self,
+        team_id: int,
+        split: int,
+        ticks: int,
+        points_for: int,
+        points_against: int,
+        result: int
+    ) -> None:
+        count = int(self._counts[team_id, split])
+        head = int(self._heads[team_id, split])
+        newest = (head - 1) % self.window
+
+        if count and ticks < self._dates[team_id, split, newest]:
+            self._insert_late(team_id, split, ticks, points_for, points_against, result)
+            return
+
+        if count == self.window:
+            self._sum_for[team_id, split] -= self._points_for[team_id, split, head]
+            self._sum_against[team_id, split] -= self._points_against[team_id, split, head]
+
+        self._points_for[team_id, split, head] = points_for
+        self._points_against[team_id, split, head] = points_against
+        self._results[team_id, split, head] = result
+        self._dates[team_id, split, head] = ticks
+        self._sum_for[team_id, split] += points_for
+        self._sum_against[team_id, split] += points_against
+        self._heads[team_id, split] = (head + 1) % self.window
+        self._counts[team_id, split] = min(count + 1, self.window)
+
+    def _insert_late(
+        self,
+        team_id: int,
+        split: int,
+        ticks: int,
+        points_for: int,
+        points_against: int,
+        result: int
+    ) -> None:
+        """Place an out-of-order result by date, keeping the newest ``window``."""
+        slots = self._slots(team_id, split)
+        dates = np.append(self._dates[team_id, split, slots], ticks)
+        order = np.argsort(dates, kind="stable")[-self.window:]
+
+        columns = (
+            (self._points_for, points_for),
+            (self._points_against, points_against),
+            (self._results, result),
+            (self._dates, ticks)
+        )
+        for array, value in columns:
+            values = np.append(array[team_id, split, slots], value)[order]
+            array[team_id, split, :len(values)] = values
+
+        count = len(order)
+        self._counts[team_id, split] = count
+        self._heads[team_id, split] = count % self.window
+        self._sum_for[team_id, split] = self._points_for[team_id, split, :count].sum()
+        self._sum_against[team_id, split] = self._points_against[team_id, split, :count].sum()
+
+    def has_results(
+        self,
+        team_name: str,
+        split: int = ALL,
+        before: Optional[datetime] = None
+    ) -> bool:
+        """Return whether a team has results recorded in ``split``.
+
+        With ``before``, every buffered result must also predate it, so the
+        window is the team's form as it stood at that date rather than one
+        that already includes later matches.
+        """
+        team_id = self._team_ids.get(canonical_team(team_name))
+        if team_id is None or not self._counts[team_id, split]:
+            return False
+        if before is None:
+            return True
+        newest = (int(self._heads[team_id, split]) - 1) % self.window
+        return bool(self._dates[team_id, split, newest] < to_ticks(before))
+
+    def rolling_mean(self, team_name: str, split: int, conceded: bool = False) -> float:
+        """Return mean points for (or against) over a team's window."""
+        team_id = self._team_ids.get(canonical_team(team_name))
+        if team_id is None or not self._counts[team_id, split]:
+            return 0.0
+        sums = self._sum_against if conceded else self._sum_for
+        return float(sums[team_id, split] / self._counts[team_id, split])
+
+    def scoring_average(self, team_name: str, is_home: bool) -> float:
+        """Return mean points scored in a team's last home or away games."""
+        return self.rolling_mean(team_name, HOME if is_home else AWAY)
+
+    def defensive_record(self, team_name: str, is_home: bool) -> float:
+        """Return mean points conceded in a team's last home or away games."""
+        return self.rolling_mean(team_name, HOME if is_home else AWAY, conceded=True)
+
+    def recent_form(self, team_name: str) -> List[str]:
+        """Return a team's latest results as W/D/L letters, oldest first."""
+        team_id = self._team_ids.get(canonical_team(team_name))
+        if team_id is None:
+            return []
+        results = self._results[team_id, ALL, self._slots(team_id, ALL)]
+        return [_RESULT_LETTERS[code] for code in results]
+
+    def momentum(self, team_name: str) -> float:
+        """Return recency-weighted form: later results count for more."""
+        team_id = self._team_ids.get(canonical_team(team_name))
+        if team_id is None or not self._counts[team_id, ALL]:
+            return 0.0
+        results = self._results[team_id, ALL, self._slots(team_id, ALL)]
+        weights = np.arange(1, len(results) + 1) / self.window
+        points = np.where(results == _WIN, 3.0, np.where(results == _DRAW, 1.0, 0.0))
+        return float((points * weights).sum() / len(results))
+
+    def rest_days(self, team_name: str, as_of: datetime) -> Optional[int]:
+        """Return days since a team's last buffered match before a date.
+
+        Returns None when no buffered match is earlier than ``as_of``.
+        """
+        team_id = self._team_ids.get(canonical_team(team_name))
+        if team_id is None:
+            return None
+        ticks = to_ticks(as_of)
+        dates = self._dates[team_id, ALL, self._slots(team_id, ALL)]
+        earlier = dates[dates < ticks]
+        if not len(earlier):
+            return None
+        return int((ticks - earlier[-1]) // _TICKS_PER_DAY)
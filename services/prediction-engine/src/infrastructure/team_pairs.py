@@ -0,0 +1,189 @@
+"""Dense per-pair head-to-head counts and rivalry weights."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from ..domain.models import Match
+from ..domain.teams import NRL_CLUBS, RIVALRY_FACTORS, RIVALRY_SCORES, canonical_team
+from .match_history import to_ticks
+
+
+# Arrays persisted by save() and memory-mapped by load().
+_COUNT_ARRAYS = ("games", "home_wins", "draws")
+_WEIGHT_ARRAYS = ("rivalry_scores", "rivalry_factors")
+
+
+class TeamPairMatrix:
+    """``(teams, teams)`` matrices of head-to-head results between clubs.
+
+    Row ``i``, column ``j`` counts matches with club ``i`` at home to club
+    ``j``: games played, home wins and draws, from which head-to-head
+    totals and the home side's venue advantage in the fixture follow.
+    Symmetric rivalry scores (routing) and rivalry factors (features) are
+    seeded from the domain tables. Every lookup is two dictionary hits and
+    an array read, and recording a result increments two cells.
+
+    A matrix built from the full match history can be saved as ``.npy``
+    files and loaded copy-on-write memory-mapped, so processes share the
+    pages and result updates stay private to the process applying them.
+    """
+
+    def __init__(self, teams: Iterable[str] = NRL_CLUBS):
+        """Allocate empty counts for every known club."""
+        self._team_ids: Dict[str, int] = {}
+        for team in teams:
+            self._team_ids.setdefault(canonical_team(team), len(self._team_ids))
+
+        n_teams = len(self._team_ids)
+        self.games = np.zeros((n_teams, n_teams), dtype=np.int32)
+        self.home_wins = np.zeros((n_teams, n_teams), dtype=np.int32)
+        self.draws = np.zeros((n_teams, n_teams), dtype=np.int32)
+        self.rivalry_scores = np.zeros((n_teams, n_teams), dtype=np.float64)
+        self.rivalry_factors = np.ones((n_teams, n_teams), dtype=np.float64)
+        self._recorded: Set[str] = set()
+
+        for (team_a, team_b), score in RIVALRY_SCORES.items():
+            self._set_symmetric("rivalry_scores", team_a, team_b, score)
+        for (team_a, team_b), factor in RIVALRY_FACTORS.items():
+            self._set_symmetric("rivalry_factors", team_a, team_b, factor)
+
+    def _set_symmetric(self, name: str, team_a: str, team_b: str, value: float) -> None:
+        a = self._team_id(team_a)
+        b = self._team_id(team_b)
+        # Look the array up after _team_id, which may have grown it.
+        array = getattr(self, name)
+        array[a, b] = array[b, a] = value
+
+    def _team_id(self, team_name: str) -> int:
+        team_name = canonical_team(team_name)
+        team_id = self._team_ids.get(team_name)
+        if team_id is None:
+            team_id = len(self._team_ids)
+            self._team_ids[team_name] = team_id
+            for name in _COUNT_ARRAYS + _WEIGHT_ARRAYS:
+                fill = 1.0 if name == "rivalry_factors" else 0
+                setattr(self, name, np.pad(getattr(self, name), (0, 1), constant_values=fill))
+        return team_id
+
+    def _pair(self, team_home: str, team_away: str) -> Optional[Tuple[int, int]]:
+        home = self._team_ids.get(canonical_team(team_home))
+        away = self._team_ids.get(canonical_team(team_away))
+        if home is None or away is None:
+            return None
+        return home, away
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the matrices."""
+        return sum(getattr(self, name).nbytes for name in _COUNT_ARRAYS + _WEIGHT_ARRAYS)
+
+    def record_result(
+        self,
+        team_home: str,
+        team_away: str,
+        home_score: int,
+        away_score: int,
+        match_date: datetime,
+        match_id: Optional[str] = None
+    ) -> None:
+        """Count a completed match for the pair.
+
+        Results carrying a ``match_id`` that was already recorded are
+        ignored, so redelivered events do not count twice.
+        """
+        if match_id is not None:
+            if match_id in self._recorded:
+                return
+            self._recorded.add(match_id)
+
+        home = self._team_id(team_home)
+        away = self._team_id(team_away)
+        self.games[home, away] += 1
+        if home_score > away_score:
+            self.home_wins[home, away] += 1
+        elif home_score == away_score:
+            self.draws[home, away] += 1
+
+    def record_match(self, match: Match) -> None:
+        """Count a completed ``Match``; matches without a score are ignored."""
+        if match.home_score is None or match.away_score is None:
+            return
+        self.record_result(
+            match.team_home,
+            match.team_away,
+            match.home_score,
+            match.away_score,
+            match.match_date,
+            match.match_id
+        )
+
+    def replay(self, matches: Iterable[Match]) -> None:
+        """Count a batch of historical matches."""
+        for match in sorted(matches, key=lambda m: to_ticks(m.match_date)):
+            self.record_match(match)
+
+    def head_to_head_matches(self, team_a: str, team_b: str) -> int:
+        """Return completed matches between two clubs at either venue."""
+        pair = self._pair(team_a, team_b)
+        if pair is None:
+            return 0
+        a, b = pair
+        return int(self.games[a, b] + self.games[b, a])
+
+    def rivalry_score(self, team_a: str, team_b: str) -> float:
+        """Return the routing rivalry score of a fixture, 0.0 if none."""
+        pair = self._pair(team_a, team_b)
+        return 0.0 if pair is None else float(self.rivalry_scores[pair])
+
+    def rivalry_factor(self, team_a: str, team_b: str) -> float:
+        """Return the feature rivalry multiplier of a fixture, 1.0 if none."""
+        pair = self._pair(team_a, team_b)
+        return 1.0 if pair is None else float(self.rivalry_factors[pair])
+
+    def venue_advantage(self, team_home: str, team_away: str) -> float:
+        """Return the home side's net win rate when hosting this opponent.
+
+        Ranges from -1.0 (the away side always won) to 1.0 (the home side
+        always won); 0.0 when the fixture has never been played.
+        """
+        pair = self._pair(team_home, team_away)
+        if pair is None or not self.games[pair]:
+            return 0.0
+        games = self.games[pair]
+        away_wins = games - self.home_wins[pair] - self.draws[pair]
+        return float((self.home_wins[pair] - away_wins) / games)
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """Write the matrices, team order and recorded match ids as ``.npy`` files."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in _COUNT_ARRAYS + _WEIGHT_ARRAYS:
+            np.save(directory / f"{name}.npy", np.ascontiguousarray(getattr(self, name)))
+        np.save(directory / "teams.npy", np.array(list(self._team_ids), dtype=str))
+        np.save(directory / "match_ids.npy", np.array(sorted(self._recorded), dtype=str))
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "TeamPairMatrix":
+        """Load matrices written by ``save``.
+
+        With ``mmap`` the matrices are mapped copy-on-write: pages are read
+        from the file on demand and shared between processes until a result
+        event modifies them.
+        """
+        directory = Path(directory)
+        matrix = cls.__new__(cls)
+        matrix._team_ids = {
+            str(team): team_id
+            for team_id, team in enumerate(np.load(directory / "teams.npy"))
+        }
+        for name in _COUNT_ARRAYS + _WEIGHT_ARRAYS:
+            setattr(
+                matrix,
+                name,
+                np.load(directory / f"{name}.npy", mmap_mode="c" if mmap else None)
+            )
+        matrix._recorded = {str(match_id) for match_id in np.load(directory / "match_ids.npy")}
+        return matrix
@@ -1,5 +1,6 @@
 """FastAPI interface for prediction engine service."""
 
+import asyncio
 import os
 from pathlib import Path
 from typing import Dict, Any
@@ -24,12 +25,21 @@ from shared.data_contracts.prediction import (
 )
 
 from ..application.use_cases import PredictMatchUseCase, GetModelPerformanceUseCase
+from ..application.match_result_subscriber import MatchResultSubscriber
+from ..application.model_hot_swap import ModelHotSwapper, check_probabilities
+from ..domain.models import PredictionFeatures, TeamStats
 from ..infrastructure.repositories import (
     DatabaseModelRepository, 
     DatabaseDataRepository,
     CachedDataRepository
 )
 from ..infrastructure.feature_engineering import StandardFeatureEngineer
+from ..infrastructure.elo_ratings import EloRatingEngine
+from ..infrastructure.model_store import MappedModelStore
+from ..infrastructure.team_form import TeamFormStore
+from ..infrastructure.team_pairs import TeamPairMatrix
+from ..modules.logistic_regression.model import LogisticRegressionModel
+from ....shared.events.event_bus import KafkaEventBus
 
 
 # Configure telemetry and logging
@@ -59,18 +69,58 @@ instrument_fastapi(app, "prediction-engine")
 
 # Global dependencies (in production, these would be properly configured)
 redis_client = None
+event_bus = None
 db_session = None
+model_store = None
+model_swapper = None
 model_repository = None
 data_repository = None
 feature_engineer = None
 predict_use_case = None
 performance_use_case = None
 
+# Synthetic fixtures a reloaded model must predict sensibly before it serves.
+CANARY_FEATURES = [
+    PredictionFeatures(
+        home_team_stats=TeamStats(home, 1500.0 + 40 * i, ["W", "L", "W"], 22.0, 18.0),
+        away_team_stats=TeamStats(away, 1500.0 - 40 * i, ["L", "W", "L"], 18.0, 22.0),
+        elo_difference=80.0 * i,
+        home_advantage=1.0,
+        head_to_head_record={"home_wins": 2, "away_wins": 1},
+        recent_encounters=[]
+    )
+    for i, (home, away) in enumerate([
+        ("Brisbane Broncos", "Melbourne Storm"),
+        ("Penrith Panthers", "Sydney Roosters"),
+        ("Parramatta Eels", "Canterbury Bulldogs")
+    ])
+]
+
+
+def load_logistic_regression(path: Path) -> LogisticRegressionModel:
+    """Build and load a logistic regression model; runs in a worker thread."""
+    model = LogisticRegressionModel(path, model_store)
+    asyncio.run(model.is_ready())
+    return model
+
+
+async def validate_canary(model: LogisticRegressionModel) -> None:
+    """Raise unless the model predicts valid distributions for the canary fixtures."""
+    for features in CANARY_FEATURES:
+        output = await model.predict(features, PredictionType.MATCH_WINNER)
+        check_probabilities(output.probabilities)
+
+
+async def swap_logistic_regression(model: LogisticRegressionModel) -> None:
+    """Serve a validated logistic regression model for new requests."""
+    model_repository.replace_model(ModelType.LOGISTIC_REGRESSION, model)
+
 
 @app.on_event("startup")
 async def startup_event():
     """Initialise dependencies on startup."""
-    global redis_client, db_session, model_repository, data_repository
+    global redis_client, event_bus, db_session, model_store, model_swapper
+    global model_repository, data_repository
     global feature_engineer, predict_use_case, performance_use_case
     
     logger.info("Starting Prediction Engine service...")
@@ -84,12 +134,43 @@ async def startup_event():
     
     # Initialise repositories
     # Note: In production, db_session would be properly configured with SQLAlchemy
-    model_repository = DatabaseModelRepository(db_session, models_path)
-    db_data_repository = DatabaseDataRepository(db_session)
+    model_store = MappedModelStore(os.getenv("MODEL_STORE_DIR"))
+    model_repository = DatabaseModelRepository(db_session, models_path, model_store)
+    rating_engine = EloRatingEngine()
+    form_store = TeamFormStore()
+    team_pairs_path = os.getenv("TEAM_PAIRS_PATH")
+    team_pairs = TeamPairMatrix.load(team_pairs_path) if team_pairs_path else TeamPairMatrix()
+    db_data_repository = DatabaseDataRepository(db_session, rating_engine)
     data_repository = CachedDataRepository(db_data_repository, redis_client)
     
+    # Keep cached team data fresh as results are recorded
+    kafka_servers = os.getenv("KAFKA_BOOTSTRAP_SERVERS")
+    if kafka_servers:
+        event_bus = KafkaEventBus(bootstrap_servers=kafka_servers)
+        await event_bus.start()
+        await MatchResultSubscriber(
+            data_repository=data_repository,
+            rating_engine=rating_engine,
+            form_store=form_store,
+            team_pairs=team_pairs
+        ).subscribe(event_bus)
+    
+    # Rebuild ratings, form and head-to-head counts from stored results
+    # before serving, so a restarted worker does not reset every club to
+    # the initial rating or read empty head-to-head records. Subscribing
+    # first means a result recorded meanwhile is not lost; every store
+    # ignores a match it has already applied, including the matches a
+    # loaded team-pair matrix was saved with.
+    history = await db_data_repository.get_completed_matches()
+    rating_engine.replay(history)
+    form_store.replay(history)
+    team_pairs.replay(history)
+    logger.info(
+        "Replayed stored results into ratings, form and team pairs", matches=len(history)
+    )
+    
     # Initialise feature engineering
-    feature_engineer = StandardFeatureEngineer(data_repository)
+    feature_engineer = StandardFeatureEngineer(data_repository, form_store, team_pairs)
     
     # Initialise use cases
     predict_use_case = PredictMatchUseCase(
@@ -99,16 +180,46 @@ async def startup_event():
     )
     performance_use_case = GetModelPerformanceUseCase(model_repository)
     
+    # Load weights before traffic so per-worker memory is known up front
+    lr_model = await model_repository.load_model(ModelType.LOGISTIC_REGRESSION)
+    await lr_model.is_ready()
+    memory = model_store.statistics()
+    MetricsCollector.update_process_memory(memory["memory"])
+    logger.info(
+        "Model weights loaded",
+        memory_before_load=memory["memory_before_load"],
+        memory=memory["memory"]
+    )
+    
+    # Swap in a new logistic regression artifact without a restart
+    model_swapper = ModelHotSwapper(
+        models_path, float(os.getenv("MODEL_WATCH_INTERVAL_SECONDS", "10"))
+    )
+    model_swapper.watch(
+        "logistic_regression_model.joblib",
+        ModelType.LOGISTIC_REGRESSION,
+        load=load_logistic_regression,
+        validate=validate_canary,
+        swap=swap_logistic_regression
+    )
+    model_swapper.start()
+    
     logger.info("Prediction Engine service started successfully")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
-    global redis_client
+    global redis_client, event_bus
     
     logger.info("Shutting down Prediction Engine service...")
     
+    if model_swapper:
+        await model_swapper.stop()
+    
+    if event_bus:
+        await event_bus.stop()
+    
     if redis_client:
         await redis_client.close()
     
@@ -305,7 +416,9 @@ async def get_service_metrics():
         "service": "prediction-engine",
         "status": "operational",
         "models_loaded": 1,
-        "cache_status": "active" if redis_client else "disabled"
+        "cache_status": "active" if redis_client else "disabled",
+        "model_store": model_store.statistics() if model_store else None,
+        "model_reloads": model_swapper.statistics() if model_swapper else None
     }
 
 
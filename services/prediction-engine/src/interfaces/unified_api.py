@@ -2,12 +2,13 @@
 
 import os
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 import asyncio
 
 from fastapi import FastAPI, HTTPException, Depends, status, Query, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
+import redis.asyncio as redis
 import structlog
 
 from shared.auth.firebase import get_current_user, require_tier, User
@@ -18,9 +19,16 @@ from shared.monitoring.telemetry import (
     MetricsCollector
 )
 
-from ..application.prediction_service import PredictionService
+from ..application.model_hot_swap import ModelHotSwapper
+from ..application.prediction_service import MODEL_ARTIFACTS, PredictionService
+from ..application.inference_executor import ExecutionMode, InferenceQueueFullError
+from ..application.micro_batcher import MicroBatchDispatcher, MicroBatchQueueFullError
+from ..application.match_result_subscriber import MatchResultSubscriber
 from ..application.moe_router import RoutingStrategy
-from ..domain.prediction_models import MatchDetails, PredictionType, ModelType
+from ..infrastructure.prediction_cache import PredictionCache
+from ..infrastructure.repositories import DatabaseDataRepository
+from ..infrastructure.team_pairs import TeamPairMatrix
+from ..domain.prediction_models import MatchDetails, PredictionModel, PredictionType, ModelType
 from ....shared.events.event_bus import KafkaEventBus, InMemoryEventBus
 
 tracer, meter = setup_telemetry("prediction-engine")
@@ -44,7 +52,11 @@ app.add_middleware(
 
 instrument_fastapi(app, "prediction-engine")
 
+# Note: In production, db_session would be properly configured with SQLAlchemy
+db_session = None
 prediction_service: Optional[PredictionService] = None
+micro_batcher: Optional[MicroBatchDispatcher] = None
+model_swapper: Optional[ModelHotSwapper] = None
 
 
 class PredictionRequest(BaseModel):
@@ -87,6 +99,7 @@ class ModelStatusResponse(BaseModel):
     name: str
     version: str
     is_ready: bool
+    state: Optional[str] = None
     usage_count: int
     accuracy: Optional[float] = None
     supported_types: List[str]
@@ -98,12 +111,29 @@ class ServiceMetricsResponse(BaseModel):
     available_models: int
     model_usage_stats: Dict[str, int]
     routing_statistics: Dict[str, Any]
+    model_performance: Dict[str, Any]
+
+
+def parse_traffic_share(value: Optional[str]) -> Dict[ModelType, float]:
+    """Parse ``model=share`` pairs, e.g. ``lightgbm=0.5,logistic_regression=0.3``."""
+    traffic_share = {}
+    for pair in filter(None, (value or "").split(",")):
+        model_type, _, share = pair.partition("=")
+        traffic_share[ModelType(model_type.strip())] = float(share)
+    return traffic_share
+
+
+def load_warm_model(factory: Callable[[], PredictionModel]) -> PredictionModel:
+    """Build and warm a model from its factory; runs in a worker thread."""
+    model = factory()
+    asyncio.run(model.is_ready())
+    return model
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize the prediction service on startup."""
-    global prediction_service
+    global prediction_service, micro_batcher, model_swapper
     
     logger.info("Starting Unified Prediction Engine...")
     
@@ -125,18 +155,117 @@ async def startup_event():
         os.getenv("ROUTING_STRATEGY", "performance_based")
     )
     
+    prediction_cache = None
+    if os.getenv("PREDICTION_CACHE_ENABLED", "true").lower() == "true":
+        redis_url = os.getenv("REDIS_URL")
+        prediction_cache = PredictionCache(
+            redis_client=redis.from_url(redis_url) if redis_url else None,
+            max_entries=int(os.getenv("PREDICTION_CACHE_MAX_ENTRIES", "10000")),
+            ttl_seconds=float(os.getenv("PREDICTION_CACHE_TTL_SECONDS", "3600"))
+        )
+        logger.info("Prediction cache enabled", redis=bool(redis_url))
+    
+    team_pairs_path = os.getenv("TEAM_PAIRS_PATH")
+    team_pairs = TeamPairMatrix.load(team_pairs_path) if team_pairs_path else TeamPairMatrix()
+    
     prediction_service = PredictionService(
         event_bus=event_bus,
-        routing_strategy=routing_strategy
+        routing_strategy=routing_strategy,
+        prediction_cache=prediction_cache,
+        ensemble_deadline_ms=float(os.getenv("ENSEMBLE_DEADLINE_MS", "250")),
+        ensemble_fallback_ms=float(os.getenv("ENSEMBLE_FALLBACK_MS", "1000")),
+        gating_weights_path=os.getenv("GATING_WEIGHTS_PATH"),
+        team_pairs=team_pairs,
+        execution_mode=ExecutionMode(os.getenv("INFERENCE_EXECUTOR_MODE", "inline")),
+        inference_workers=int(os.getenv("INFERENCE_WORKERS", "2")),
+        max_inference_queue_depth=int(os.getenv("INFERENCE_MAX_QUEUE_DEPTH", "32"))
     )
+    await prediction_service.inference_executor.start()
+    
+    if event_bus:
+        await MatchResultSubscriber(
+            prediction_cache=prediction_cache,
+            team_pairs=team_pairs
+        ).subscribe(event_bus)
+        await prediction_service.performance_tracker.subscribe(event_bus)
+    
+    # Count stored results into the team-pair matrix before serving, so
+    # head-to-head counts and venue advantage survive a restart. Subscribing
+    # first means a result recorded meanwhile is not lost; the matrix
+    # ignores matches it already holds, including those it was saved with.
+    history = await DatabaseDataRepository(db_session).get_completed_matches()
+    team_pairs.replay(history)
+    logger.info("Replayed stored results into team pairs", matches=len(history))
     
-    logger.info("Warming up prediction models...")
-    available_models = await prediction_service.get_available_models()
-    logger.info(f"Successfully initialized {len(available_models)} prediction models")
+    # Models load in the background, busiest first; start-up waits at most
+    # the budget and then serves with whichever models are ready.
+    logger.info("Loading prediction models in the background...")
+    prediction_service.start_model_loading(parse_traffic_share(os.getenv("MODEL_TRAFFIC_SHARE")))
+    await prediction_service.model_loader.wait(
+        float(os.getenv("MODEL_STARTUP_BUDGET_SECONDS", "5"))
+    )
+    prediction_service.readiness.start(
+        float(os.getenv("MODEL_READINESS_PROBE_SECONDS", "30"))
+    )
+    logger.info(
+        f"Serving with {len(prediction_service.readiness.ready_models())} ready prediction models",
+        loading=prediction_service.model_loader.status()
+    )
+    
+    models_dir = os.getenv("MODELS_PATH")
+    if models_dir:
+        model_swapper = ModelHotSwapper(
+            models_dir, float(os.getenv("MODEL_WATCH_INTERVAL_SECONDS", "10"))
+        )
+        for model_type, filename in MODEL_ARTIFACTS.items():
+            factory = prediction_service.model_factories[model_type]
+            model_swapper.watch(
+                filename,
+                model_type,
+                load=lambda path, factory=factory: load_warm_model(factory),
+                validate=prediction_service.validate_model,
+                swap=prediction_service.swap_model
+            )
+            artifact_version = model_swapper.artifact_version(filename)
+            if artifact_version:
+                prediction_service.artifact_versions[model_type] = artifact_version
+        model_swapper.start()
+        logger.info("Watching model artifacts for reloads", models_dir=models_dir)
+    
+    if os.getenv("MICRO_BATCH_ENABLED", "false").lower() == "true":
+        micro_batcher = MicroBatchDispatcher(
+            prediction_service,
+            max_batch_size=int(os.getenv("MICRO_BATCH_MAX_SIZE", "16")),
+            max_wait_ms=float(os.getenv("MICRO_BATCH_MAX_WAIT_MS", "5")),
+            max_queue_depth=int(os.getenv("MICRO_BATCH_MAX_QUEUE_DEPTH", "256")),
+            max_concurrent_batches=int(os.getenv("MICRO_BATCH_MAX_CONCURRENCY", "4"))
+        )
+        await micro_batcher.start()
+        logger.info("Micro-batching enabled for /predict")
     
     logger.info("Unified Prediction Engine started successfully")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background workers on shutdown."""
+    if micro_batcher:
+        await micro_batcher.stop()
+    
+    if model_swapper:
+        await model_swapper.stop()
+    
+    if prediction_service:
+        await prediction_service.model_loader.stop()
+        await prediction_service.readiness.stop()
+        await prediction_service.inference_executor.stop()
+    
+    if prediction_service and prediction_service.prediction_cache:
+        redis_client = prediction_service.prediction_cache.redis_client
+        if redis_client:
+            await redis_client.close()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -148,7 +277,7 @@ async def health_check():
     
     health = await prediction_service.health_check()
     
-    if health["status"] != "healthy":
+    if health["status"] == "unhealthy":
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Service unhealthy"
@@ -157,6 +286,30 @@ async def health_check():
     return health
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness check: ready once at least one model can serve."""
+    if not prediction_service:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Prediction service not initialized"
+        )
+    
+    ready_models = prediction_service.readiness.ready_models()
+    loading = prediction_service.model_loader.status()
+    if not ready_models:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"status": "loading", "models": loading}
+        )
+    
+    return {
+        "status": "ready",
+        "ready_models": [model.model_type.value for model in ready_models],
+        "models": loading
+    }
+
+
 @app.post("/predict", response_model=PredictionResponse)
 async def predict_match(
     request: PredictionRequest,
@@ -194,12 +347,19 @@ async def predict_match(
             team_away=request.team_away
         )
         
-        result = await prediction_service.predict(
-            match_details=match_details,
-            prediction_type=prediction_type,
-            user_id=user.uid,
-            force_model=force_model
-        )
+        if micro_batcher and not force_model:
+            result = await micro_batcher.submit(
+                match_details=match_details,
+                prediction_type=prediction_type,
+                user_id=user.uid
+            )
+        else:
+            result = await prediction_service.predict(
+                match_details=match_details,
+                prediction_type=prediction_type,
+                user_id=user.uid,
+                force_model=force_model
+            )
         
         MetricsCollector.record_prediction_latency(
             model="unified-engine",
@@ -237,6 +397,12 @@ async def predict_match(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid input: {str(e)}"
         )
+    except (MicroBatchQueueFullError, InferenceQueueFullError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
     except Exception as e:
         logger.error(
             "Prediction failed",
@@ -322,6 +488,12 @@ async def predict_batch(
         
         return responses
         
+    except InferenceQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
     except Exception as e:
         logger.error(
             "Batch prediction failed",
@@ -354,6 +526,7 @@ async def get_model_status():
             name=status.get("name", "Unknown"),
             version=status.get("version", "Unknown"),
             is_ready=status.get("is_ready", False),
+            state=status.get("state"),
             usage_count=status.get("usage_count", 0),
             accuracy=status.get("metrics", {}).get("accuracy") if status.get("metrics") else None,
             supported_types=status.get("supported_prediction_types", [])
@@ -380,7 +553,8 @@ async def get_service_metrics():
         average_processing_time_ms=service_info["average_processing_time_ms"],
         available_models=service_info["available_models"],
         model_usage_stats=metrics["model_usage_stats"],
-        routing_statistics=metrics["routing_statistics"]
+        routing_statistics=metrics["routing_statistics"],
+        model_performance=metrics["model_performance"]
     )
 
 
@@ -423,7 +597,8 @@ async def root():
             "/predict/batch", 
             "/models/status",
             "/metrics",
-            "/health"
+            "/health",
+            "/ready"
         ]
     }
 
@@ -0,0 +1,138 @@
+"""Fused NumPy inference kernel for fitted logistic regression pipelines."""
+
+import math
+import operator
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+
+def _sigmoid(logit: float) -> float:
+    """Logistic function that cannot overflow ``math.exp``."""
+    if logit >= 0:
+        return 1.0 / (1.0 + math.exp(-logit))
+    odds = math.exp(logit)
+    return odds / (1.0 + odds)
+
+
+def _sigmoid_array(logits: np.ndarray) -> np.ndarray:
+    """Element-wise ``_sigmoid`` without overflow warnings."""
+    odds = np.exp(-np.abs(logits))
+    return np.where(logits >= 0, 1.0 / (1.0 + odds), odds / (1.0 + odds))
+
+
+class LogisticKernel:
+    """Standardise, project and normalise in one pass over a feature matrix.
+
+    The scaler is folded into the coefficients at export time: for
+    ``z = (x - mean) / scale`` and logits ``z @ coef.T + intercept`` the
+    kernel stores ``coef / scale`` and ``intercept - (mean / scale) @
+    coef.T``, so inference is one matrix product plus the link function
+    sklearn would apply (sigmoid for two classes, softmax otherwise, or
+    normalised one-vs-rest sigmoids for ``multi_class="ovr"`` models and
+    for ``liblinear`` models fitted under ``multi_class="auto"``, which
+    older sklearn releases also trained one-vs-rest).
+    Results match ``Pipeline.predict_proba`` to floating-point rounding.
+
+    ``predict_one`` evaluates a single row with plain float arithmetic,
+    which for a handful of features beats the fixed cost of NumPy calls.
+    """
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        bias: np.ndarray,
+        classes: np.ndarray,
+        one_vs_rest: bool = False
+    ):
+        """Use folded ``weights`` of shape ``(n_logits, n_features)`` and ``bias``."""
+        self.weights_t = np.ascontiguousarray(weights.T, dtype=np.float64)
+        self.bias = np.ascontiguousarray(bias, dtype=np.float64)
+        self.classes = classes
+        self.one_vs_rest = one_vs_rest
+        self.n_features = self.weights_t.shape[0]
+        self._weight_rows = [list(map(float, column)) for column in self.weights_t.T]
+        self._bias_values = list(map(float, self.bias))
+
+    @classmethod
+    def from_estimator(cls, estimator: Any) -> Optional["LogisticKernel"]:
+        """Export a fitted ``LogisticRegression``, optionally behind a ``StandardScaler``.
+
+        Returns ``None`` for any other pipeline shape, which callers should
+        keep evaluating through sklearn.
+        """
+        steps = [step for _, step in estimator.steps] if isinstance(estimator, Pipeline) else [estimator]
+        classifier = steps[-1]
+        if not isinstance(classifier, LogisticRegression) or not hasattr(classifier, "coef_"):
+            return None
+
+        coef = np.asarray(classifier.coef_, dtype=np.float64)
+        intercept = np.asarray(classifier.intercept_, dtype=np.float64)
+        if len(steps) == 2:
+            scaler = steps[0]
+            if not isinstance(scaler, StandardScaler):
+                return None
+            # sklearn fills mean_ even with with_mean=False; transform ignores it.
+            if scaler.with_mean and scaler.mean_ is not None:
+                mean = scaler.mean_
+            else:
+                mean = np.zeros(coef.shape[1])
+            if scaler.with_std and scaler.scale_ is not None:
+                scale = scaler.scale_
+            else:
+                scale = np.ones(coef.shape[1])
+            coef = coef / scale
+            intercept = intercept - coef @ mean
+        elif len(steps) != 1:
+            return None
+
+        # Releases that had multi_class defaulted it to "auto" (later
+        # "deprecated"), which meant one-vs-rest for liblinear.
+        multi_class = getattr(classifier, "multi_class", "auto")
+        one_vs_rest = coef.shape[0] > 1 and (
+            multi_class == "ovr"
+            or (multi_class in ("auto", "deprecated") and classifier.solver == "liblinear")
+        )
+        return cls(coef, intercept, classifier.classes_, one_vs_rest)
+
+    def predict_one(self, row: Sequence[float]) -> List[float]:
+        """Return class probabilities for one feature row."""
+        logits = [
+            bias + sum(map(operator.mul, weights, row))
+            for weights, bias in zip(self._weight_rows, self._bias_values)
+        ]
+        if len(logits) == 1:
+            positive = _sigmoid(logits[0])
+            return [1.0 - positive, positive]
+
+        if self.one_vs_rest:
+            scores = [_sigmoid(logit) for logit in logits]
+        else:
+            top = max(logits)
+            scores = [math.exp(logit - top) for logit in logits]
+        total = sum(scores)
+        return [score / total for score in scores]
+
+    def predict_proba(self, rows: Any) -> np.ndarray:
+        """Return class probabilities for a ``(n_rows, n_features)`` matrix or one row."""
+        x = np.asarray(rows, dtype=np.float64)
+        if x.ndim == 1:
+            x = x[None, :]
+        logits = x @ self.weights_t
+        logits += self.bias
+
+        if logits.shape[1] == 1:
+            positive = _sigmoid_array(logits[:, 0])
+            return np.column_stack((1.0 - positive, positive))
+
+        if self.one_vs_rest:
+            probabilities = _sigmoid_array(logits)
+        else:
+            logits -= logits.max(axis=1, keepdims=True)
+            probabilities = np.exp(logits, out=logits)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return probabilities
@@ -1,7 +1,7 @@
 """Logistic Regression prediction model implementation."""
 
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import numpy as np
 import joblib
 from pathlib import Path
@@ -12,18 +12,27 @@ from sklearn.pipeline import Pipeline
 
 from shared.data_contracts.prediction import PredictionType, ModelType
 from ...domain.models import PredictionModel, PredictionFeatures, PredictionOutput
+from ...infrastructure.model_store import MappedModelStore
+from .kernel import LogisticKernel
 
 
 class LogisticRegressionModel(PredictionModel):
     """Logistic Regression implementation for match predictions."""
     
-    def __init__(self, model_path: Path):
-        """Initialise the logistic regression model."""
+    def __init__(self, model_path: Path, model_store: Optional[MappedModelStore] = None):
+        """Initialise the logistic regression model.
+
+        With a ``model_store`` the pipeline's arrays are memory-mapped and
+        shared with other workers loading the same file.
+        """
         self.model_path = model_path
+        self.model_store = model_store
         self._pipeline = None
+        self._kernel: Optional[LogisticKernel] = None
         self._feature_names = None
         self._version = "1.0.0"
         self._is_loaded = False
+        self._metadata: Dict[str, Any] = {}
     
     @property
     def model_type(self) -> ModelType:
@@ -64,8 +73,11 @@ class LogisticRegressionModel(PredictionModel):
         feature_vector = self._extract_feature_vector(features)
         
         # Make prediction
-        probabilities = self._pipeline.predict_proba([feature_vector])[0]
-        predicted_class_idx = np.argmax(probabilities)
+        if self._kernel:
+            probabilities = self._kernel.predict_one(feature_vector)
+        else:
+            probabilities = self._pipeline.predict_proba([feature_vector])[0].tolist()
+        predicted_class_idx = probabilities.index(max(probabilities))
         
         # Map to standard outcomes
         class_names = ["away_win", "draw", "home_win"]  # Assuming this order
@@ -84,22 +96,28 @@ class LogisticRegressionModel(PredictionModel):
             prediction_type=prediction_type,
             model_type=self.model_type,
             predicted_value=predicted_value,
-            confidence=float(np.max(probabilities)),
+            confidence=max(probabilities),
             probabilities=prob_dict,
             model_version=self.model_version,
             features_used=self._feature_names or [],
             processing_time_ms=processing_time,
-            metadata={
-                "feature_importance": self._get_feature_importance(),
-                "model_params": self._get_model_params()
-            }
+            metadata=self._metadata
         )
     
+    def predict_proba(self, rows: Any) -> np.ndarray:
+        """Return class probabilities for a ``(n_rows, n_features)`` feature matrix."""
+        if self._kernel:
+            return self._kernel.predict_proba(rows)
+        return self._pipeline.predict_proba(np.asarray(rows, dtype=np.float64))
+    
     async def _load_model(self) -> None:
         """Load the trained model from disk."""
         try:
             if self.model_path.exists():
-                model_data = joblib.load(self.model_path)
+                if self.model_store:
+                    model_data = self.model_store.load(self.model_path)
+                else:
+                    model_data = joblib.load(self.model_path)
                 
                 if isinstance(model_data, dict):
                     # Structured model file
@@ -110,12 +128,17 @@ class LogisticRegressionModel(PredictionModel):
                     # Legacy model file (just the pipeline)
                     self._pipeline = model_data
                     self._feature_names = self._infer_feature_names()
-                
-                self._is_loaded = True
             else:
                 # Create a default model for development
                 self._create_default_model()
-                self._is_loaded = True
+            
+            # Export the fitted pipeline once; predictions reuse it
+            self._kernel = LogisticKernel.from_estimator(self._pipeline)
+            self._metadata = {
+                "feature_importance": self._get_feature_importance(),
+                "model_params": self._get_model_params()
+            }
+            self._is_loaded = True
                 
         except Exception as e:
             raise RuntimeError(f"Failed to load model: {e}")
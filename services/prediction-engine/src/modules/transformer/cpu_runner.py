@@ -0,0 +1,207 @@
+"""CPU inference for the transformer predictor: int8 weights, traced graphs, bucketed batches."""
+
+import bisect
+import inspect
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import torch
+from torch import nn
+
+logger = logging.getLogger(__name__)
+
+
+LENGTH_BUCKETS = (8, 16, 32, 64)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32)
+
+
+def bucket(size: int, buckets: Sequence[int]) -> int:
+    """Return the smallest bucket that holds ``size``, or the largest bucket."""
+    index = bisect.bisect_left(buckets, size)
+    return buckets[min(index, len(buckets) - 1)]
+
+
+def load_module(path: Union[str, Path]) -> nn.Module:
+    """Load a TorchScript archive or a pickled ``nn.Module`` onto the CPU.
+
+    A bare state dict cannot be loaded without the model class, so it is
+    rejected with a ``ValueError``.
+    """
+    try:
+        return torch.jit.load(str(path), map_location="cpu")
+    except RuntimeError:
+        pass
+    checkpoint = torch.load(path, map_location="cpu", weights_only=False)
+    if isinstance(checkpoint, nn.Module):
+        return checkpoint
+    raise ValueError(
+        f"{path} holds a {type(checkpoint).__name__}, not a model; "
+        "build the model and load its state dict before wrapping it"
+    )
+
+
+def accepts_padding_mask(model: nn.Module) -> bool:
+    """Return whether ``model.forward`` takes a ``src_key_padding_mask`` argument."""
+    try:
+        return "src_key_padding_mask" in inspect.signature(model.forward).parameters
+    except (TypeError, ValueError):
+        # TorchScript methods have no inspectable signature.
+        return False
+
+
+class CpuTransformerRunner:
+    """Runs a sequence model on CPU with the latency tricks GPU-less nodes need.
+
+    Linear layers are dynamically quantized to int8 (weights stored as
+    int8, activations quantized per batch), which roughly halves the cost
+    of the feed-forward blocks that dominate a small transformer. The
+    intra-op thread count is fixed when the runner is built; torch keeps
+    one pool per process, so each inference worker process should build
+    its own runner rather than contend for every core. Quantizing also
+    turns off torch's fused multi-head attention fast path for the
+    process.
+
+    Input sequences, each ``(length, n_features)``, are left-padded with
+    zeros so the latest step is always last, and batches are padded to a
+    batch bucket. Padding must not change a sequence's output, so when
+    the model's ``forward`` accepts ``src_key_padding_mask`` sequences are
+    padded to a length bucket and the model is called as ``model(inputs,
+    mask)`` with ``True`` at padded steps; otherwise sequences are only
+    grouped by their exact length. Sequences longer than the largest
+    bucket keep their most recent steps. Each (batch, length) shape is
+    traced with TorchScript the first time it is seen and the graph is
+    reused afterwards. A model that cannot be traced runs eagerly.
+    Everything runs under ``torch.inference_mode``.
+
+    The model must return logits of shape ``(batch, classes)``, or
+    ``(batch, length, classes)`` from which the last step is used.
+    """
+
+    def __init__(
+        self,
+        model: nn.Module,
+        quantize: bool = True,
+        threads: int = 1,
+        length_buckets: Sequence[int] = LENGTH_BUCKETS,
+        batch_buckets: Sequence[int] = BATCH_BUCKETS,
+        trace: bool = True,
+        padding_mask: Optional[bool] = None
+    ):
+        """Prepare ``model`` for CPU inference with ``threads`` intra-op threads.
+
+        ``padding_mask`` defaults to whether the model accepts one.
+        """
+        torch.set_num_threads(threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Only settable before the first parallel operation in the process.
+            pass
+
+        model = model.eval()
+        self.padding_mask = accepts_padding_mask(model) if padding_mask is None else padding_mask
+        self.quantized = quantize and not isinstance(model, torch.jit.ScriptModule)
+        if quantize and not self.quantized:
+            logger.warning("TorchScript models cannot be quantized dynamically; running fp32")
+        if self.quantized:
+            model = torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+            # The fused encoder fast path reads Linear weights as tensors,
+            # which quantized layers do not expose; like the thread pools,
+            # this is a process-wide setting.
+            set_fastpath = getattr(torch.backends.mha, "set_fastpath_enabled", None)
+            if set_fastpath is not None:
+                set_fastpath(False)
+
+        self.model = model
+        self.threads = threads
+        self.length_buckets = tuple(sorted(length_buckets))
+        self.batch_buckets = tuple(sorted(batch_buckets))
+        self.trace = trace
+        self._graphs: Dict[Tuple[int, int], Any] = {}
+
+    @classmethod
+    def from_checkpoint(cls, path: Union[str, Path], **kwargs: Any) -> "CpuTransformerRunner":
+        """Load ``path`` with ``load_module`` and wrap it."""
+        return cls(load_module(path), **kwargs)
+
+    def _graph(self, inputs: Tuple[torch.Tensor, ...]) -> Any:
+        """Return the cached graph for this input shape, tracing it on first use."""
+        key = (inputs[0].shape[0], inputs[0].shape[1])
+        graph = self._graphs.get(key)
+        if graph is None:
+            graph = self.model
+            if self.trace:
+                try:
+                    with torch.no_grad():
+                        graph = torch.jit.freeze(torch.jit.trace(self.model, inputs, check_trace=False))
+                except Exception as e:
+                    logger.warning(f"Could not trace transformer for batch/length {key}, running eagerly: {e}")
+            self._graphs[key] = graph
+        return graph
+
+    def pad(
+        self,
+        sequences: Sequence[np.ndarray],
+        batch_size: int,
+        length: int
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Left-pad ``sequences`` into a zero ``(batch_size, length, n_features)`` tensor.
+
+        Also returns the ``(batch_size, length)`` key padding mask, ``True``
+        at padded steps. Rows that only pad the batch are left unmasked so
+        attention over them stays finite; their outputs are discarded.
+        """
+        n_features = np.shape(sequences[0])[-1]
+        padded = np.zeros((batch_size, length, n_features), dtype=np.float32)
+        mask = np.zeros((batch_size, length), dtype=bool)
+        for row, sequence in enumerate(sequences):
+            steps = np.asarray(sequence, dtype=np.float32)[-length:]
+            padded[row, length - len(steps):] = steps
+            mask[row, :length - len(steps)] = True
+        return torch.from_numpy(padded), torch.from_numpy(mask)
+
+    def predict_proba(self, sequences: Sequence[np.ndarray]) -> np.ndarray:
+        """Return class probabilities for each sequence, in input order."""
+        by_length: Dict[int, List[int]] = {}
+        for index, sequence in enumerate(sequences):
+            if self.padding_mask:
+                length = bucket(len(sequence), self.length_buckets)
+            else:
+                length = min(len(sequence), self.length_buckets[-1])
+            by_length.setdefault(length, []).append(index)
+
+        largest_batch = self.batch_buckets[-1]
+        results: List[Any] = [None] * len(sequences)
+        with torch.inference_mode():
+            for length, indices in by_length.items():
+                for start in range(0, len(indices), largest_batch):
+                    chunk = indices[start:start + largest_batch]
+                    inputs, mask = self.pad(
+                        [sequences[i] for i in chunk], bucket(len(chunk), self.batch_buckets), length
+                    )
+                    arguments = (inputs, mask) if self.padding_mask else (inputs,)
+                    logits = self._graph(arguments)(*arguments)
+                    if logits.dim() == 3:
+                        logits = logits[:, -1]
+                    probabilities = torch.softmax(logits[:len(chunk)], dim=-1).numpy()
+                    for i, row in zip(chunk, probabilities):
+                        results[i] = row
+        return np.stack(results) if results else np.empty((0, 0))
+
+    def warm_up(self, n_features: int, batch_sizes: Sequence[int] = (1,)) -> None:
+        """Trace every length bucket for ``batch_sizes`` before traffic arrives."""
+        for batch_size in batch_sizes:
+            for length in self.length_buckets:
+                self.predict_proba([np.zeros((length, n_features), dtype=np.float32)] * batch_size)
+
+    def statistics(self) -> Dict[str, Any]:
+        """Return the runner's configuration and how many graphs are cached."""
+        return {
+            "quantized": self.quantized,
+            "padding_mask": self.padding_mask,
+            "threads": self.threads,
+            "graphs": len(self._graphs),
+            "traced": sum(graph is not self.model for graph in self._graphs.values())
+        }
@@ -0,0 +1,414 @@
+"""Flattened tree ensembles evaluated with vectorised NumPy traversal."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from sklearn.ensemble import (
+    ExtraTreesClassifier,
+    GradientBoostingClassifier,
+    HistGradientBoostingClassifier,
+    RandomForestClassifier,
+)
+from sklearn.pipeline import Pipeline
+
+
+# Per-tree node arrays: feature, threshold, left, right, missing_left, value.
+TreeArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+ARRAYS = ("feature", "threshold", "left", "right", "missing_left", "value", "roots", "base", "classes")
+LINKS = ("sigmoid", "softmax", "mean")
+
+
+def _tree(
+    feature: Sequence[int],
+    threshold: Sequence[float],
+    left: Sequence[int],
+    right: Sequence[int],
+    missing_left: Sequence[bool],
+    value: Any,
+    is_leaf: Sequence[bool]
+) -> TreeArrays:
+    """Normalise one tree's node arrays.
+
+    Nodes are renumbered breadth-first so every right child directly
+    follows its left sibling, and leaves point at themselves.
+    """
+    is_leaf = np.asarray(is_leaf, dtype=bool)
+    left = np.asarray(left)
+    right = np.asarray(right)
+    order = [0]
+    for node in order:
+        if not is_leaf[node]:
+            order.extend((left[node], right[node]))
+    order = np.asarray(order)
+    position = np.empty(len(is_leaf), dtype=np.int64)
+    position[order] = np.arange(len(order))
+
+    is_leaf = is_leaf[order]
+    nodes = np.arange(len(order))
+    children = np.where(is_leaf, nodes, position[np.where(is_leaf, 0, left[order])])
+    return (
+        np.where(is_leaf, 0, np.asarray(feature)[order]).astype(np.int32),
+        np.where(is_leaf, 0.0, np.asarray(threshold)[order]).astype(np.float64),
+        children.astype(np.int32),
+        np.where(is_leaf, nodes, children + 1).astype(np.int32),
+        np.asarray(missing_left, dtype=bool)[order] & ~is_leaf,
+        np.where(
+            is_leaf[:, None],
+            np.asarray(value, dtype=np.float64).reshape(len(position), -1)[order],
+            0.0
+        )
+    )
+
+
+def _one_hot(tree: TreeArrays, output: int, n_outputs: int) -> TreeArrays:
+    """Move a single-output tree's leaf values into column ``output``."""
+    value = np.zeros((len(tree[5]), n_outputs))
+    value[:, output] = tree[5][:, 0]
+    return tree[:5] + (value,)
+
+
+class FlatForest:
+    """A tree ensemble exported to flat node arrays.
+
+    Every tree's nodes are concatenated into parallel arrays (split
+    feature, threshold, left and right child, which way a missing value
+    goes) plus one row of leaf values per output. Nodes are numbered so a
+    right child always follows its left sibling and leaves point at
+    themselves. Prediction starts each row at every tree's root and
+    advances all (row, tree) pairs still on a split one level per step,
+    so the whole ensemble is evaluated with a few NumPy gathers per level
+    and no Python loop over trees or rows. Splits send ``x <= threshold``
+    left, as LightGBM and sklearn do.
+
+    Leaf values are summed across trees, scaled, offset by ``base`` and
+    passed through ``link``: ``sigmoid`` for binary boosting, ``softmax``
+    for multiclass boosting and ``mean`` for forests whose leaves already
+    hold class probabilities. Results match the source model's
+    ``predict_proba`` to floating-point rounding. The fixed per-call cost
+    is far below a native ``predict_proba`` for the single rows and small
+    batches online serving sends; for batches of thousands of rows the
+    compiled native predictor is still faster.
+
+    The arrays are the whole model: ``save`` writes them as ``.npy``
+    files and ``load`` can memory-map them back, so workers share one
+    read-only copy and loading costs no deserialisation.
+    """
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        missing_left: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        base: np.ndarray,
+        classes: np.ndarray,
+        link: str,
+        scale: float = 1.0,
+        max_depth: Optional[int] = None,
+        n_features: Optional[int] = None,
+        input_dtype: str = "float64"
+    ):
+        """Use concatenated node arrays whose trees start at ``roots``.
+
+        ``input_dtype`` is the precision the source model compared
+        features at; sklearn's classic trees round inputs to ``float32``.
+        """
+        if link not in LINKS:
+            raise ValueError(f"Unknown link {link!r}")
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.base = base
+        self.classes = classes
+        self.link = link
+        self.scale = scale
+        self.n_features = int(feature.max()) + 1 if n_features is None else n_features
+        self.input_dtype = input_dtype
+        self._internal = left != np.arange(len(left))
+        self.max_depth = self._depth() if max_depth is None else max_depth
+
+    @classmethod
+    def from_trees(
+        cls,
+        trees: List[TreeArrays],
+        base: Sequence[float],
+        classes: Sequence[Any],
+        link: str,
+        scale: float = 1.0,
+        n_features: Optional[int] = None,
+        input_dtype: str = "float64"
+    ) -> "FlatForest":
+        """Concatenate per-tree arrays, offsetting child indices.
+
+        Each tree's ``value`` is ``(n_nodes, n_outputs)``; the ensemble
+        stores it transposed so each output's leaf values are contiguous.
+        """
+        offsets = np.cumsum([0] + [len(tree[0]) for tree in trees])
+        return cls(
+            feature=np.concatenate([tree[0] for tree in trees]),
+            threshold=np.concatenate([tree[1] for tree in trees]),
+            left=np.concatenate([tree[2] + offset for tree, offset in zip(trees, offsets)]).astype(np.int32),
+            right=np.concatenate([tree[3] + offset for tree, offset in zip(trees, offsets)]).astype(np.int32),
+            missing_left=np.concatenate([tree[4] for tree in trees]),
+            value=np.ascontiguousarray(np.concatenate([tree[5] for tree in trees]).T),
+            roots=offsets[:-1].astype(np.int32),
+            base=np.asarray(base, dtype=np.float64),
+            classes=np.asarray(classes),
+            link=link,
+            scale=scale,
+            n_features=n_features,
+            input_dtype=input_dtype
+        )
+
+    @classmethod
+    def from_estimator(cls, estimator: Any) -> Optional["FlatForest"]:
+        """Export a fitted LightGBM or sklearn tree ensemble classifier.
+
+        Accepts an ``LGBMClassifier`` or ``lightgbm.Booster``, sklearn's
+        histogram and classic gradient boosting classifiers, random forests
+        and extra trees, alone or as the only step of a ``Pipeline``.
+        Returns ``None`` for anything else, including categorical splits,
+        which callers should keep evaluating natively.
+        """
+        if isinstance(estimator, Pipeline):
+            if len(estimator.steps) != 1:
+                return None
+            estimator = estimator.steps[-1][1]
+
+        if hasattr(estimator, "booster_") or hasattr(estimator, "dump_model"):
+            return cls._from_lightgbm(estimator)
+        if isinstance(estimator, HistGradientBoostingClassifier):
+            return cls._from_hist_gradient_boosting(estimator)
+        if isinstance(estimator, GradientBoostingClassifier):
+            return cls._from_gradient_boosting(estimator)
+        if isinstance(estimator, (RandomForestClassifier, ExtraTreesClassifier)):
+            return cls._from_forest(estimator)
+        return None
+
+    @classmethod
+    def _from_lightgbm(cls, estimator: Any) -> Optional["FlatForest"]:
+        booster = getattr(estimator, "booster_", estimator)
+        dump = booster.dump_model()
+        n_classes = dump["num_class"]
+        objective, *parameters = dump["objective"].split()
+        # The binary objective scales raw scores by its ``sigmoid`` parameter.
+        sigmoid = dict(parameter.split(":", 1) for parameter in parameters if ":" in parameter).get("sigmoid", 1.0)
+        if objective == "binary":
+            link = "sigmoid"
+        elif objective == "multiclass":
+            link = "softmax"
+        else:
+            return None
+
+        trees = []
+        for index, info in enumerate(dump["tree_info"]):
+            tree = cls._lightgbm_tree(info["tree_structure"])
+            if tree is None:
+                return None
+            trees.append(_one_hot(tree, index % n_classes, n_classes) if n_classes > 1 else tree)
+
+        n_outputs = 1 if link == "sigmoid" else n_classes
+        classes = getattr(estimator, "classes_", np.arange(max(n_classes, 2)))
+        scale = n_classes / len(trees) if dump.get("average_output") else 1.0
+        if link == "sigmoid":
+            scale *= float(sigmoid)
+        return cls.from_trees(
+            trees, np.zeros(n_outputs), classes, link, scale, dump["max_feature_idx"] + 1
+        )
+
+    @staticmethod
+    def _lightgbm_tree(structure: Dict[str, Any]) -> Optional[TreeArrays]:
+        """Flatten a ``dump_model`` tree, or return ``None`` if it cannot be."""
+        columns: Dict[str, List[Any]] = {
+            "feature": [], "threshold": [], "left": [], "right": [],
+            "missing_left": [], "value": [], "is_leaf": []
+        }
+        stack = [(structure, None, None)]
+        while stack:
+            node, parent, side = stack.pop()
+            index = len(columns["is_leaf"])
+            if parent is not None:
+                columns[side][parent] = index
+
+            is_leaf = "split_index" not in node
+            if not is_leaf and (
+                node["decision_type"] != "<=" or node["missing_type"] not in ("None", "NaN")
+            ):
+                return None
+
+            threshold = 0.0 if is_leaf else float(node["threshold"])
+            if is_leaf:
+                missing_left = False
+            elif node["missing_type"] == "NaN":
+                missing_left = bool(node["default_left"])
+            else:
+                # Without a missing-value bin LightGBM reads NaN as zero.
+                missing_left = 0.0 <= threshold
+
+            columns["feature"].append(0 if is_leaf else node["split_feature"])
+            columns["threshold"].append(threshold)
+            columns["left"].append(index)
+            columns["right"].append(index)
+            columns["missing_left"].append(missing_left)
+            columns["value"].append(node["leaf_value"] if is_leaf else 0.0)
+            columns["is_leaf"].append(is_leaf)
+            if not is_leaf:
+                stack.append((node["right_child"], index, "right"))
+                stack.append((node["left_child"], index, "left"))
+
+        return _tree(**columns)
+
+    @classmethod
+    def _from_hist_gradient_boosting(cls, estimator: HistGradientBoostingClassifier) -> Optional["FlatForest"]:
+        n_outputs = estimator.n_trees_per_iteration_
+        trees = []
+        for predictors in estimator._predictors:
+            for output, predictor in enumerate(predictors):
+                nodes = predictor.nodes
+                if nodes["is_categorical"].any():
+                    return None
+                tree = _tree(
+                    nodes["feature_idx"], nodes["num_threshold"], nodes["left"], nodes["right"],
+                    nodes["missing_go_to_left"], nodes["value"], nodes["is_leaf"]
+                )
+                trees.append(_one_hot(tree, output, n_outputs))
+
+        link = "sigmoid" if n_outputs == 1 else "softmax"
+        return cls.from_trees(
+            trees, np.ravel(estimator._baseline_prediction), estimator.classes_, link,
+            n_features=estimator.n_features_in_
+        )
+
+    @classmethod
+    def _from_gradient_boosting(cls, estimator: GradientBoostingClassifier) -> "FlatForest":
+        n_outputs = estimator.estimators_.shape[1]
+        trees = [
+            _one_hot(cls._sklearn_tree(regressor.tree_), output, n_outputs)
+            for stage in estimator.estimators_
+            for output, regressor in enumerate(stage)
+        ]
+        # The init estimator ignores features, so its raw score is a constant.
+        base = estimator._raw_predict_init(np.zeros((1, estimator.n_features_in_)))[0]
+        link = "sigmoid" if n_outputs == 1 else "softmax"
+        return cls.from_trees(
+            trees, base, estimator.classes_, link, estimator.learning_rate,
+            estimator.n_features_in_, "float32"
+        )
+
+    @classmethod
+    def _from_forest(cls, estimator: Union[RandomForestClassifier, ExtraTreesClassifier]) -> "FlatForest":
+        trees = []
+        for tree_estimator in estimator.estimators_:
+            tree = cls._sklearn_tree(tree_estimator.tree_)
+            totals = tree[5].sum(axis=1, keepdims=True)
+            trees.append(tree[:5] + (np.divide(tree[5], totals, out=np.zeros_like(tree[5]), where=totals > 0),))
+        return cls.from_trees(
+            trees, np.zeros(len(estimator.classes_)), estimator.classes_, "mean",
+            1.0 / len(trees), estimator.n_features_in_, "float32"
+        )
+
+    @staticmethod
+    def _sklearn_tree(tree: Any) -> TreeArrays:
+        is_leaf = tree.children_left < 0
+        missing_left = getattr(tree, "missing_go_to_left", np.zeros(tree.node_count, dtype=bool))
+        return _tree(
+            tree.feature, tree.threshold, tree.children_left, tree.children_right,
+            missing_left, tree.value[:, 0, :], is_leaf
+        )
+
+    def _depth(self) -> int:
+        """Return the most splits on any root-to-leaf path."""
+        nodes = self.roots[self._internal[self.roots]]
+        depth = 0
+        while len(nodes):
+            depth += 1
+            children = np.concatenate((self.left[nodes], self.right[nodes]))
+            nodes = children[self._internal[children]]
+        return depth
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    def leaves(self, x: np.ndarray) -> np.ndarray:
+        """Return the leaf each row reaches in each tree, shape ``(n_rows, n_trees)``."""
+        n_rows, n_features = x.shape
+        flat_x = x.ravel()
+        nodes = np.tile(self.roots, n_rows)
+        pairs = np.flatnonzero(self._internal[nodes])
+        while len(pairs):
+            current = nodes[pairs]
+            values = flat_x[pairs // self.n_trees * n_features + self.feature[current]]
+            go_left = values <= self.threshold[current]
+            missing = np.isnan(values)
+            if missing.any():
+                go_left[missing] = self.missing_left[current[missing]]
+            current = self.left[current] + ~go_left
+            nodes[pairs] = current
+            pairs = pairs[self._internal[current]]
+        return nodes.reshape(n_rows, self.n_trees)
+
+    def raw_predict(self, rows: Any) -> np.ndarray:
+        """Return summed, scaled leaf values plus ``base`` for each row."""
+        x = np.asarray(rows, dtype=self.input_dtype)
+        if x.ndim == 1:
+            x = x[None, :]
+        leaves = self.leaves(x)
+        raw = np.column_stack([column[leaves].sum(axis=1) for column in self.value])
+        raw *= self.scale
+        raw += self.base
+        return raw
+
+    def predict_proba(self, rows: Any) -> np.ndarray:
+        """Return class probabilities for a ``(n_rows, n_features)`` matrix or one row."""
+        raw = self.raw_predict(rows)
+        if self.link == "sigmoid":
+            positive = 1.0 / (1.0 + np.exp(-raw[:, 0]))
+            return np.column_stack((1.0 - positive, positive))
+        if self.link == "softmax":
+            raw -= raw.max(axis=1, keepdims=True)
+            probabilities = np.exp(raw, out=raw)
+            probabilities /= probabilities.sum(axis=1, keepdims=True)
+            return probabilities
+        return raw
+
+    def save(self, directory: Union[str, Path]) -> Path:
+        """Write the ensemble to ``directory`` as ``.npy`` arrays and a JSON header."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ARRAYS:
+            array = np.asarray(getattr(self, name))
+            if array.dtype == object:
+                array = array.astype(str)
+            np.save(directory / f"{name}.npy", array, allow_pickle=False)
+        header = {
+            "link": self.link,
+            "scale": self.scale,
+            "max_depth": self.max_depth,
+            "n_features": self.n_features,
+            "input_dtype": self.input_dtype
+        }
+        (directory / "forest.json").write_text(json.dumps(header))
+        return directory
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap_mode: Optional[str] = "r") -> "FlatForest":
+        """Load a saved ensemble, memory-mapping its arrays by default."""
+        directory = Path(directory)
+        header = json.loads((directory / "forest.json").read_text())
+        arrays = {
+            name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+            for name in ARRAYS
+        }
+        return cls(**arrays, **header)
@@ -10,9 +10,15 @@ from .models import FeedbackRatingPayload, FeedbackResultPayload, User
 from .storage import save_prediction_rating, save_actual_result, update_user_subscription
 from .auth import get_current_user
 from .permissions import get_allowed_modes
+from ....shared.events.event_bus import (
+    EventBus, EventType, KafkaEventBus, PredictionFeedbackEvent
+)
 
 app = FastAPI(title="User Service API")
 
+# Publishes submitted results so the prediction engine can score its models.
+event_bus: Optional[EventBus] = None
+
 # --- CORS Middleware Configuration ---
 origins = [
     "http://localhost:3001", # React frontend origin (adjust port if necessary)
@@ -28,6 +34,23 @@ app.add_middleware(
 )
 # --- End CORS Configuration ---
 
+@app.on_event("startup")
+async def startup_event():
+    """ Connects to the event bus when Kafka is configured. """
+    global event_bus
+    kafka_servers = os.getenv("KAFKA_BOOTSTRAP_SERVERS")
+    if kafka_servers:
+        event_bus = KafkaEventBus(bootstrap_servers=kafka_servers)
+        await event_bus.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """ Flushes and closes the event bus. """
+    if event_bus:
+        await event_bus.stop()
+
+
 @app.get("/")
 async def read_root():
     """ Basic endpoint to check if the service is running. """
@@ -316,6 +339,27 @@ async def submit_prediction_rating(
         )
 
 
+async def publish_feedback(user_id: int, payload: FeedbackResultPayload):
+    """ Publishes a submitted result; failures never fail the request. """
+    if not event_bus:
+        return
+    try:
+        await event_bus.publish(PredictionFeedbackEvent(
+            event_id="",
+            event_type=EventType.PREDICTION_FEEDBACK_RECEIVED,
+            timestamp=None,
+            correlation_id=payload.prediction_id,
+            source_service="user-management",
+            prediction_id=payload.prediction_id,
+            user_id=str(user_id),
+            actual_winner=payload.actual_winner,
+            actual_margin=payload.actual_margin
+        ))
+    except Exception as e:
+        # Log the error e
+        print(f"Failed to publish feedback for prediction {payload.prediction_id}: {e}")
+
+
 @app.post("/users/feedback/result", status_code=status.HTTP_201_CREATED)
 async def submit_actual_result(
     payload: FeedbackResultPayload,
@@ -329,6 +373,7 @@ async def submit_actual_result(
             actual_winner=payload.actual_winner,
             actual_margin=payload.actual_margin
         )
+        await publish_feedback(current_user.id, payload)
         return {"message": "Actual result submitted successfully"}
     except sqlite3.Error as e:
         # Log the error e
@@ -1,11 +1,13 @@
 """Event bus implementation using Kafka."""
 
 import json
+import os
+import socket
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Callable
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 import asyncio
@@ -22,6 +24,10 @@ class EventType(str, Enum):
     # Prediction events
     PREDICTION_REQUESTED = "prediction.requested"
     PREDICTION_COMPLETED = "prediction.completed"
+    PREDICTION_FEEDBACK_RECEIVED = "prediction.feedback.received"
+    
+    # Match events
+    MATCH_RESULT_RECORDED = "match.result.recorded"
     
     # Chat events
     CHAT_MESSAGE_SENT = "chat.message.sent"
@@ -54,7 +60,8 @@ class BaseEvent:
     timestamp: datetime
     correlation_id: str
     source_service: str
-    version: str = "1.0"
+    # Keyword-only so subclasses can declare required fields after it.
+    version: str = field(default="1.0", kw_only=True)
     
     def __post_init__(self):
         """Ensure event_id and timestamp are set."""
@@ -90,6 +97,7 @@ class PredictionCompletedEvent(BaseEvent):
     team_away: str
     predictions: List[Dict[str, Any]]
     processing_time_ms: float
+    match_date: Optional[str] = None
     
     def __post_init__(self):
         super().__post_init__()
@@ -97,6 +105,41 @@ class PredictionCompletedEvent(BaseEvent):
             self.event_type = EventType.PREDICTION_COMPLETED
 
 
+@dataclass
+class PredictionFeedbackEvent(BaseEvent):
+    """Event fired when a user submits the actual result of a prediction."""
+    
+    prediction_id: str
+    user_id: str
+    actual_winner: str
+    actual_margin: Optional[int] = None
+    
+    def __post_init__(self):
+        super().__post_init__()
+        if not self.event_type:
+            self.event_type = EventType.PREDICTION_FEEDBACK_RECEIVED
+
+
+@dataclass
+class MatchResultRecordedEvent(BaseEvent):
+    """Event fired when a final score is recorded for a match."""
+    
+    match_id: str
+    team_home: str
+    team_away: str
+    match_date: str
+    home_score: int
+    away_score: int
+    venue: Optional[str] = None
+    season: Optional[int] = None
+    round_number: Optional[int] = None
+    
+    def __post_init__(self):
+        super().__post_init__()
+        if not self.event_type:
+            self.event_type = EventType.MATCH_RESULT_RECORDED
+
+
 @dataclass
 class ChatMessageSentEvent(BaseEvent):
     """Event fired when a chat message is sent."""
@@ -140,9 +183,15 @@ class EventBus(ABC):
         self, 
         event_type: EventType, 
         handler: Callable[[BaseEvent], None],
-        consumer_group: str = None
+        consumer_group: str = None,
+        broadcast: bool = False
     ) -> None:
-        """Subscribe to an event type."""
+        """Subscribe to an event type.
+        
+        Subscribers sharing a consumer group split the events between
+        them. With ``broadcast`` every process receives every event, for
+        handlers that update state held in process memory.
+        """
         pass
     
     @abstractmethod
@@ -169,7 +218,9 @@ class KafkaEventBus(EventBus):
         self.schema_registry_url = schema_registry_url
         self.producer = None
         self.consumers: Dict[str, Consumer] = {}
-        self.handlers: Dict[EventType, List[Callable]] = {}
+        # Handlers per consumer group and topic; each group's consumer only
+        # dispatches to its own handlers.
+        self.handlers: Dict[str, Dict[EventType, List[Callable]]] = {}
         self.running = False
         
         # Producer configuration
@@ -266,35 +317,52 @@ class KafkaEventBus(EventBus):
         self, 
         event_type: EventType, 
         handler: Callable[[BaseEvent], None],
-        consumer_group: str = None
+        consumer_group: str = None,
+        broadcast: bool = False
     ) -> None:
-        """Subscribe to an event type."""
-        if event_type not in self.handlers:
-            self.handlers[event_type] = []
+        """Subscribe to an event type.
         
-        self.handlers[event_type].append(handler)
+        A broadcast subscription joins a consumer group unique to this
+        process, starting at the latest offset, so every replica sees each
+        event once from the moment it subscribes. A group may cover several
+        event types; its one consumer follows all of their topics and
+        dispatches each message to that group's handlers for its topic.
+        """
+        group_id = consumer_group or f'ai-betting-{event_type.value}'
+        offset_reset = self.consumer_config_base['auto.offset.reset']
+        if broadcast:
+            group_id = f"{group_id}.{socket.gethostname()}.{os.getpid()}"
+            offset_reset = 'latest'
+        
+        group_handlers = self.handlers.setdefault(group_id, {})
+        new_topic = event_type not in group_handlers
+        group_handlers.setdefault(event_type, []).append(handler)
         
         # Create consumer if not exists
-        if consumer_group not in self.consumers:
+        if group_id not in self.consumers:
             consumer_config = {
                 **self.consumer_config_base,
-                'group.id': consumer_group or f'ai-betting-{event_type.value}'
+                'group.id': group_id,
+                'auto.offset.reset': offset_reset
             }
             
             consumer = Consumer(consumer_config)
             consumer.subscribe([event_type.value])
-            self.consumers[consumer_group or event_type.value] = consumer
+            self.consumers[group_id] = consumer
             
             # Start consumer task
-            asyncio.create_task(self._consume_messages(consumer, event_type))
+            asyncio.create_task(self._consume_messages(consumer, group_id))
+        elif new_topic:
+            # subscribe() replaces the consumer's topic list.
+            self.consumers[group_id].subscribe([topic.value for topic in group_handlers])
         
         logger.info(
             "Subscribed to event",
             event_type=event_type.value,
-            consumer_group=consumer_group
+            consumer_group=group_id
         )
     
-    async def _consume_messages(self, consumer: Consumer, event_type: EventType) -> None:
+    async def _consume_messages(self, consumer: Consumer, group_id: str) -> None:
         """Consume messages from Kafka."""
         while self.running:
             try:
@@ -311,15 +379,17 @@ class KafkaEventBus(EventBus):
                         continue
                 
                 # Process message
-                await self._process_message(message, event_type)
+                await self._process_message(message, group_id)
                 
             except Exception as e:
                 logger.error("Error consuming messages", error=str(e))
                 await asyncio.sleep(1)
     
-    async def _process_message(self, message, event_type: EventType) -> None:
-        """Process a received message."""
+    async def _process_message(self, message, group_id: str) -> None:
+        """Process a received message with its consumer group's handlers."""
         try:
+            event_type = EventType(message.topic())
+            
             # Deserialise event
             event_data = json.loads(message.value().decode('utf-8'))
             
@@ -330,8 +400,8 @@ class KafkaEventBus(EventBus):
             # Create event object based on type
             event = self._create_event_from_data(event_type, event_data)
             
-            # Call all handlers for this event type
-            handlers = self.handlers.get(event_type, [])
+            # Call this group's handlers for the event type
+            handlers = self.handlers.get(group_id, {}).get(event_type, [])
             for handler in handlers:
                 try:
                     await handler(event) if asyncio.iscoroutinefunction(handler) else handler(event)
@@ -358,6 +428,8 @@ class KafkaEventBus(EventBus):
         event_classes = {
             EventType.PREDICTION_REQUESTED: PredictionRequestedEvent,
             EventType.PREDICTION_COMPLETED: PredictionCompletedEvent,
+            EventType.PREDICTION_FEEDBACK_RECEIVED: PredictionFeedbackEvent,
+            EventType.MATCH_RESULT_RECORDED: MatchResultRecordedEvent,
             EventType.CHAT_MESSAGE_SENT: ChatMessageSentEvent,
             EventType.USER_REGISTERED: UserRegisteredEvent,
         }
@@ -433,7 +505,8 @@ class InMemoryEventBus(EventBus):
         self, 
         event_type: EventType, 
         handler: Callable[[BaseEvent], None],
-        consumer_group: str = None
+        consumer_group: str = None,
+        broadcast: bool = False
     ) -> None:
         """Subscribe to an event type."""
         if event_type not in self.handlers:
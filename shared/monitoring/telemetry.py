@@ -68,6 +68,18 @@ model_accuracy = Gauge(
     ['model_type']
 )
 
+model_brier_score = Gauge(
+    'model_brier_score',
+    'Recent multi-class Brier score of prediction models (lower is better)',
+    ['model_type']
+)
+
+model_calibration_error = Gauge(
+    'model_calibration_error',
+    'Recent expected calibration error of prediction models',
+    ['model_type']
+)
+
 prediction_errors_total = Counter(
     'prediction_errors_total',
     'Total number of prediction errors',
@@ -86,12 +98,70 @@ batch_prediction_size = Histogram(
     buckets=[1, 5, 10, 15, 20, 25]
 )
 
+micro_batch_size = Gauge(
+    'micro_batch_size',
+    'Number of requests in the most recent micro-batch'
+)
+
+micro_batch_queue_wait_seconds = Gauge(
+    'micro_batch_queue_wait_seconds',
+    'Longest time a request in the most recent micro-batch spent queued'
+)
+
+micro_batch_queue_depth = Gauge(
+    'micro_batch_queue_depth',
+    'Number of requests waiting in the micro-batch queue'
+)
+
+inference_executor_in_flight = Gauge(
+    'inference_executor_in_flight',
+    'Inference calls running or queued on an executor lane',
+    ['executor']
+)
+
+inference_executor_utilisation = Gauge(
+    'inference_executor_utilisation',
+    'Share of an executor lane\'s worker time spent running inference',
+    ['executor']
+)
+
+inference_executor_rejections_total = Counter(
+    'inference_executor_rejections_total',
+    'Inference calls rejected because an executor lane was full',
+    ['executor']
+)
+
+model_load_seconds = Gauge(
+    'model_load_seconds',
+    'Time taken to construct and warm a model at start-up',
+    ['model_type', 'ready']
+)
+
+model_reloads_total = Counter(
+    'model_reloads_total',
+    'Model artifact reloads by outcome',
+    ['model_type', 'outcome']
+)
+
+process_memory_bytes = Gauge(
+    'process_memory_bytes',
+    'Resident memory of this worker process by kind (rss, pss, shared, private)',
+    ['kind']
+)
+
 cache_operations_total = Counter(
     'cache_operations_total',
     'Total cache operations',
     ['cache_type', 'operation', 'hit_miss']
 )
 
+cache_operation_duration_seconds = Histogram(
+    'cache_operation_duration_seconds',
+    'Duration of cache operations in seconds',
+    ['cache_type', 'operation'],
+    buckets=[0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1]
+)
+
 event_bus_messages_total = Counter(
     'event_bus_messages_total',
     'Total event bus messages',
@@ -234,6 +304,12 @@ class MetricsCollector:
         """Update model accuracy."""
         model_accuracy.labels(model_type=model).set(accuracy)
     
+    @staticmethod
+    def update_model_calibration(model: str, brier_score: float, calibration_error: float):
+        """Update model Brier score and calibration error."""
+        model_brier_score.labels(model_type=model).set(brier_score)
+        model_calibration_error.labels(model_type=model).set(calibration_error)
+    
     @staticmethod
     def record_prediction_error(model: str, error_type: str):
         """Record prediction error."""
@@ -260,6 +336,47 @@ class MetricsCollector:
         """Record batch prediction size."""
         batch_prediction_size.observe(size)
     
+    @staticmethod
+    def record_micro_batch(size: int, queue_wait: float):
+        """Record the size and queue wait of a dispatched micro-batch."""
+        micro_batch_size.set(size)
+        micro_batch_queue_wait_seconds.set(queue_wait)
+    
+    @staticmethod
+    def update_micro_batch_queue_depth(depth: int):
+        """Update the number of requests waiting to be micro-batched."""
+        micro_batch_queue_depth.set(depth)
+    
+    @staticmethod
+    def update_inference_executor(executor: str, in_flight: int, utilisation: float):
+        """Update an inference executor lane's queue and utilisation."""
+        inference_executor_in_flight.labels(executor=executor).set(in_flight)
+        inference_executor_utilisation.labels(executor=executor).set(utilisation)
+    
+    @staticmethod
+    def record_inference_rejection(executor: str):
+        """Record an inference call rejected by a full executor lane."""
+        inference_executor_rejections_total.labels(executor=executor).inc()
+    
+    @staticmethod
+    def record_model_load(model: str, seconds: float, ready: bool):
+        """Record how long a model took to construct and warm."""
+        model_load_seconds.labels(model_type=model, ready=str(ready).lower()).set(seconds)
+    
+    @staticmethod
+    def record_model_reload(model: str, success: bool):
+        """Record a model artifact reload that was swapped in or rejected."""
+        model_reloads_total.labels(
+            model_type=model,
+            outcome="swapped" if success else "rejected"
+        ).inc()
+    
+    @staticmethod
+    def update_process_memory(memory: Dict[str, int]):
+        """Update this worker's resident memory figures."""
+        for kind, value in memory.items():
+            process_memory_bytes.labels(kind=kind).set(value)
+    
     @staticmethod
     def record_cache_operation(cache_type: str, operation: str, hit: bool):
         """Record cache operation."""
@@ -269,6 +386,14 @@ class MetricsCollector:
             hit_miss="hit" if hit else "miss"
         ).inc()
     
+    @staticmethod
+    def record_cache_latency(cache_type: str, operation: str, duration: float):
+        """Record cache operation latency."""
+        cache_operation_duration_seconds.labels(
+            cache_type=cache_type,
+            operation=operation
+        ).observe(duration)
+    
     @staticmethod
     def record_event_bus_message(event_type: str, status: str = "success"):
         """Record event bus message."""
@@ -0,0 +1,117 @@
+"""Shared fixtures for the prediction-engine tests."""
+
+import fnmatch
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "services" / "prediction-engine"))
+sys.path.insert(0, str(ROOT))
+
+from src.domain.models import Match, TeamStats  # noqa: E402
+
+
+TEAMS = [f"Team {i}" for i in range(12)]
+SEASON_START = datetime(2015, 3, 1)
+
+
+class StaticStatsRepository:
+    """Data repository returning fixed, per-team deterministic statistics."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_team_stats(self, team_name: str) -> TeamStats:
+        self.calls += 1
+        rng = random.Random(team_name)
+        return TeamStats(
+            team_name=team_name,
+            elo_rating=1400 + rng.random() * 200,
+            recent_form=[rng.choice("WLD") for _ in range(5)],
+            avg_points_scored=20.0,
+            avg_points_conceded=18.0,
+            home_win_rate=rng.random(),
+            away_win_rate=0.4
+        )
+
+    async def get_team_stats_many(self, team_names: List[str]) -> List[TeamStats]:
+        return [await self.get_team_stats(team) for team in team_names]
+
+
+def make_history(n_matches: int = 1500, seed: int = 1, days: int = 8 * 365) -> List[Match]:
+    """Random fixtures over several seasons, a few without a recorded score."""
+    rng = random.Random(seed)
+    history = []
+    for i in range(n_matches):
+        home, away = rng.sample(TEAMS, 2)
+        history.append(Match(
+            match_id=f"m{i}",
+            team_home=home,
+            team_away=away,
+            match_date=SEASON_START + timedelta(
+                days=rng.randint(0, days), hours=rng.randint(0, 23)
+            ),
+            home_score=None if rng.random() < 0.05 else rng.randint(0, 40),
+            away_score=None if rng.random() < 0.05 else rng.randint(0, 40)
+        ))
+    return history
+
+
+class MemoryRedis:
+    """The handful of asyncio Redis commands the repository and caches use, in a dict."""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+        self.scans = 0
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def scan_iter(self, match):
+        self.scans += 1
+        for key in list(self.values):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+
+class MemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.writes = []
+
+    def setex(self, key, ttl, value):
+        self.writes.append((key, value))
+
+    async def execute(self):
+        for key, value in self.writes:
+            self.redis.values[key] = value
+
+
+@pytest.fixture
+def history() -> List[Match]:
+    return make_history()
+
+
+@pytest.fixture
+def stats_repository() -> StaticStatsRepository:
+    return StaticStatsRepository()
@@ -0,0 +1,94 @@
+"""Per-season backtests warmed from season-start snapshots of ratings and form."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from shared.data_contracts.prediction import ModelType
+
+from src.application.backtest import (
+    SeasonBacktester, backtest_seasons, match_season, season_warm_states
+)
+from src.infrastructure.feature_engineering import FEATURE_MATRIX_COLUMNS
+from src.infrastructure.match_history import to_ticks
+
+from conftest import make_history
+
+
+_ELO = FEATURE_MATRIX_COLUMNS.index("elo_difference")
+_MOMENTUM = FEATURE_MATRIX_COLUMNS.index("form_momentum")
+
+
+def _probabilities(p_home):
+    p_home = np.clip(p_home, 0.01, 0.99) * 0.97
+    return np.column_stack((p_home, 0.97 - p_home, np.full(len(p_home), 0.03)))
+
+
+def build_models():
+    return {
+        ModelType.LIGHTGBM: lambda batch: _probabilities(
+            1 / (1 + 10 ** (-batch.matrix[:, _ELO] / 400))
+        ),
+        ModelType.TRANSFORMER: lambda batch: _probabilities(
+            1 / (1 + np.exp(-batch.matrix[:, _MOMENTUM]))
+        ),
+    }
+
+
+@pytest.fixture
+def matches():
+    return make_history(n_matches=600, days=4 * 365)
+
+
+def test_snapshots_hold_only_earlier_seasons(matches):
+    for season, (rating_engine, form_store) in season_warm_states(matches):
+        earlier = [m for m in matches if match_season(m) < season]
+        scored = [m for m in earlier if m.home_score is not None and m.away_score is not None]
+        assert len(rating_engine) == len(scored)
+
+        first_kickoff = min(m.match_date for m in matches if match_season(m) == season)
+        for team in {m.team_home for m in matches}:
+            assert form_store.has_results(team) == form_store.has_results(team, before=first_kickoff)
+        assert all(to_ticks(m.match_date) < to_ticks(first_kickoff) for m in earlier)
+
+
+@pytest.mark.asyncio
+async def test_seasons_match_a_full_replay(matches):
+    by_season = await backtest_seasons(matches, build_models, processes=1)
+
+    assert list(by_season) == sorted({match_season(m) for m in matches})
+    for season, metrics in by_season.items():
+        replayed = await SeasonBacktester(build_models()).run(
+            [m for m in matches if match_season(m) == season],
+            [m for m in matches if match_season(m) < season]
+        )
+        for model_type, model_metrics in replayed.items():
+            assert metrics[model_type].predictions == model_metrics.predictions
+            assert metrics[model_type].log_loss == pytest.approx(model_metrics.log_loss)
+
+
+@pytest.mark.asyncio
+async def test_later_results_do_not_change_earlier_seasons(matches):
+    seasons = sorted({match_season(m) for m in matches})
+    cutoff = seasons[2]
+    # Swap every later score, so any look-ahead would shift earlier predictions.
+    altered = [
+        dataclasses.replace(m, home_score=m.away_score, away_score=m.home_score)
+        if match_season(m) >= cutoff else m
+        for m in matches
+    ]
+
+    original = await backtest_seasons(matches, build_models, processes=1)
+    changed = await backtest_seasons(altered, build_models, processes=1)
+
+    for season in seasons:
+        for model_type in build_models():
+            before = original[season][model_type]
+            after = changed[season][model_type]
+            if season < cutoff:
+                assert dataclasses.asdict(after) == dataclasses.asdict(before)
+    assert any(
+        dataclasses.asdict(changed[cutoff + 1][m]) != dataclasses.asdict(original[cutoff + 1][m])
+        for m in build_models()
+    )
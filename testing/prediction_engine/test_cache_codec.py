@@ -0,0 +1,44 @@
+"""Cache codec round trips, and corrupt payloads only ever raise CodecError."""
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.models import Match, TeamStats
+from src.infrastructure.cache_codec import (
+    CodecError, decode_matches, decode_team_stats, encode_matches, encode_team_stats
+)
+
+
+MATCHES = [
+    Match("m1", "Melbourne Storm", "Penrith Panthers", datetime(2024, 5, 1, 19, 50),
+          "AAMI Park", 20, 10, 2024, 9),
+    Match("m2", "Brisbane Bröncos", "Canterbury-Bankstown Bulldogs",
+          datetime(2024, 5, 2, tzinfo=timezone.utc)),
+]
+STATS = TeamStats("Brisbane Bröncos", 1512.5, ["W", "L", "D"], 21.4, 17.9, 0.6, None, 2)
+
+
+def test_round_trip():
+    assert decode_matches(encode_matches(MATCHES)) == MATCHES
+    assert decode_team_stats(encode_team_stats(STATS)) == STATS
+
+
+@pytest.mark.parametrize("payload, decode", [
+    (encode_matches(MATCHES), decode_matches),
+    (encode_team_stats(STATS), decode_team_stats),
+])
+def test_corrupt_payloads_raise_codec_error(payload, decode):
+    corrupted = [payload[:length] for length in range(len(payload))]
+    rng = random.Random(0)
+    for _ in range(5000):
+        data = bytearray(payload)
+        data[rng.randrange(len(data))] = rng.randrange(256)
+        corrupted.append(bytes(data))
+
+    for data in corrupted:
+        try:
+            decode(data)
+        except CodecError:
+            pass
@@ -0,0 +1,67 @@
+"""Read-through team-stats caching and load coalescing in CachedDataRepository."""
+
+import asyncio
+
+import pytest
+
+from src.domain.models import TeamStats
+from src.infrastructure.repositories import CachedDataRepository
+
+from conftest import MemoryRedis, StaticStatsRepository
+
+
+class SlowStatsRepository(StaticStatsRepository):
+    """Backing repository whose loads take long enough to overlap."""
+
+    async def get_team_stats(self, team_name):
+        await asyncio.sleep(0.01)
+        return await super().get_team_stats(team_name)
+
+
+@pytest.fixture
+def backing():
+    return SlowStatsRepository()
+
+
+@pytest.fixture
+def repository(backing):
+    return CachedDataRepository(backing, MemoryRedis())
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load(repository, backing):
+    results = await asyncio.gather(*(repository.get_team_stats("Storm") for _ in range(20)))
+
+    assert backing.calls == 1
+    assert all(stats == results[0] for stats in results)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("single_first", [True, False])
+async def test_single_and_batch_reads_share_a_load(repository, backing, single_first):
+    single = repository.get_team_stats("Storm")
+    batch = repository.get_team_stats_many(["Storm", "Panthers"])
+    if single_first:
+        stats, (storm, panthers) = await asyncio.gather(single, batch)
+    else:
+        (storm, panthers), stats = await asyncio.gather(batch, single)
+
+    assert isinstance(stats, TeamStats)
+    assert storm == stats
+    assert panthers.team_name == "Panthers"
+    assert backing.calls == 2
+
+    # Both keys were written back, whichever call ran the load.
+    assert await repository.get_team_stats_many(["Storm", "Panthers"]) == [storm, panthers]
+    assert backing.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_undecodable_entry_is_reloaded(repository, backing):
+    await repository.get_team_stats("Storm")
+    repository.redis_client.values["team_stats:Storm"] = b"\xe1corrupt"
+
+    [stats] = await repository.get_team_stats_many(["Storm"])
+
+    assert stats.team_name == "Storm"
+    assert backing.calls == 2
@@ -0,0 +1,117 @@
+"""Batch feature extraction matches extracting each fixture on its own."""
+
+import random
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.models import Match
+from src.infrastructure.feature_engineering import FEATURE_MATRIX_COLUMNS, StandardFeatureEngineer
+from src.infrastructure.team_form import TeamFormStore
+
+from conftest import SEASON_START, TEAMS, StaticStatsRepository
+
+
+def fixtures(n: int, seed: int = 5):
+    rng = random.Random(seed)
+    return [
+        Match(
+            match_id=f"f{i}",
+            team_home=home,
+            team_away=away,
+            match_date=SEASON_START + timedelta(days=rng.randint(0, 9 * 365))
+        )
+        for i, (home, away) in enumerate(rng.sample(TEAMS + ["Unknown"], 2) for _ in range(n))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_features_match_single_extraction(history, stats_repository):
+    engineer = StandardFeatureEngineer(stats_repository)
+    matches = fixtures(120)
+
+    batch = await engineer.extract_features_batch(matches, history)
+
+    assert batch.matrix.shape == (len(matches), len(FEATURE_MATRIX_COLUMNS))
+    for row, match in enumerate(matches):
+        single = await engineer.extract_features(match, history)
+        batched = batch.features[row]
+        assert batched.elo_difference == single.elo_difference
+        assert batched.home_advantage == single.home_advantage
+        assert batched.head_to_head_record == single.head_to_head_record
+        assert [m.match_id for m in batched.recent_encounters] == \
+            [m.match_id for m in single.recent_encounters]
+        assert batched.additional_features == single.additional_features
+
+
+@pytest.mark.asyncio
+async def test_batch_matrix_rows_follow_features(history, stats_repository):
+    engineer = StandardFeatureEngineer(stats_repository)
+    batch = await engineer.extract_features_batch(fixtures(30), history)
+
+    column = {name: i for i, name in enumerate(FEATURE_MATRIX_COLUMNS)}
+    for row, features in enumerate(batch.features):
+        extra = features.additional_features
+        assert batch.matrix[row, column["elo_difference"]] == features.elo_difference
+        assert batch.matrix[row, column["h2h_home_wins"]] == features.head_to_head_record["home_wins"]
+        assert batch.matrix[row, column["home_recent_scoring_avg"]] == extra["home_recent_scoring_avg"]
+        assert batch.matrix[row, column["away_rest_days"]] == extra["rest_days"]["away_rest_days"]
+
+
+@pytest.mark.asyncio
+async def test_empty_batch(history, stats_repository):
+    batch = await StandardFeatureEngineer(stats_repository).extract_features_batch([], history)
+    assert batch.matrix.shape == (0, len(FEATURE_MATRIX_COLUMNS))
+    assert batch.features == []
+    assert np.isfinite(batch.matrix).all()
+
+
+@pytest.mark.asyncio
+async def test_form_store_is_not_used_for_earlier_fixtures(history, stats_repository):
+    store = TeamFormStore(TEAMS)
+    store.replay(history)
+    with_store = StandardFeatureEngineer(stats_repository, form_store=store)
+    without_store = StandardFeatureEngineer(stats_repository)
+    earlier = [m for m in fixtures(60) if m.match_date < SEASON_START + timedelta(days=6 * 365)]
+
+    batch = await with_store.extract_features_batch(earlier, history)
+    expected = await without_store.extract_features_batch(earlier, history)
+
+    assert np.array_equal(batch.matrix, expected.matrix)
+    for match in earlier[:10]:
+        single = await with_store.extract_features(match, history)
+        assert single.additional_features == \
+            (await without_store.extract_features(match, history)).additional_features
+
+
+def test_form_store_window_is_split_aware():
+    store = TeamFormStore(TEAMS)
+    store.record_match(Match("r1", TEAMS[1], TEAMS[0], SEASON_START, home_score=12, away_score=20))
+    engineer = StandardFeatureEngineer(StaticStatsRepository(), form_store=store)
+    later = SEASON_START + timedelta(days=7)
+
+    assert engineer._has_form(TEAMS[0], is_home=False, match_date=later)
+    assert not engineer._has_form(TEAMS[0], is_home=True, match_date=later)
+    assert not engineer._has_form(TEAMS[0], is_home=False, match_date=SEASON_START)
+
+
+@pytest.mark.asyncio
+async def test_history_edits_in_place_are_seen(history, stats_repository):
+    engineer = StandardFeatureEngineer(stats_repository)
+    history = sorted(history, key=lambda m: m.match_date)
+    last = history[-1]
+    fixture = Match("next", last.team_home, last.team_away, last.match_date + timedelta(days=7))
+    last.home_score, last.away_score = 30, 10
+    before = (await engineer.extract_features(fixture, history)).head_to_head_record
+
+    # A result corrected in place, then a match replaced outright.
+    last.home_score, last.away_score = 10, 30
+    corrected = (await engineer.extract_features(fixture, history)).head_to_head_record
+    assert corrected["home_wins"] == before["home_wins"] - 1
+    assert corrected["away_wins"] == before["away_wins"] + 1
+
+    history[-1] = Match(last.match_id, last.team_home, last.team_away, last.match_date,
+                        home_score=20, away_score=20)
+    replaced = (await engineer.extract_features(fixture, history)).head_to_head_record
+    assert replaced["draws"] == before["draws"] + 1
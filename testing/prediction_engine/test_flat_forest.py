@@ -0,0 +1,63 @@
+"""FlatForest reproduces each source ensemble's native predict_proba."""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import (
+    ExtraTreesClassifier,
+    GradientBoostingClassifier,
+    HistGradientBoostingClassifier,
+    RandomForestClassifier,
+)
+from sklearn.pipeline import Pipeline
+
+from src.modules.trees.flat_forest import FlatForest
+
+
+def match_features(rows, n_classes, missing=0.0, seed=7):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(rows, 6))
+    signal = x[:, 0] - x[:, 1] + 0.5 * x[:, 2] * x[:, 3] + rng.normal(scale=0.8, size=rows)
+    y = np.digitize(signal, [-0.3, 0.3]) if n_classes == 3 else (signal > 0).astype(int)
+    x[rng.random(x.shape) < missing] = np.nan
+    return x, y
+
+
+def lightgbm(**kwargs):
+    lgb = pytest.importorskip("lightgbm")
+    return lgb.LGBMClassifier(n_estimators=30, num_leaves=15, verbose=-1, **kwargs)
+
+
+ESTIMATORS = {
+    "lightgbm": (lambda: lightgbm(), 0.05),
+    "hist_gradient_boosting": (
+        lambda: HistGradientBoostingClassifier(max_iter=30, early_stopping=False), 0.05
+    ),
+    "gradient_boosting": (lambda: GradientBoostingClassifier(n_estimators=30, max_depth=3), 0.0),
+    "random_forest": (lambda: RandomForestClassifier(n_estimators=20, random_state=0), 0.0),
+    "extra_trees": (lambda: ExtraTreesClassifier(n_estimators=20, random_state=0), 0.0),
+}
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+@pytest.mark.parametrize("name", list(ESTIMATORS))
+def test_matches_native_predict_proba(name, n_classes):
+    build, missing = ESTIMATORS[name]
+    x, y = match_features(2000, n_classes, missing)
+    model = build().fit(x, y)
+    held_out, _ = match_features(500, n_classes, missing, seed=11)
+
+    forest = FlatForest.from_estimator(model)
+
+    expected = model.predict_proba(held_out)
+    np.testing.assert_allclose(forest.predict_proba(held_out), expected, atol=1e-9)
+    np.testing.assert_allclose(forest.predict_proba(held_out[0]), expected[:1], atol=1e-9)
+
+
+def test_saved_forest_matches_after_memory_mapped_load(tmp_path):
+    x, y = match_features(2000, 3, missing=0.05)
+    model = Pipeline([("model", HistGradientBoostingClassifier(max_iter=20))]).fit(x, y)
+
+    loaded = FlatForest.load(FlatForest.from_estimator(model).save(tmp_path / "forest"))
+
+    np.testing.assert_allclose(loaded.predict_proba(x), model.predict_proba(x), atol=1e-9)
+    np.testing.assert_array_equal(loaded.classes, model.classes_)
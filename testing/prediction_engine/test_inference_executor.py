@@ -0,0 +1,73 @@
+"""Inference lanes: worker crashes and utilisation reporting."""
+
+import os
+import time
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+import pytest
+
+from src.application.inference_executor import ExecutionMode, InferenceExecutor, _Lane
+from src.domain.prediction_models import (
+    MatchDetails, ModelMetrics, ModelType, PredictionModel, PredictionResult, PredictionType, Winner
+)
+
+
+class CrashingModel(PredictionModel):
+    """LightGBM stand-in whose worker process exits on a "Crash" fixture."""
+
+    model_type = ModelType.LIGHTGBM
+    model_name = "crashing"
+    model_version = "test"
+    supported_prediction_types = [PredictionType.MATCH_WINNER]
+
+    async def is_ready(self) -> bool:
+        return True
+
+    async def predict(self, match_details, prediction_type=PredictionType.MATCH_WINNER):
+        if match_details.team_home == "Crash":
+            os._exit(1)
+        return PredictionResult(
+            "", self.model_type, prediction_type, match_details, Winner.HOME,
+            {"home": 0.6, "away": 0.4}, 0.6
+        )
+
+    async def predict_batch(self, matches, prediction_type=PredictionType.MATCH_WINNER):
+        return [await self.predict(match, prediction_type) for match in matches]
+
+    async def get_feature_importance(self):
+        return {}
+
+    async def get_model_metrics(self):
+        return ModelMetrics(self.model_type, 0.0, {}, {}, {})
+
+
+@pytest.mark.asyncio
+async def test_broken_process_lane_is_replaced():
+    executor = InferenceExecutor(
+        ExecutionMode.PROCESS,
+        offload_models=[ModelType.LIGHTGBM],
+        workers=1,
+        model_factories={ModelType.LIGHTGBM: CrashingModel}
+    )
+    model = CrashingModel()
+    await executor.start()
+    try:
+        with pytest.raises(BrokenProcessPool):
+            await executor.predict(model, MatchDetails("Crash", "Storm", datetime(2024, 5, 1)))
+
+        result = await executor.predict(model, MatchDetails("Storm", "Panthers", datetime(2024, 5, 1)))
+        assert result.predicted_winner == Winner.HOME
+    finally:
+        await executor.stop()
+
+
+def test_utilisation_covers_recent_window_only():
+    lane = _Lane("lightgbm", executor=None, workers=2, in_process=False, window_seconds=0.05)
+    lane.started_at -= 10.0
+    lane.record(0.05)
+    assert lane.utilisation == pytest.approx(0.5)
+
+    time.sleep(0.06)
+    assert lane.utilisation == 0.0
+    assert lane.completed == 1
@@ -0,0 +1,65 @@
+"""The fused logistic kernel agrees with sklearn's predict_proba."""
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.modules.logistic_regression.kernel import LogisticKernel
+
+
+def training_data(n_classes, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(loc=3.0, scale=[1.0, 5.0, 0.2, 2.0], size=(300, 4))
+    y = rng.integers(0, n_classes, size=300)
+    return X, y
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+@pytest.mark.parametrize("scaler", [
+    None,
+    StandardScaler(),
+    StandardScaler(with_mean=False),
+    StandardScaler(with_std=False),
+])
+def test_kernel_matches_pipeline(n_classes, scaler):
+    X, y = training_data(n_classes)
+    steps = ([("scaler", scaler)] if scaler is not None else []) + \
+        [("classifier", LogisticRegression(max_iter=1000))]
+    pipeline = Pipeline(steps).fit(X, y)
+
+    kernel = LogisticKernel.from_estimator(pipeline)
+
+    expected = pipeline.predict_proba(X)
+    np.testing.assert_allclose(kernel.predict_proba(X), expected, atol=1e-12)
+    for row, probabilities in zip(X[:20], expected):
+        np.testing.assert_allclose(kernel.predict_one(list(row)), probabilities, atol=1e-12)
+
+
+def test_liblinear_auto_is_one_vs_rest():
+    X, y = training_data(3)
+    model = LogisticRegression(max_iter=1000).fit(X, y)
+    model.solver = "liblinear"
+    model.multi_class = "auto"
+
+    kernel = LogisticKernel.from_estimator(model)
+
+    assert kernel.one_vs_rest
+    # The normalised one-vs-rest sigmoids sklearn applied to such models.
+    np.testing.assert_allclose(kernel.predict_proba(X), model._predict_proba_lr(X), atol=1e-12)
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_extreme_logits_do_not_overflow(n_classes):
+    X, y = training_data(n_classes)
+    model = LogisticRegression(max_iter=1000).fit(X, y)
+    model.coef_ = model.coef_ * 1e4
+    kernel = LogisticKernel.from_estimator(model)
+    kernel.one_vs_rest = n_classes > 2
+
+    for row in ([1e3] * 4, [-1e3] * 4):
+        probabilities = kernel.predict_one(row)
+        assert np.isfinite(probabilities).all()
+        assert sum(probabilities) == pytest.approx(1.0)
+    assert np.isfinite(kernel.predict_proba(np.array([[1e3] * 4, [-1e3] * 4]))).all()
@@ -0,0 +1,88 @@
+"""The columnar match-history store agrees with a plain scan of the match list."""
+
+import random
+from datetime import timedelta
+
+import pytest
+
+from src.infrastructure.match_history import MatchHistoryStore
+
+from conftest import SEASON_START, TEAMS
+
+
+def scan_head_to_head(history, home, away, before=None):
+    record = {"home_wins": 0, "away_wins": 0, "draws": 0}
+    for m in history:
+        if {m.team_home, m.team_away} != {home, away}:
+            continue
+        if before is not None and m.match_date >= before:
+            continue
+        if m.home_score is None or m.away_score is None:
+            continue
+        if m.home_score == m.away_score:
+            record["draws"] += 1
+        elif (m.home_score > m.away_score) == (m.team_home == home):
+            record["home_wins"] += 1
+        else:
+            record["away_wins"] += 1
+    return record
+
+
+def scan_recent_points(history, team, is_home, conceded, games=5, before=None):
+    played = [
+        m for m in sorted(history, key=lambda m: m.match_date, reverse=True)
+        if (m.team_home if is_home else m.team_away) == team
+        and (before is None or m.match_date < before)
+    ]
+    points = []
+    for m in played:
+        home_side = is_home != conceded
+        score = m.home_score if home_side else m.away_score
+        if score is not None:
+            points.append(score)
+    return points[:games]
+
+
+@pytest.fixture
+def cutoffs():
+    rng = random.Random(3)
+    return [None] + [SEASON_START + timedelta(days=rng.randint(0, 8 * 365)) for _ in range(10)]
+
+
+def test_head_to_head_and_encounters_match_scan(history, cutoffs):
+    store = MatchHistoryStore(history)
+    rng = random.Random(2)
+    for _ in range(40):
+        home, away = rng.sample(TEAMS, 2)
+        for before in cutoffs:
+            assert store.head_to_head(home, away, before) == scan_head_to_head(history, home, away, before)
+            expected = [
+                m.match_id for m in sorted(history, key=lambda m: m.match_date, reverse=True)
+                if {m.team_home, m.team_away} == {home, away}
+                and (before is None or m.match_date < before)
+            ][:5]
+            assert [m.match_id for m in store.recent_encounters(home, away, 5, before)] == expected
+
+
+def test_recent_points_and_rest_match_scan(history, cutoffs):
+    store = MatchHistoryStore(history)
+    for team in TEAMS:
+        for before in cutoffs:
+            for is_home in (True, False):
+                for conceded in (True, False):
+                    assert list(store.recent_points(team, is_home, conceded, before=before)) == \
+                        scan_recent_points(history, team, is_home, conceded, before=before)
+            if before is not None:
+                earlier = [
+                    m.match_date for m in history
+                    if team in (m.team_home, m.team_away) and m.match_date < before
+                ]
+                assert store.last_match_date(team, before) == (max(earlier) if earlier else None)
+
+
+def test_unknown_team_has_no_history(history):
+    store = MatchHistoryStore(history)
+    assert store.head_to_head("Nobody", TEAMS[0]) == {"home_wins": 0, "away_wins": 0, "draws": 0}
+    assert store.recent_encounters("Nobody", TEAMS[0]) == []
+    assert len(store.recent_points("Nobody", True)) == 0
+    assert store.last_match_date("Nobody", SEASON_START) is None
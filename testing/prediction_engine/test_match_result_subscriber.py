@@ -0,0 +1,103 @@
+"""Result events update every worker's memory but refresh shared Redis once."""
+
+from datetime import datetime
+
+import pytest
+
+from shared.events.event_bus import EventType, MatchResultRecordedEvent
+
+from src.application.match_result_subscriber import MatchResultSubscriber
+from src.domain.prediction_models import (
+    MatchDetails, ModelType, PredictionResult, PredictionType, Winner
+)
+from src.infrastructure.elo_ratings import EloRatingEngine
+from src.infrastructure.prediction_cache import PredictionCache
+from src.infrastructure.repositories import CachedDataRepository
+
+from conftest import MemoryRedis, StaticStatsRepository
+
+
+STORM = MatchDetails("Melbourne Storm", "Penrith Panthers", datetime(2024, 5, 1))
+WINNER = PredictionType.MATCH_WINNER
+
+
+class GroupedBus:
+    """Delivers broadcast subscriptions to every worker and each group to one."""
+
+    def __init__(self):
+        self.subscriptions = []
+
+    async def subscribe(self, event_type, handler, consumer_group=None, broadcast=False):
+        self.subscriptions.append((event_type, handler, consumer_group, broadcast))
+
+    async def deliver(self, event):
+        served_groups = set()
+        for event_type, handler, group, broadcast in self.subscriptions:
+            if event_type != event.event_type:
+                continue
+            if not broadcast:
+                if group in served_groups:
+                    continue
+                served_groups.add(group)
+            await handler(event)
+
+
+def result_event(match_id: str = "r1") -> MatchResultRecordedEvent:
+    return MatchResultRecordedEvent(
+        event_id="",
+        event_type=EventType.MATCH_RESULT_RECORDED,
+        timestamp=None,
+        correlation_id=match_id,
+        source_service="test",
+        match_id=match_id,
+        team_home="Melbourne Storm",
+        team_away="Penrith Panthers",
+        match_date="2024-04-20T19:30:00",
+        home_score=24,
+        away_score=12
+    )
+
+
+@pytest.mark.asyncio
+async def test_one_worker_refreshes_redis_and_every_worker_updates_memory():
+    redis_client = MemoryRedis()
+    bus = GroupedBus()
+    workers = []
+    for _ in range(3):
+        cache = PredictionCache(redis_client)
+        await cache.set(STORM, WINNER, "v1", PredictionResult(
+            "", ModelType.LIGHTGBM, WINNER, STORM, Winner.HOME, {"home": 0.6, "away": 0.4}, 0.6
+        ))
+        subscriber = MatchResultSubscriber(
+            data_repository=CachedDataRepository(StaticStatsRepository(), redis_client),
+            prediction_cache=cache,
+            rating_engine=EloRatingEngine()
+        )
+        await subscriber.subscribe(bus)
+        workers.append(subscriber)
+    scans_before = redis_client.scans
+
+    await bus.deliver(result_event())
+
+    # Four data-key patterns and two prediction-key patterns per team, scanned once.
+    assert redis_client.scans - scans_before == 8
+    assert [worker.results_refreshed for worker in workers] == [1, 0, 0]
+    assert [worker.results_processed for worker in workers] == [1, 1, 1]
+    for worker in workers:
+        assert len(worker.rating_engine) == 1
+        assert worker.rating_engine.rating("Melbourne Storm") > 1500
+        assert not worker.prediction_cache._entries
+    assert not [key for key in redis_client.values if key.startswith("prediction:")]
+
+
+@pytest.mark.asyncio
+async def test_shared_refresh_applies_the_result_first_and_only_once():
+    subscriber = MatchResultSubscriber(rating_engine=EloRatingEngine())
+    event = result_event()
+
+    await subscriber.refresh_shared(event)
+    rating = subscriber.rating_engine.rating("Melbourne Storm")
+    await subscriber.apply_result(event)
+
+    assert len(subscriber.rating_engine) == 1
+    assert subscriber.rating_engine.rating("Melbourne Storm") == rating
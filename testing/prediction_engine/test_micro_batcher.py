@@ -0,0 +1,127 @@
+"""Micro-batching of single predictions: batching, backpressure and shutdown."""
+
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from src.application.micro_batcher import MicroBatchDispatcher, MicroBatchQueueFullError
+from src.domain.prediction_models import (
+    MatchDetails, ModelType, PredictionResult, PredictionType, Winner
+)
+
+
+def match(i: int) -> MatchDetails:
+    return MatchDetails(f"Home {i}", f"Away {i}", datetime(2024, 5, 1))
+
+
+class RecordingService:
+    """``predict_grouped`` stand-in that echoes each match back in a result.
+
+    Matches whose home team is in ``failing`` get an exception instead, and
+    every call waits for ``gate`` when one is set.
+    """
+
+    def __init__(self, failing=(), gate: asyncio.Event = None):
+        self.failing = set(failing)
+        self.gate = gate
+        self.batches = []
+
+    async def predict_grouped(self, matches, prediction_type, user_ids):
+        self.batches.append([m.team_home for m in matches])
+        if self.gate is not None:
+            await self.gate.wait()
+        return [
+            ValueError(m.team_home) if m.team_home in self.failing else PredictionResult(
+                "", ModelType.LOGISTIC_REGRESSION, prediction_type, m, Winner.HOME,
+                {"home": 0.6, "away": 0.4}, 0.6, model_metadata={"user_id": user_id}
+            )
+            for m, user_id in zip(matches, user_ids)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_batches_and_get_their_own_results():
+    service = RecordingService(failing={"Home 3"})
+    dispatcher = MicroBatchDispatcher(service, max_batch_size=4, max_wait_ms=20)
+    await dispatcher.start()
+
+    results = await asyncio.gather(
+        *(dispatcher.submit(match(i), user_id=f"user-{i}") for i in range(10)),
+        return_exceptions=True
+    )
+    await dispatcher.stop()
+
+    for i, result in enumerate(results):
+        if i == 3:
+            assert isinstance(result, ValueError) and str(result) == "Home 3"
+        else:
+            assert result.match_details == match(i)
+            assert result.model_metadata["user_id"] == f"user-{i}"
+    assert sorted(team for batch in service.batches for team in batch) == \
+        sorted(f"Home {i}" for i in range(10))
+    assert max(len(batch) for batch in service.batches) == 4
+    assert len(service.batches) < 10
+
+
+@pytest.mark.asyncio
+async def test_light_traffic_is_not_delayed_by_the_window():
+    dispatcher = MicroBatchDispatcher(RecordingService(), max_wait_ms=1000)
+    await dispatcher.start()
+
+    start = time.perf_counter()
+    await dispatcher.submit(match(0))
+    await dispatcher.submit(match(1))
+    elapsed = time.perf_counter() - start
+    await dispatcher.stop()
+
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_instead_of_waiting():
+    gate = asyncio.Event()
+    service = RecordingService(gate=gate)
+    dispatcher = MicroBatchDispatcher(
+        service, max_batch_size=1, max_queue_depth=2, max_concurrent_batches=1
+    )
+    await dispatcher.start()
+
+    # One request is dispatched and blocks; the collector then waits for a
+    # slot, so the next two requests fill the queue.
+    first = asyncio.create_task(dispatcher.submit(match(0)))
+    await asyncio.sleep(0.01)
+    waiting = [asyncio.create_task(dispatcher.submit(match(i))) for i in range(1, 3)]
+    await asyncio.sleep(0.01)
+
+    assert dispatcher.queue_depth == 2
+    with pytest.raises(MicroBatchQueueFullError):
+        await dispatcher.submit(match(3))
+
+    gate.set()
+    results = await asyncio.gather(first, *waiting)
+    await dispatcher.stop()
+
+    assert [result.match_details for result in results] == [match(i) for i in range(3)]
+    assert service.batches == [[f"Home {i}"] for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_stop_fails_queued_and_in_flight_requests():
+    service = RecordingService(gate=asyncio.Event())
+    dispatcher = MicroBatchDispatcher(service, max_batch_size=2, max_concurrent_batches=1)
+    await dispatcher.start()
+
+    requests = [asyncio.create_task(dispatcher.submit(match(i))) for i in range(5)]
+    await asyncio.sleep(0.05)
+    assert service.batches and dispatcher.queue_depth > 0
+
+    await dispatcher.stop()
+    results = await asyncio.wait_for(asyncio.gather(*requests, return_exceptions=True), 1)
+
+    assert all(
+        isinstance(result, RuntimeError) and "stopped" in str(result) for result in results
+    )
+    with pytest.raises(RuntimeError):
+        await dispatcher.submit(match(9))
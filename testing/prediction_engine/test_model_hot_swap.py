@@ -0,0 +1,103 @@
+"""Artifact reloads through the hot swapper."""
+
+import os
+
+import pytest
+
+from src.application.model_hot_swap import ModelHotSwapper
+
+
+def rewrite(path, content):
+    path.write_bytes(content)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+
+
+@pytest.mark.asyncio
+async def test_settled_change_is_swapped_with_new_artifact_version(tmp_path):
+    path = tmp_path / "model.joblib"
+    path.write_bytes(b"v1")
+    swapper = ModelHotSwapper(tmp_path)
+    swapped = []
+
+    async def validate(model):
+        pass
+
+    async def swap(model, version):
+        swapped.append((model, version))
+
+    swapper.watch("model.joblib", "lr", load=lambda p: p.read_bytes(), validate=validate, swap=swap)
+    deployed = swapper.artifact_version("model.joblib")
+
+    rewrite(path, b"v2-longer")
+    assert await swapper.check() == []
+    assert await swapper.check() == ["lr"]
+
+    [(model, version)] = swapped
+    assert model == b"v2-longer"
+    assert version not in (None, deployed)
+    assert swapper.artifact_version("model.joblib") == version
+
+
+@pytest.mark.asyncio
+async def test_rejected_artifact_keeps_the_deployed_version_and_is_not_retried(tmp_path):
+    path = tmp_path / "model.joblib"
+    path.write_bytes(b"v1")
+    swapper = ModelHotSwapper(tmp_path)
+    loads = []
+    swapped = []
+
+    def load(p):
+        loads.append(p.read_bytes())
+        return loads[-1]
+
+    async def validate(model):
+        if model == b"broken":
+            raise ValueError("canary failed")
+
+    async def swap(model, version):
+        swapped.append((model, version))
+
+    swapper.watch("model.joblib", "lr", load=load, validate=validate, swap=swap)
+    deployed = swapper.artifact_version("model.joblib")
+
+    rewrite(path, b"broken")
+    for _ in range(4):
+        assert await swapper.check() == []
+
+    assert loads == [b"broken"]
+    assert swapped == []
+    assert swapper.artifact_version("model.joblib") == deployed
+    assert swapper.statistics()["model.joblib"]["error"] == "canary failed"
+
+    rewrite(path, b"v2-fixed")
+    assert await swapper.check() == []
+    assert await swapper.check() == ["lr"]
+    assert loads == [b"broken", b"v2-fixed"]
+    assert swapped == [(b"v2-fixed", swapper.artifact_version("model.joblib"))]
+    assert "error" not in swapper.statistics()["model.joblib"]
+
+
+@pytest.mark.asyncio
+async def test_failed_swap_is_not_recorded_as_deployed(tmp_path):
+    path = tmp_path / "model.joblib"
+    path.write_bytes(b"v1")
+    swapper = ModelHotSwapper(tmp_path)
+    attempts = []
+
+    async def validate(model):
+        pass
+
+    async def swap(model, version):
+        attempts.append(version)
+        raise RuntimeError("worker restart failed")
+
+    swapper.watch("model.joblib", "lr", load=lambda p: p.read_bytes(), validate=validate, swap=swap)
+    deployed = swapper.artifact_version("model.joblib")
+
+    rewrite(path, b"v2-longer")
+    for _ in range(3):
+        assert await swapper.check() == []
+
+    assert len(attempts) == 1
+    assert swapper.artifact_version("model.joblib") == deployed
+    assert swapper.statistics()["model.joblib"]["version"] == 0
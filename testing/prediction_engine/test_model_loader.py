@@ -0,0 +1,42 @@
+"""Background model loading keeps the event loop free."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.application.model_loader import LazyModelLoader
+from src.application.model_readiness import ModelReadinessRegistry
+from src.domain.prediction_models import ModelType
+
+
+class BlockingWarmupModel:
+    """Model whose warm-up blocks its thread, like loading a large artifact."""
+
+    model_type = ModelType.LIGHTGBM
+    model_name = "blocking"
+
+    async def is_ready(self) -> bool:
+        time.sleep(0.2)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_warmup_runs_off_the_event_loop():
+    loader = LazyModelLoader(
+        {ModelType.LIGHTGBM: BlockingWarmupModel}, {}, ModelReadinessRegistry()
+    )
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    model = await loader.load(ModelType.LIGHTGBM)
+    task.cancel()
+
+    assert loader.readiness.ready_models() == (model,)
+    assert ticks >= 10
@@ -0,0 +1,52 @@
+"""Memory-mapped model artifacts and their cached copies."""
+
+import os
+
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+from src.infrastructure.model_store import MappedModelStore
+
+
+def fitted(estimator, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(200, 4))
+    return estimator.fit(X, (X[:, 0] + X[:, 1] > 0).astype(int)), X
+
+
+def test_new_artifact_version_replaces_cached_copy(tmp_path):
+    store = MappedModelStore(tmp_path / "cache")
+    path = tmp_path / "model.joblib"
+    joblib.dump({"pipeline": fitted(LogisticRegression())[0]}, path)
+    first = store.load(path)
+
+    joblib.dump({"pipeline": fitted(LogisticRegression(C=0.1))[0]}, path)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    second = store.load(path)
+
+    assert second is not first
+    assert [p.name for p in (tmp_path / "cache").iterdir()] == \
+        [os.path.basename(store.statistics()["artifacts"][str(path.resolve())]["mapped_file"])]
+
+
+def test_tree_artifact_loads_as_mapped_forest(tmp_path):
+    store = MappedModelStore(tmp_path / "cache")
+    path = tmp_path / "forest.joblib"
+    model, X = fitted(RandomForestClassifier(n_estimators=5, random_state=0))
+    joblib.dump({"model": model}, path)
+
+    forest = store.load_forest(path)
+
+    assert isinstance(forest.threshold, np.memmap)
+    np.testing.assert_allclose(forest.predict_proba(X), model.predict_proba(X), atol=1e-12)
+    assert store.load_forest(path) is forest
+
+
+def test_non_tree_artifact_has_no_forest(tmp_path):
+    store = MappedModelStore(tmp_path / "cache")
+    path = tmp_path / "model.joblib"
+    joblib.dump(fitted(LogisticRegression())[0], path)
+
+    assert store.load_forest(path) is None
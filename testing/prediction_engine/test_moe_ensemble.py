@@ -0,0 +1,90 @@
+"""Ensemble blending under a deadline when experts run on executor lanes."""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from src.application.inference_executor import ExecutionMode, InferenceExecutor
+from src.application.moe_router import MixtureOfExpertsRouter, RoutingStrategy
+from src.domain.prediction_models import (
+    MatchDetails, ModelMetrics, ModelType, PredictionModel, PredictionResult, PredictionType, Winner
+)
+
+
+MATCH = MatchDetails("Melbourne Storm", "Penrith Panthers", datetime(2024, 5, 1))
+
+
+class SleepyModel(PredictionModel):
+    """Expert that blocks its worker thread for ``delay`` seconds per call."""
+
+    def __init__(self, model_type: ModelType, delay: float):
+        self._model_type = model_type
+        self.delay = delay
+        self.calls = 0
+
+    model_type = property(lambda self: self._model_type)
+    model_name = property(lambda self: self._model_type.value)
+    model_version = property(lambda self: "test")
+    supported_prediction_types = property(lambda self: [PredictionType.MATCH_WINNER])
+
+    async def is_ready(self) -> bool:
+        return True
+
+    async def predict(self, match_details, prediction_type=PredictionType.MATCH_WINNER):
+        self.calls += 1
+        time.sleep(self.delay)
+        return PredictionResult(
+            "", self._model_type, prediction_type, match_details, Winner.HOME,
+            {"home": 0.6, "away": 0.4}, 0.6
+        )
+
+    async def predict_batch(self, matches, prediction_type=PredictionType.MATCH_WINNER):
+        return [await self.predict(match, prediction_type) for match in matches]
+
+    async def get_feature_importance(self):
+        return {}
+
+    async def get_model_metrics(self):
+        return ModelMetrics(self._model_type, 0.0, {}, {}, {})
+
+
+def router(**kwargs) -> MixtureOfExpertsRouter:
+    executor = InferenceExecutor(
+        ExecutionMode.THREAD,
+        offload_models=[ModelType.LIGHTGBM, ModelType.TRANSFORMER],
+        workers=1
+    )
+    return MixtureOfExpertsRouter(
+        RoutingStrategy.ENSEMBLE_WEIGHTED, inference_executor=executor, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_busy_lane_is_shed_instead_of_queued():
+    moe = router(ensemble_deadline_ms=50)
+    fast = SleepyModel(ModelType.LOGISTIC_REGRESSION, 0.0)
+    slow = SleepyModel(ModelType.TRANSFORMER, 0.3)
+
+    [(first, _, _)] = await moe.predict_ensemble([MATCH], [fast, slow])
+    [(second, _, metadata)] = await moe.predict_ensemble([MATCH], [fast, slow])
+
+    assert first.model_metadata["ensemble"]["dropped"] == {"transformer": "deadline"}
+    assert second.model_metadata["ensemble"]["dropped"] == {"transformer": "busy"}
+    assert metadata["ensemble_experts"] == ["logistic_regression"]
+    assert slow.calls == 1
+    await moe.inference_executor.stop()
+
+
+@pytest.mark.asyncio
+async def test_fallback_wait_is_bounded():
+    moe = router(ensemble_deadline_ms=20, ensemble_fallback_ms=50)
+    experts = [SleepyModel(ModelType.LIGHTGBM, 0.5), SleepyModel(ModelType.TRANSFORMER, 0.5)]
+
+    start = time.perf_counter()
+    [(outcome, confidence, _)] = await moe.predict_ensemble([MATCH], experts)
+
+    assert time.perf_counter() - start < 0.3
+    assert isinstance(outcome, RuntimeError)
+    assert confidence == 0.0
+    await moe.inference_executor.stop()
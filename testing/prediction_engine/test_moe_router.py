@@ -0,0 +1,149 @@
+"""Gating-network routing and memoised routing decisions."""
+
+from dataclasses import replace
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.application.moe_router import (
+    GATING_EXPERTS, GATING_FEATURES, GatingNetworkRouter, MixtureOfExpertsRouter,
+    PerformanceBasedRouter, RoutingContext, RoutingStrategy, gating_features
+)
+from src.domain.prediction_models import MatchDetails, ModelType
+
+
+MATCH = MatchDetails("Melbourne Storm", "Penrith Panthers", datetime(2024, 5, 1))
+
+
+def context(rivalry: float, stage: str = "mid_season") -> RoutingContext:
+    return RoutingContext(MATCH, team_rivalry_score=rivalry, season_stage=stage)
+
+
+def logged_routing(n: int = 200, seed: int = 3):
+    """Contexts where LightGBM wins rivalries and the transformer wins the rest."""
+    rng = np.random.default_rng(seed)
+    contexts = [context(float(rivalry)) for rivalry in rng.uniform(0, 1, n)]
+    rewards = np.zeros((n, len(GATING_EXPERTS)))
+    for row, ctx in enumerate(contexts):
+        winner = ModelType.LIGHTGBM if ctx.team_rivalry_score > 0.5 else ModelType.TRANSFORMER
+        rewards[row, GATING_EXPERTS.index(winner)] = 1.0
+    return contexts, rewards
+
+
+@pytest.mark.asyncio
+async def test_fitted_gate_routes_to_the_expert_that_did_best():
+    contexts, rewards = logged_routing()
+    gate = GatingNetworkRouter()
+    untrained = await gate.route_batch([context(0.9), context(0.1)], list(GATING_EXPERTS))
+
+    loss = gate.fit(gating_features(contexts), rewards)
+    decisions = await gate.route_batch([context(0.9), context(0.1)], list(GATING_EXPERTS))
+
+    assert {model for model, _ in untrained} == {ModelType.REINFORCEMENT_LEARNING}
+    assert [model for model, _ in decisions] == [ModelType.LIGHTGBM, ModelType.TRANSFORMER]
+    assert all(0.5 < confidence <= 1.0 for _, confidence in decisions)
+    assert loss < np.log(len(GATING_EXPERTS))
+    assert gate.version == 1
+
+    # Unavailable experts are masked out of the softmax.
+    [(model, confidence)] = await gate.route_batch(
+        [context(0.9)], [ModelType.TRANSFORMER, ModelType.STACKER]
+    )
+    probabilities = gate.probabilities(
+        gating_features([context(0.9)]), [ModelType.TRANSFORMER, ModelType.STACKER]
+    )
+    assert model in (ModelType.TRANSFORMER, ModelType.STACKER)
+    assert probabilities.sum() == pytest.approx(1.0)
+    assert np.count_nonzero(probabilities) == 2
+
+
+def test_saved_gate_loads_with_identical_routing(tmp_path):
+    contexts, rewards = logged_routing()
+    gate = GatingNetworkRouter()
+    gate.fit(gating_features(contexts), rewards, epochs=50)
+    path = tmp_path / "gate.npz"
+
+    gate.save(str(path))
+    loaded = GatingNetworkRouter.load(str(path))
+
+    features = gating_features(contexts)
+    assert loaded.experts == gate.experts
+    np.testing.assert_array_equal(loaded.probabilities(features), gate.probabilities(features))
+
+
+def test_gate_with_a_different_feature_set_is_rejected(tmp_path):
+    path = tmp_path / "gate.npz"
+    np.savez(
+        path,
+        weights=np.zeros((len(GATING_FEATURES), len(GATING_EXPERTS))),
+        bias=np.zeros(len(GATING_EXPERTS)),
+        experts=np.array([model.value for model in GATING_EXPERTS]),
+        features=np.array(GATING_FEATURES[:-1] + ("has_weather",))
+    )
+
+    with pytest.raises(ValueError):
+        GatingNetworkRouter.load(str(path))
+
+
+async def route_twice(moe: MixtureOfExpertsRouter):
+    """Route ``MATCH`` twice and return the two cache-hit flags."""
+    models = [SimpleNamespace(model_type=model) for model in GATING_EXPERTS]
+    [(_, _, first)] = await moe.route_batch([MATCH], models)
+    [(_, _, second)] = await moe.route_batch([MATCH], models)
+    return first["routing_cache_hit"], second["routing_cache_hit"]
+
+
+@pytest.mark.asyncio
+async def test_routing_memo_drops_decisions_when_performance_history_changes():
+    moe = MixtureOfExpertsRouter(strategy=RoutingStrategy.PERFORMANCE_BASED)
+    models = [SimpleNamespace(model_type=model) for model in GATING_EXPERTS]
+    assert await route_twice(moe) == (False, True)
+    [(before, _, _)] = await moe.route_batch([MATCH], models)
+
+    router = moe.routers[RoutingStrategy.PERFORMANCE_BASED]
+    lagging = min(router.performance_history.values(), key=lambda h: h.recent_accuracy)
+    router.update_performance(replace(lagging, recent_accuracy=5.0))
+    [(after, _, metadata)] = await moe.route_batch([MATCH], models)
+
+    assert before.model_type != lagging.model_type
+    assert after.model_type == lagging.model_type
+    assert not metadata["routing_cache_hit"]
+    assert moe.routing_cache.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_routing_memo_drops_decisions_when_the_strategy_changes():
+    moe = MixtureOfExpertsRouter(strategy=RoutingStrategy.PERFORMANCE_BASED)
+    assert await route_twice(moe) == (False, True)
+
+    moe.strategy = RoutingStrategy.RULE_BASED
+    assert await route_twice(moe) == (False, True)
+
+    moe.strategy = RoutingStrategy.PERFORMANCE_BASED
+    assert await route_twice(moe) == (False, True)
+
+
+@pytest.mark.asyncio
+async def test_routing_memo_drops_decisions_when_the_router_is_replaced():
+    moe = MixtureOfExpertsRouter(strategy=RoutingStrategy.GATING_NETWORK)
+    assert await route_twice(moe) == (False, True)
+
+    # Replace the gate twice between requests: the original gate is freed by
+    # the first swap, so the last one may be allocated at its address.
+    for _ in range(2):
+        moe.routers[RoutingStrategy.GATING_NETWORK] = GatingNetworkRouter()
+
+    assert await route_twice(moe) == (False, True)
+
+
+@pytest.mark.parametrize("stage, bonus", [
+    ("mid_season", 0.0), ("finals", -0.05), ("grand_final", -0.05)
+])
+def test_playoff_bonus_applies_to_the_stages_routing_produces(stage, bonus):
+    router = PerformanceBasedRouter()
+    lightgbm = router.performance_history[ModelType.LIGHTGBM]
+
+    assert "playoffs" in lightgbm.weak_scenarios
+    assert router._calculate_scenario_bonus(context(0.0, stage), lightgbm) == bonus
@@ -0,0 +1,74 @@
+"""Online performance tracking from prediction and result events."""
+
+from datetime import datetime
+
+import pytest
+
+from src.application.performance_tracker import OnlinePerformanceTracker
+from src.domain.prediction_models import ModelType
+
+
+PROBABILITIES = {"home": 0.7, "away": 0.25, "draw": 0.05}
+STORM, PANTHERS = "Melbourne Storm", "Penrith Panthers"
+KICK_OFF = datetime(2024, 4, 20, 19, 30)
+
+
+def predict(tracker, prediction_id, model=ModelType.LIGHTGBM, probabilities=PROBABILITIES,
+            match_date=KICK_OFF):
+    tracker.record_prediction(
+        prediction_id, model, probabilities, STORM, PANTHERS, match_date, {}
+    )
+
+
+def test_redelivered_prediction_is_scored_once():
+    tracker = OnlinePerformanceTracker()
+    for _ in range(2):
+        predict(tracker, "p1")
+
+    assert tracker.statistics()["pending_predictions"] == 1
+    assert tracker.record_fixture_result(STORM, PANTHERS, KICK_OFF.isoformat(), 24, 12) == 1
+    assert tracker.model_statistics(ModelType.LIGHTGBM)["outcomes"] == 1
+    assert tracker.statistics()["pending_predictions"] == 0
+
+
+def test_each_model_is_scored_once_per_fixture():
+    tracker = OnlinePerformanceTracker()
+    predict(tracker, "p1", probabilities={"home": 0.2, "away": 0.7, "draw": 0.1})
+    predict(tracker, "p2")
+    predict(tracker, "p3", model=ModelType.TRANSFORMER)
+
+    # The result event carries its own kick-off time; the day identifies the fixture.
+    assert tracker.record_fixture_result(STORM, PANTHERS, "2024-04-20T18:00:00", 24, 12) == 2
+
+    lightgbm = tracker.model_statistics(ModelType.LIGHTGBM)
+    assert lightgbm["outcomes"] == 1
+    assert lightgbm["recent_accuracy"] == 1.0
+    assert lightgbm["brier_score"] == pytest.approx(0.3 ** 2 + 0.25 ** 2 + 0.05 ** 2)
+    assert tracker.model_statistics(ModelType.TRANSFORMER)["outcomes"] == 1
+    assert tracker.statistics()["pending_predictions"] == 0
+
+    # A prediction served after the model was scored on the fixture is ignored.
+    predict(tracker, "p4")
+    assert tracker.statistics()["pending_predictions"] == 0
+
+
+def test_feedback_then_fixture_result_scores_the_model_once():
+    tracker = OnlinePerformanceTracker()
+    for prediction_id in ("p1", "p2"):
+        predict(tracker, prediction_id)
+
+    assert tracker.record_outcome("p1", STORM)
+    assert not tracker.record_outcome("p2", STORM)
+    assert tracker.record_fixture_result(STORM, PANTHERS, KICK_OFF, 24, 12) == 0
+    assert tracker.model_statistics(ModelType.LIGHTGBM)["outcomes"] == 1
+
+
+def test_results_only_score_predictions_for_the_same_match_day():
+    tracker = OnlinePerformanceTracker()
+    predict(tracker, "round-7")
+    predict(tracker, "round-20", match_date=datetime(2024, 7, 27, 17, 30))
+
+    assert tracker.record_fixture_result(STORM, PANTHERS, KICK_OFF, 24, 12) == 1
+    assert tracker.statistics()["pending_predictions"] == 1
+    assert tracker.record_outcome("round-20", "away")
+    assert tracker.model_statistics(ModelType.LIGHTGBM)["outcomes"] == 2
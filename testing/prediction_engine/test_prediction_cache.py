@@ -0,0 +1,130 @@
+"""Two-tier prediction cache: hits, expiry, LRU bound, odds and invalidation."""
+
+import asyncio
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from src.domain.prediction_models import (
+    MatchDetails, ModelType, PredictionResult, PredictionType, Winner
+)
+from src.infrastructure.prediction_cache import PredictionCache
+
+from conftest import MemoryRedis
+
+
+STORM = MatchDetails("Melbourne Storm", "Penrith Panthers", datetime(2024, 5, 1), odds_home=1.8)
+BRONCOS = MatchDetails("Brisbane Broncos", "Melbourne Storm", datetime(2024, 5, 8))
+EELS = MatchDetails("Parramatta Eels", "Sydney Roosters", datetime(2024, 5, 8))
+WINNER = PredictionType.MATCH_WINNER
+
+
+def result(match: MatchDetails) -> PredictionResult:
+    return PredictionResult(
+        "original", ModelType.LIGHTGBM, WINNER, match, Winner.HOME,
+        {"home": 0.6, "away": 0.4}, 0.6, model_metadata={"moe_routing": {"strategy": "test"}}
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_redis", [False, True])
+async def test_hit_returns_a_fresh_copy_and_miss_returns_none(with_redis):
+    cache = PredictionCache(MemoryRedis() if with_redis else None)
+
+    assert await cache.get(STORM, WINNER, "v1") is None
+    await cache.set(STORM, WINNER, "v1", result(STORM))
+    cached = await cache.get(STORM, WINNER, "v1")
+
+    assert cached.prediction_id != "original"
+    assert cached.model_metadata["prediction_cache"] == {"hit": True, "tier": "memory"}
+    assert await cache.get(STORM, WINNER, "v2") is None
+    assert await cache.get(STORM, WINNER, "v1", ModelType.TRANSFORMER) is None
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_refills_memory():
+    redis_client = MemoryRedis()
+    await PredictionCache(redis_client, ttl_seconds=60).set(STORM, WINNER, "v1", result(STORM))
+    assert list(redis_client.ttls.values()) == [60]
+
+    cache = PredictionCache(redis_client)
+    first = await cache.get(STORM, WINNER, "v1")
+    second = await cache.get(STORM, WINNER, "v1")
+
+    assert first.model_metadata["prediction_cache"]["tier"] == "redis"
+    assert second.model_metadata["prediction_cache"]["tier"] == "memory"
+    assert first.probabilities == result(STORM).probabilities
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_the_ttl():
+    cache = PredictionCache(ttl_seconds=0.02)
+    await cache.set(STORM, WINNER, "v1", result(STORM))
+    assert await cache.get(STORM, WINNER, "v1") is not None
+
+    await asyncio.sleep(0.03)
+    assert await cache.get(STORM, WINNER, "v1") is None
+    assert not cache._entries
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted():
+    cache = PredictionCache(max_entries=2)
+    await cache.set(STORM, WINNER, "v1", result(STORM))
+    await cache.set(BRONCOS, WINNER, "v1", result(BRONCOS))
+    await cache.get(STORM, WINNER, "v1")
+    await cache.set(EELS, WINNER, "v1", result(EELS))
+
+    assert await cache.get(BRONCOS, WINNER, "v1") is None
+    assert await cache.get(STORM, WINNER, "v1") is not None
+    assert await cache.get(EELS, WINNER, "v1") is not None
+
+
+@pytest.mark.asyncio
+async def test_changed_odds_miss_without_invalidating_on_read():
+    redis_client = MemoryRedis()
+    cache = PredictionCache(redis_client)
+    moved = replace(STORM, odds_home=2.1)
+    await cache.set(STORM, WINNER, "v1", result(STORM))
+
+    # Alternating prices each get their own entry; reads never scan or delete.
+    assert await cache.get(moved, WINNER, "v1") is None
+    await cache.set(moved, WINNER, "v1", result(moved))
+    for _ in range(3):
+        assert (await cache.get(STORM, WINNER, "v1")).match_details.odds_home == 1.8
+        assert (await cache.get(moved, WINNER, "v1")).match_details.odds_home == 2.1
+
+    assert redis_client.scans == 0
+    assert len(redis_client.values) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_team_drops_only_its_matches():
+    redis_client = MemoryRedis()
+    cache = PredictionCache(redis_client)
+    for match in (STORM, BRONCOS, EELS):
+        await cache.set(match, WINNER, "v1", result(match))
+
+    await cache.invalidate_team("Melbourne Storm")
+
+    assert [key.split(":")[1] for key in redis_client.values] == [EELS.match_id]
+    assert await cache.get(STORM, WINNER, "v1") is None
+    assert await cache.get(BRONCOS, WINNER, "v1") is None
+    assert await cache.get(EELS, WINNER, "v1") is not None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_match_drops_every_variant():
+    redis_client = MemoryRedis()
+    cache = PredictionCache(redis_client)
+    await cache.set(STORM, WINNER, "v1", result(STORM))
+    await cache.set(STORM, WINNER, "v1", result(STORM), ModelType.TRANSFORMER)
+    await cache.set(EELS, WINNER, "v1", result(EELS))
+
+    await cache.invalidate_match(STORM.match_id)
+
+    assert await cache.get(STORM, WINNER, "v1") is None
+    assert await cache.get(STORM, WINNER, "v1", ModelType.TRANSFORMER) is None
+    assert len(redis_client.values) == 1
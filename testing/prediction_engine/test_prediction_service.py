@@ -0,0 +1,135 @@
+"""Grouped batch prediction: one call per routed model, failures kept per match."""
+
+from datetime import datetime
+
+import pytest
+
+prediction_service = pytest.importorskip("src.application.prediction_service")
+
+from src.application.inference_executor import InferenceQueueFullError
+from src.domain.prediction_models import (
+    MatchDetails, ModelMetrics, ModelType, PredictionModel, PredictionResult, PredictionType, Winner
+)
+
+
+MATCHES = [
+    MatchDetails("Melbourne Storm", "Penrith Panthers", datetime(2024, 5, 1)),
+    MatchDetails("Brisbane Broncos", "Sydney Roosters", datetime(2024, 5, 2)),
+    MatchDetails("Canberra Raiders", "Parramatta Eels", datetime(2024, 5, 3)),
+    MatchDetails("Cronulla Sharks", "Newcastle Knights", datetime(2024, 5, 4)),
+]
+
+
+class CountingModel(PredictionModel):
+    """Expert that records its calls and can fail its batched call."""
+
+    def __init__(self, model_type: ModelType, batch_error: Exception = None):
+        self._model_type = model_type
+        self.batch_error = batch_error
+        self.batches = []
+        self.singles = 0
+
+    model_type = property(lambda self: self._model_type)
+    model_name = property(lambda self: self._model_type.value)
+    model_version = property(lambda self: "test")
+    supported_prediction_types = property(lambda self: [PredictionType.MATCH_WINNER])
+
+    async def is_ready(self) -> bool:
+        return True
+
+    async def predict(self, match_details, prediction_type=PredictionType.MATCH_WINNER):
+        self.singles += 1
+        return PredictionResult(
+            "", self._model_type, prediction_type, match_details, Winner.HOME,
+            {"home": 0.6, "away": 0.4}, 0.6
+        )
+
+    async def predict_batch(self, matches, prediction_type=PredictionType.MATCH_WINNER):
+        self.batches.append(len(matches))
+        if self.batch_error is not None:
+            raise self.batch_error
+        return [
+            PredictionResult(
+                "", self._model_type, prediction_type, match, Winner.AWAY,
+                {"home": 0.3, "away": 0.7}, 0.7
+            )
+            for match in matches
+        ]
+
+    async def get_feature_importance(self):
+        return {}
+
+    async def get_model_metrics(self):
+        return ModelMetrics(self._model_type, 0.0, {}, {}, {})
+
+
+def service_with(models, routes):
+    """A service serving ``models``, routing match ``i`` to ``routes[i]``."""
+    service = prediction_service.PredictionService()
+    for model in models:
+        service.readiness.register(model)
+        service.readiness.mark(model.model_type, True)
+    by_type = {model.model_type: model for model in models}
+
+    async def get_available_models():
+        return list(models)
+
+    async def route_batch(matches, available_models, prediction_type):
+        return [
+            (by_type[routes[MATCHES.index(match)]], 0.9, {"strategy": "test"})
+            for match in matches
+        ]
+
+    service.get_available_models = get_available_models
+    service.moe_router.route_batch = route_batch
+    return service
+
+
+@pytest.mark.asyncio
+async def test_matches_are_grouped_into_one_batch_per_model():
+    lr = CountingModel(ModelType.LOGISTIC_REGRESSION)
+    lgbm = CountingModel(ModelType.LIGHTGBM)
+    routes = [ModelType.LOGISTIC_REGRESSION, ModelType.LIGHTGBM] * 2
+    service = service_with([lr, lgbm], routes)
+
+    results = await service.predict_grouped(MATCHES, PredictionType.MATCH_WINNER, [None] * 4)
+
+    assert lr.batches == [2] and lgbm.batches == [2]
+    assert [result.match_details for result in results] == MATCHES
+    assert [result.model_type for result in results] == routes
+    assert results[0].model_metadata["moe_routing"]["batch_sizes"] == {
+        "logistic_regression": 2, "lightgbm": 2
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_single_predictions():
+    lr = CountingModel(ModelType.LOGISTIC_REGRESSION, batch_error=RuntimeError("boom"))
+    service = service_with([lr], [ModelType.LOGISTIC_REGRESSION] * 4)
+
+    results = await service.predict_grouped(MATCHES, PredictionType.MATCH_WINNER, [None] * 4)
+
+    assert lr.batches == [4] and lr.singles == 4
+    assert all(isinstance(result, PredictionResult) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_fails_only_its_group():
+    full = InferenceQueueFullError("lightgbm queue is full")
+    lr = CountingModel(ModelType.LOGISTIC_REGRESSION)
+    lgbm = CountingModel(ModelType.LIGHTGBM, batch_error=full)
+    routes = [ModelType.LOGISTIC_REGRESSION, ModelType.LIGHTGBM] * 2
+    service = service_with([lr, lgbm], routes)
+
+    results = await service.predict_grouped(MATCHES, PredictionType.MATCH_WINNER, [None] * 4)
+
+    assert [isinstance(result, PredictionResult) for result in results] == [True, False] * 2
+    assert results[1] is full and results[3] is full
+    assert lgbm.singles == 0
+
+    served = await service.predict_batch(MATCHES)
+    assert len(served) == 2
+
+    lr.batch_error = full
+    with pytest.raises(InferenceQueueFullError):
+        await service.predict_batch(MATCHES)
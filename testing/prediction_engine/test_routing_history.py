@@ -0,0 +1,79 @@
+"""Routing history ring buffer, latency histogram and running statistics."""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.application.routing_history import LatencyHistogram, RoutingHistory
+from src.domain.prediction_models import ModelType
+
+
+MODELS = [ModelType.LIGHTGBM, ModelType.TRANSFORMER, ModelType.STACKER]
+
+
+def test_ring_buffer_wraps_and_keeps_the_latest_decisions():
+    history = RoutingHistory(capacity=10, recent_window=4)
+    rng = np.random.default_rng(0)
+    decisions = [
+        (f"m{i}", MODELS[i % 3], float(rng.uniform(0.5, 1.0)), "test" if i % 2 else "other")
+        for i in range(25)
+    ]
+    for i, (match_id, model, confidence, strategy) in enumerate(decisions):
+        history.record(match_id, model, confidence, strategy, timestamp=1_700_000_000 + i)
+
+    assert len(history) == 10 and history.total == 25
+    recent = history.recent(limit=50)
+    assert [entry["match_id"] for entry in recent] == [d[0] for d in decisions[-10:]]
+    assert [entry["selected_model"] for entry in recent] == [d[1].value for d in decisions[-10:]]
+    assert [entry["strategy"] for entry in recent] == [d[3] for d in decisions[-10:]]
+
+    statistics = history.statistics()
+    window = decisions[-4:]
+    assert statistics["recent_model_usage"] == {
+        model.value: sum(d[1] == model for d in window)
+        for model in MODELS if any(d[1] == model for d in window)
+    }
+    assert statistics["model_usage"] == {model.value: sum(d[1] == model for d in decisions)
+                                         for model in MODELS}
+    assert statistics["average_routing_confidence"] == pytest.approx(
+        np.mean([d[2] for d in window]), rel=1e-6
+    )
+    assert statistics["history_size"] == 10
+
+
+def test_ewma_follows_the_recurrence():
+    history = RoutingHistory(ewma_alpha=0.2)
+    confidences = [0.9, 0.5, 0.7, 0.6, 1.0]
+    expected = confidences[0]
+    for confidence in confidences:
+        history.record("m", ModelType.LIGHTGBM, confidence, "test")
+    for confidence in confidences[1:]:
+        expected += 0.2 * (confidence - expected)
+
+    assert history.statistics()["ewma_routing_confidence"] == pytest.approx(expected)
+
+
+def test_histogram_quantiles_are_within_one_bucket():
+    histogram = LatencyHistogram(buckets_per_doubling=16)
+    values = np.random.default_rng(1).lognormal(mean=1.0, sigma=1.5, size=20_000)
+    for value in values:
+        histogram.record(float(value))
+
+    ordered = np.sort(values)
+    qs = (0.5, 0.9, 0.99, 0.999)
+    for q, estimate in zip(qs, histogram.quantiles(*qs)):
+        exact = ordered[max(1, math.ceil(q * len(values))) - 1]
+        assert exact <= estimate <= exact * 2 ** (1 / 16) * (1 + 1e-9)
+    assert histogram.quantiles(1.0) == [pytest.approx(values.max())]
+
+
+def test_histogram_clamps_out_of_range_values():
+    histogram = LatencyHistogram(min_ms=0.01, max_ms=100.0)
+    for value in (0.0, 0.005, 500.0):
+        histogram.record(value)
+
+    assert histogram.count == 3
+    assert histogram.quantiles(0.5)[0] == pytest.approx(0.01)
+    assert histogram.quantiles(1.0)[0] == 500.0
+    assert LatencyHistogram().quantiles(0.5) == [None]
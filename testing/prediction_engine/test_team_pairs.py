@@ -0,0 +1,67 @@
+"""Head-to-head counts, team growth and memory-mapped persistence."""
+
+from datetime import datetime
+
+import numpy as np
+
+from src.domain.models import Match
+from src.infrastructure.team_pairs import TeamPairMatrix
+
+from conftest import TEAMS, make_history
+
+
+DATE = datetime(2024, 5, 1)
+
+
+def test_results_are_counted_once_per_match_id():
+    pairs = TeamPairMatrix(TEAMS)
+    pairs.record_result(TEAMS[0], TEAMS[1], 24, 12, DATE, "r1")
+    pairs.record_result(TEAMS[0], TEAMS[1], 24, 12, DATE, "r1")
+    pairs.record_result(TEAMS[0], TEAMS[1], 10, 10, DATE, "r2")
+    pairs.record_result(TEAMS[1], TEAMS[0], 30, 6, DATE, "r3")
+    pairs.replay([Match("r4", TEAMS[0], TEAMS[1], DATE)])
+
+    assert pairs.head_to_head_matches(TEAMS[0], TEAMS[1]) == 3
+    assert pairs.head_to_head_matches(TEAMS[1], TEAMS[0]) == 3
+    # Hosting: one win and one draw in two games; the reverse fixture a home win.
+    assert pairs.venue_advantage(TEAMS[0], TEAMS[1]) == 0.5
+    assert pairs.venue_advantage(TEAMS[1], TEAMS[0]) == 1.0
+    assert pairs.venue_advantage(TEAMS[2], TEAMS[3]) == 0.0
+
+
+def test_unknown_clubs_grow_the_matrices():
+    pairs = TeamPairMatrix(TEAMS[:2])
+    pairs.record_result(TEAMS[0], TEAMS[1], 24, 12, DATE, "r1")
+    n_teams = len(pairs.games)
+
+    assert pairs.head_to_head_matches("Expansion Club", TEAMS[0]) == 0
+    pairs.record_result("Expansion Club", TEAMS[0], 18, 20, DATE, "r2")
+
+    assert pairs.games.shape == (n_teams + 1, n_teams + 1)
+    assert pairs.rivalry_factors.shape == (n_teams + 1, n_teams + 1)
+    assert pairs.head_to_head_matches(TEAMS[0], TEAMS[1]) == 1
+    assert pairs.venue_advantage("Expansion Club", TEAMS[0]) == -1.0
+    assert pairs.rivalry_factor("Expansion Club", TEAMS[1]) == 1.0
+    assert pairs.rivalry_score("Expansion Club", TEAMS[1]) == 0.0
+
+
+def test_saved_matrix_maps_back_copy_on_write(tmp_path):
+    history = make_history(300)
+    pairs = TeamPairMatrix(TEAMS)
+    pairs.replay(history)
+    pairs.save(tmp_path)
+
+    loaded = TeamPairMatrix.load(tmp_path)
+
+    assert isinstance(loaded.games, np.memmap)
+    for name in ("games", "home_wins", "draws", "rivalry_scores", "rivalry_factors"):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(pairs, name))
+
+    # Replaying the saved history is a no-op, and new results stay private.
+    loaded.replay(history)
+    np.testing.assert_array_equal(loaded.games, pairs.games)
+    loaded.record_result(TEAMS[0], TEAMS[1], 24, 12, DATE, "new")
+    assert loaded.head_to_head_matches(TEAMS[0], TEAMS[1]) == (
+        pairs.head_to_head_matches(TEAMS[0], TEAMS[1]) + 1
+    )
+    np.testing.assert_array_equal(np.load(tmp_path / "games.npy"), pairs.games)
@@ -0,0 +1,55 @@
+"""Padding in the CPU transformer runner never changes a sequence's output."""
+
+from typing import Optional
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+from torch import nn  # noqa: E402
+
+from src.modules.transformer.cpu_runner import CpuTransformerRunner  # noqa: E402
+
+
+FEATURES = 6
+
+
+class MaskedEncoder(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.embed = nn.Linear(FEATURES, 16)
+        layer = nn.TransformerEncoderLayer(16, 2, dim_feedforward=32, dropout=0.0, batch_first=True)
+        self.encoder = nn.TransformerEncoder(layer, 1)
+        self.head = nn.Linear(16, 3)
+
+    def forward(self, x: torch.Tensor, src_key_padding_mask: Optional[torch.Tensor] = None):
+        return self.head(self.encoder(self.embed(x), src_key_padding_mask=src_key_padding_mask)[:, -1])
+
+
+class UnmaskedEncoder(MaskedEncoder):
+    def forward(self, x: torch.Tensor):
+        return super().forward(x)
+
+
+def sequences(lengths, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.normal(size=(length, FEATURES)).astype(np.float32) for length in lengths]
+
+
+@pytest.mark.parametrize("model_class", [MaskedEncoder, UnmaskedEncoder])
+@pytest.mark.parametrize("trace", [True, False])
+def test_outputs_match_unpadded_model(model_class, trace):
+    torch.manual_seed(0)
+    model = model_class().eval()
+    inputs = sequences([3, 5, 7, 12, 30, 30, 64])
+    with torch.no_grad():
+        expected = np.stack([
+            torch.softmax(model(torch.from_numpy(sequence)[None]), dim=-1)[0].numpy()
+            for sequence in inputs
+        ])
+
+    runner = CpuTransformerRunner(model, quantize=False, trace=trace)
+
+    assert runner.padding_mask == (model_class is MaskedEncoder)
+    np.testing.assert_allclose(runner.predict_proba(inputs), expected, atol=1e-5)
+    np.testing.assert_allclose(runner.predict_proba(inputs[1:2]), expected[1:2], atol=1e-5)